@@ -0,0 +1,59 @@
+"""Measure the per-request cost of building queries and transactions.
+
+Most cases build a fresh builder chain from a `LedgerSelected`, the way a
+request handler would, and optionally render it to an `httpx.Request`. The
+last one renders the same builder again, as a polling loop would. No network
+traffic is involved.
+
+Usage:
+    uv run python benchmarks/bench_builders.py [--repeat 100000]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fluree_py import FlureeClient
+
+CONTEXT = {"ex": "http://example.org/", "schema": "http://schema.org/"}
+WHERE = [{"@id": "?s", "schema:name": "?name"}]
+SELECT = {"?s": ["*"]}
+DATA = [{"@id": "ex:freddy", "schema:name": "Freddy"}]
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(repeat: int) -> None:
+    client = FlureeClient(base_url="http://localhost:8090")
+    ledger = client.with_ledger("bench/ledger")
+
+    def query() -> Any:
+        return ledger.query().with_context(CONTEXT).with_where(WHERE).with_select(SELECT)
+
+    def transaction() -> Any:
+        return ledger.transaction().with_context(CONTEXT).with_insert(DATA)
+
+    polled = query()
+    cases: dict[str, Callable[[], Any]] = {
+        "query chain": query,
+        "query chain + request": lambda: query().get_request(),
+        "transaction chain": transaction,
+        "transaction chain + request": lambda: transaction().get_request(),
+        "same query, request": polled.get_request,
+    }
+    for name, fn in cases.items():
+        fn()
+        print(f"{name:<28}: {timed(fn, repeat) * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.repeat)
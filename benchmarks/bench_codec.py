@@ -0,0 +1,67 @@
+"""Compare payload encoding time of the available JSON codecs.
+
+A transaction with a large `with_insert` payload is turned into a request with
+`get_request()` once per codec, so the timings include everything the client
+does before the bytes reach the connection. Codecs whose package is not
+installed are skipped.
+
+Usage:
+    uv run --extra orjson --extra msgspec python benchmarks/bench_codec.py [--records 100000]
+"""
+
+import argparse
+import statistics
+import time
+
+from fluree_py import FlureeClient
+from fluree_py.http.codec import JsonCodec, MsgspecCodec, OrjsonCodec, StdlibJsonCodec
+
+
+def records(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            "@id": f"ex:person/{i}",
+            "@type": "schema:Person",
+            "schema:name": f"Person {i}",
+            "schema:description": "Prüfung ünïcödé " * 4,
+            "schema:age": i % 100,
+            "schema:knows": [{"@id": f"ex:person/{i + 1}"}, {"@id": f"ex:person/{i + 2}"}],
+        }
+        for i in range(count)
+    ]
+
+
+def codecs() -> list[JsonCodec]:
+    available: list[JsonCodec] = [StdlibJsonCodec()]
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            available.append(codec())
+        except ImportError:
+            print(f"skipping {codec.__name__}: not installed")
+    return available
+
+
+def main(count: int, repeat: int) -> None:
+    data = records(count)
+    for codec in codecs():
+        client = FlureeClient(base_url="http://localhost:8090", codec=codec)
+        transaction = client.with_ledger("bench").transaction().with_insert(data)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            request = transaction.get_request()
+            timings.append(time.perf_counter() - start)
+        size = len(request.content) / 2**20
+        best, median = min(timings), statistics.median(timings)
+        print(
+            f"{type(codec).__name__:<16} {size:7.1f} MiB  best={best * 1000:8.1f}ms  "
+            f"median={median * 1000:8.1f}ms  {size / median:7.1f} MiB/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.records, args.repeat)
@@ -0,0 +1,40 @@
+"""Compare sequential `commit()` calls against the thread-pooled `commit_many`.
+
+Usage:
+    uv run python benchmarks/bench_commit_many.py [--requests 500] [--max-workers 16]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from server import stand_in_server
+
+from fluree_py import FlureeClient
+
+
+def timed(label: str, count: int, run: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s {count / elapsed:10.1f} req/s")
+
+
+def main(requests: int, max_workers: int) -> None:
+    with stand_in_server() as base_url, FlureeClient(base_url=base_url) as client:
+        builders = [client.with_ledger("bench").query() for _ in range(requests)]
+
+        timed("sequential commit()", requests, lambda: [b.commit() for b in builders])
+        timed(
+            f"commit_many(max_workers={max_workers})",
+            requests,
+            lambda: client.commit_many(builders, max_workers=max_workers),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--max-workers", type=int, default=16)
+    args = parser.parse_args()
+    main(args.requests, args.max_workers)
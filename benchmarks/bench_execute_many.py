@@ -0,0 +1,56 @@
+"""Compare `FlureeClient.execute_many` against a naive `asyncio.gather` of `acommit()`.
+
+Usage:
+    uv run python benchmarks/bench_execute_many.py [--requests 500] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from server import stand_in_server
+
+from fluree_py import FlureeClient
+from fluree_py.http.endpoint import QueryBuilderImpl
+
+
+async def timed(label: str, count: int, run: Callable[[], Awaitable[object]]) -> None:
+    start = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s {count / elapsed:10.1f} req/s")
+
+
+async def main(requests: int, concurrency: int) -> None:
+    with stand_in_server() as base_url:
+        async with FlureeClient(base_url=base_url) as client:
+            builders = [client.with_ledger("bench").query() for _ in range(requests)]
+            unpooled = [
+                QueryBuilderImpl(endpoint=f"{base_url}/fluree/query", ledger="bench")
+                for _ in range(requests)
+            ]
+
+            await timed(
+                "gather(acommit()) without a pool",
+                requests,
+                lambda: asyncio.gather(*(b.acommit() for b in unpooled)),
+            )
+            await timed(
+                "gather(acommit()) on the shared pool",
+                requests,
+                lambda: asyncio.gather(*(b.acommit() for b in builders)),
+            )
+            await timed(
+                f"execute_many(concurrency={concurrency})",
+                requests,
+                lambda: client.execute_many(builders, concurrency=concurrency),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,59 @@
+"""Compare compiling a select from a large model graph with the cached path.
+
+A graph of `--models` Pydantic models is generated where every model nests a
+few of the ones defined before it, directly and in lists. The uncached cost is
+a fresh `FlureeSelectBuilder().build()`, the cached cost a repeated
+`from_pydantic()` call, which only copies the compiled select.
+
+Usage:
+    uv run python benchmarks/bench_from_pydantic.py [--models 200]
+"""
+
+import argparse
+import random
+import time
+import warnings
+from typing import Any
+
+from pydantic import BaseModel, create_model
+
+from fluree_py.query.select.pydantic import FlureeSelectBuilder, from_pydantic
+
+
+def model_graph(count: int, fanout: int = 3) -> type[BaseModel]:
+    rng = random.Random(0)
+    models: list[type[BaseModel]] = []
+    for i in range(count):
+        fields: dict[str, Any] = {"id": (str, ...), "name": (str, ...), "score": (float, 0.0)}
+        for j, child in enumerate(rng.sample(models, min(fanout, len(models)))):
+            fields[f"child_{j}"] = (child | None, None) if j % 2 else (list[child], [])
+        models.append(create_model(f"Model{i}", **fields))
+    return models[-1]
+
+
+def timed(fn: Any, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(count: int, repeat: int) -> None:
+    root = model_graph(count)
+    warnings.simplefilter("ignore")
+
+    uncached = timed(lambda: FlureeSelectBuilder().build(root), repeat)
+    from_pydantic(root)
+    cached = timed(lambda: from_pydantic(root), repeat)
+
+    print(f"models={count}")
+    print(f"uncached build : {uncached * 1e6:10.1f} us/call")
+    print(f"cached         : {cached * 1e6:10.1f} us/call  ({uncached / cached:,.0f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.models, args.repeat)
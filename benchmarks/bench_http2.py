@@ -0,0 +1,71 @@
+"""Compare request rate and tail latency of HTTP/1.1 and HTTP/2 sessions.
+
+Many small concurrent queries are issued with `acommit()` through a client with
+a deliberately small connection pool, once over HTTP/1.1 and once over HTTP/2
+with prior knowledge (`http1=False`), so the second run multiplexes requests
+over the pooled connections. Without `--url` the stand-in app is served by
+hypercorn (a dev dependency), which speaks both HTTP/1.1 and cleartext HTTP/2
+(h2c). With `--url`, point it at a server that speaks HTTP/2, over TLS or h2c.
+The protocols reported for each run show what was actually used.
+
+Usage:
+    uv run --extra http2 python benchmarks/bench_http2.py [--url https://...]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+from server import h2_stand_in_server
+
+from fluree_py import FlureeClient
+
+
+async def run(base_url: str, http2: bool, requests: int, connections: int) -> None:
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with FlureeClient(
+        base_url=base_url, limits=limits, http1=not http2, http2=http2
+    ) as client:
+        builders = [client.with_ledger("bench").query() for _ in range(requests)]
+        latencies: list[float] = []
+        versions: Counter[str] = Counter()
+
+        async def one(builder: object) -> None:
+            start = time.perf_counter()
+            response = await builder.acommit()  # type: ignore[attr-defined]
+            latencies.append(time.perf_counter() - start)
+            versions[response.response.http_version] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(b) for b in builders))
+        elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"http2={http2!s:<5} {requests / elapsed:9.1f} req/s "
+        f"p50={quantiles[49] * 1000:7.1f}ms p99={quantiles[98] * 1000:7.1f}ms "
+        f"protocols={dict(versions)}"
+    )
+
+
+async def main(url: str | None, requests: int, connections: int) -> None:
+    if url is not None:
+        for http2 in (False, True):
+            await run(url, http2, requests, connections)
+        return
+
+    with h2_stand_in_server() as base_url:
+        for http2 in (False, True):
+            await run(base_url, http2, requests, connections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None, help="Base URL of a server to benchmark")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--connections", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests, args.connections))
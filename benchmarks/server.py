@@ -0,0 +1,127 @@
+"""A minimal local stand-in for a Fluree server used by the benchmarks.
+
+Every POST is answered with a small, fixed JSON body over HTTP/1.1 keep-alive
+connections, so the benchmarks measure client overhead rather than query cost.
+`h2_stand_in_server()` serves the same body with hypercorn, which also speaks
+cleartext HTTP/2 (h2c) to clients with prior knowledge.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+BODY = b'[{"@id":"ex:freddy","@type":"ex:Yeti","schema:age":4,"schema:name":"Freddy"}]'
+
+
+class FlureeStandInHandler(BaseHTTPRequestHandler):
+    """Answers every POST with the same JSON document."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=utf-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class FlureeStandInServer(ThreadingHTTPServer):
+    """Threaded server with a listen backlog deep enough for request bursts."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+@contextmanager
+def stand_in_server() -> Iterator[str]:
+    """Run the stand-in server on a free local port and yield its base URL."""
+    server = FlureeStandInServer(("127.0.0.1", 0), FlureeStandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host!s}:{port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def stand_in_app(
+    scope: dict[str, Any],
+    receive: Callable[[], Awaitable[dict[str, Any]]],
+    send: Callable[[dict[str, Any]], Awaitable[None]],
+) -> None:
+    """ASGI app answering every request with the same JSON document."""
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    while (await receive()).get("more_body"):
+        pass
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json;charset=utf-8"),
+                (b"content-length", str(len(BODY)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": BODY})
+
+
+@contextmanager
+def h2_stand_in_server() -> Iterator[str]:
+    """Run the stand-in app under hypercorn on a free local port and yield its base URL.
+
+    The server speaks HTTP/1.1 and, to clients with prior knowledge, h2c.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        host, port = probe.getsockname()[:2]
+    config = Config()
+    config.bind = [f"{host}:{port}"]
+    config.accesslog = None
+    config.errorlog = None
+
+    loop = asyncio.new_event_loop()
+    stop = asyncio.Event()
+
+    def run() -> None:
+        loop.run_until_complete(serve(stand_in_app, config, shutdown_trigger=stop.wait))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.1).close()
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        loop.call_soon_threadsafe(stop.set)
+        thread.join()
+        loop.close()
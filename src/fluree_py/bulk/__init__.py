@@ -0,0 +1,15 @@
+"""Bulk loading of large NDJSON and JSON-LD files with resumable checkpoints."""
+
+from fluree_py.bulk.checkpoint import Checkpoint
+from fluree_py.bulk.loader import BulkLoader, LoadStats
+from fluree_py.bulk.reader import RecordFormat, RecordReader, detect_format, flatten_context
+
+__all__ = [
+    "BulkLoader",
+    "Checkpoint",
+    "LoadStats",
+    "RecordFormat",
+    "RecordReader",
+    "detect_format",
+    "flatten_context",
+]
@@ -0,0 +1,42 @@
+"""Checkpoint files recording how far a bulk load has committed."""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Self
+
+
+@dataclass(frozen=True, kw_only=True)
+class Checkpoint:
+    """The committed prefix of a bulk load.
+
+    Every record of `source` that ends at or before byte `offset` is committed
+    to `ledger`; `records` counts them and `t` is the latest commit seen.
+    """
+
+    source: str
+    size: int
+    ledger: str
+    offset: int
+    records: int
+    t: int | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> Self | None:
+        """Read a checkpoint file, or return None when there is none."""
+        try:
+            data = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        return cls(**data)
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint atomically, replacing any previous one."""
+        partial = path.with_name(f"{path.name}.tmp")
+        partial.write_text(json.dumps(asdict(self)))
+        os.replace(partial, path)
+
+    def matches(self, source: str, size: int, ledger: str) -> bool:
+        """Whether the checkpoint was written for this file and ledger."""
+        return (self.source, self.size, self.ledger) == (source, size, ledger)
@@ -0,0 +1,222 @@
+"""Bulk loading of NDJSON and JSON-LD files into a ledger."""
+
+import heapq
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from fluree_py.bulk.checkpoint import Checkpoint
+from fluree_py.bulk.reader import RecordFormat, RecordReader
+from fluree_py.http.chunked import (
+    ChunkedCommitError,
+    ChunkedCommitResult,
+    ChunkedInsert,
+    ChunkPolicy,
+    ChunkResult,
+    commit_chunked,
+)
+from fluree_py.http.client import FlureeClient
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoadStats:
+    """Progress of a bulk load, counting only what this run committed."""
+
+    records: int
+    bytes: int
+    """Bytes of the source file committed, separators and whitespace included."""
+    elapsed: float
+    offset: int
+    """Byte offset of the source up to which every record is committed."""
+    t: int | None
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+class _Progress:
+    """Tracks the committed prefix of the source and checkpoints it.
+
+    Chunks commit out of order, so the checkpoint only moves past a record once
+    every record before it is committed too.
+    """
+
+    def __init__(
+        self,
+        *,
+        state: Checkpoint,
+        path: Path,
+        report: Callable[[LoadStats], None] | None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._state = state
+        self._first = state
+        self._path = path
+        self._report = report
+        self._started = time.monotonic()
+        self._ends: deque[int] = deque()
+        self._committed: list[tuple[int, int]] = []
+        self._next = 0
+        self._t = state.t
+
+    def track(self, records: Iterator[tuple[int, bytes]]) -> Iterator[bytes]:
+        """Pass the records on, remembering where each one ends."""
+        for end, record in records:
+            with self._lock:
+                self._ends.append(end)
+            yield record
+
+    def committed(self, chunk: ChunkResult) -> None:
+        """Record a committed chunk of tracked records."""
+        with self._lock:
+            heapq.heappush(self._committed, (chunk.offset, chunk.count))
+            if chunk.t is not None:
+                self._t = max(chunk.t, self._t or 0)
+            count = 0
+            while self._committed and self._committed[0][0] == self._next:
+                _, done = heapq.heappop(self._committed)
+                self._next += done
+                count += done
+            if count:
+                for _ in range(count - 1):
+                    self._ends.popleft()
+                self._advance(self._ends.popleft(), count)
+
+    def advance(self, offset: int, count: int, t: int | None) -> None:
+        """Record records committed outside the tracked pipeline."""
+        with self._lock:
+            if t is not None:
+                self._t = max(t, self._t or 0)
+            self._advance(offset, count)
+
+    def _advance(self, offset: int, count: int) -> None:
+        self._state = replace(
+            self._state, offset=offset, records=self._state.records + count, t=self._t
+        )
+        self._state.save(self._path)
+        if self._report is not None:
+            self._report(self._stats())
+
+    def stats(self) -> LoadStats:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> LoadStats:
+        return LoadStats(
+            records=self._state.records - self._first.records,
+            bytes=self._state.offset - self._first.offset,
+            elapsed=time.monotonic() - self._started,
+            offset=self._state.offset,
+            t=self._t,
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class BulkLoader:
+    """Loads large NDJSON and JSON-LD files into a ledger through the chunked commit pipeline.
+
+    Records are read from the memory-mapped file without being decoded and
+    committed in chunks sized by `policy`, several at a time. After each chunk
+    the committed prefix of the file is written to a checkpoint file, and a
+    later load of the same file into the same ledger resumes from there. The
+    `@context` of a JSON-LD document is sent with every transaction, merged
+    under `context`. With `create=True` the first chunk creates the ledger.
+
+    `progress` is called with the stats after every checkpoint.
+
+    Example:
+        >>> loader = BulkLoader(client=client, ledger="example/people", create=True)
+        >>> stats = loader.load("people.jsonld")
+        >>> print(f"{stats.records_per_second:.0f} records/s")
+
+    Exceptions:
+        ChunkedCommitError: If a chunk fails for good; the checkpoint is kept.
+        ValueError: If the checkpoint belongs to another file or ledger, or the
+            document's `@context` is remote or follows `@graph`.
+    """
+
+    client: FlureeClient
+    ledger: str
+    context: dict[str, Any] | None = None
+    create: bool = False
+    policy: ChunkPolicy = field(default_factory=ChunkPolicy)
+    progress: Callable[[LoadStats], None] | None = field(default=None, compare=False)
+
+    def load(
+        self,
+        source: str | os.PathLike[str],
+        *,
+        format: RecordFormat | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
+    ) -> LoadStats:
+        """Load the file, resuming from its checkpoint if there is one.
+
+        The checkpoint defaults to the source path with ".checkpoint" appended.
+        It is kept after a complete load, so loading again commits nothing.
+        """
+        path = Path(source)
+        checkpoint_path = Path(checkpoint or f"{path}.checkpoint")
+        with RecordReader(path, format) as reader:
+            state = Checkpoint.load(checkpoint_path)
+            name = str(path.resolve())
+            if state is not None and not state.matches(name, reader.size, self.ledger):
+                raise ValueError(f"{checkpoint_path} belongs to another file or ledger")
+            fresh = state is None
+            if state is None:
+                state = Checkpoint(
+                    source=name, size=reader.size, ledger=self.ledger, offset=0, records=0
+                )
+
+            progress = _Progress(state=state, path=checkpoint_path, report=self.progress)
+            context = (reader.context or {}) | (self.context or {}) or None
+            records = reader.records(state.offset)
+            if fresh and self.create:
+                self._create(records, context, progress)
+
+            transaction = self.client.with_ledger(self.ledger).transaction()
+            if context:
+                transaction = transaction.with_context(context)
+            request = transaction.with_insert([]).get_request()
+            insert = ChunkedInsert(
+                url=request.url,
+                ledger=self.ledger,
+                base=request.content,
+                items=progress.track(records),
+            )
+            commit_chunked(self.client.session, insert, self.policy, on_commit=progress.committed)
+        return progress.stats()
+
+    def _create(
+        self,
+        records: Iterator[tuple[int, bytes]],
+        context: dict[str, Any] | None,
+        progress: _Progress,
+    ) -> None:
+        first = list(islice(records, self.policy.initial_items))
+        if not first:
+            return
+        builder = self.client.with_ledger(self.ledger).create()
+        if context:
+            builder = builder.with_context(context)
+        data = [self.client.codec.loads(record) for _, record in first]
+        response = builder.with_insert(data).commit()
+        if not response.is_success:
+            raise ChunkedCommitError(
+                f"Creating ledger {self.ledger} failed: status {response.status_code}",
+                committed=ChunkedCommitResult(chunks=[]),
+                response=response,
+            )
+        body = response.json()
+        t = body.get("t") if isinstance(body, dict) else None
+        progress.advance(first[-1][0], len(first), t)
@@ -0,0 +1,224 @@
+"""Incremental reading of records from memory-mapped NDJSON and JSON-LD files."""
+
+import json
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, Self
+
+RecordFormat = Literal["ndjson", "jsonld"]
+"""Line-delimited JSON records, or a JSON-LD array or `@graph` document."""
+
+NDJSON_SUFFIXES = frozenset({".ndjson", ".jsonl"})
+
+# Runs of anything but brackets (and commas, at the top level), with strings
+# matched whole so the brackets and commas inside them are skipped
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_TOP_LEVEL = re.compile(rb'(?:[^"\[\]{},]++|' + _STRING + rb")*+")
+_NESTED = re.compile(rb'(?:[^"\[\]{}]++|' + _STRING + rb")*+")
+_KEY = re.compile(rb"\s*(" + _STRING + rb")\s*:\s*")
+_COMMA = ord(",")
+_OPENERS = frozenset(b"[{")
+_CLOSERS = frozenset(b"]}")
+
+
+def detect_format(path: str | os.PathLike[str]) -> RecordFormat:
+    """Guess the record format from a file name: NDJSON for .ndjson and .jsonl."""
+    return "ndjson" if Path(path).suffix.lower() in NDJSON_SUFFIXES else "jsonld"
+
+
+def flatten_context(context: Any) -> dict[str, Any] | None:
+    """Merge a JSON-LD `@context` value into a single context object.
+
+    A list of context objects is merged in order, a `null` entry dropping
+    everything before it.
+
+    Exceptions:
+        ValueError: If the context refers to a remote context by IRI.
+    """
+    if context is None or isinstance(context, dict):
+        return context
+    if isinstance(context, list):
+        merged: dict[str, Any] | None = None
+        for entry in context:
+            flat = flatten_context(entry)
+            merged = None if flat is None else (merged or {}) | flat
+        return merged
+    raise ValueError(f"Remote @context {context!r} is not supported; inline it in the document")
+
+
+def _separator(buf: Any, pos: int) -> int:
+    """Find the comma or closing bracket that ends the JSON value starting at `pos`."""
+    depth, size = 0, len(buf)
+    while True:
+        pos = (_NESTED if depth else _TOP_LEVEL).match(buf, pos).end()  # type: ignore[union-attr]
+        if pos >= size:
+            raise ValueError(f"Truncated JSON value at byte {pos}")
+        char = buf[pos]
+        if char in _OPENERS:
+            depth += 1
+        elif char in _CLOSERS:
+            if depth == 0:
+                return pos
+            depth -= 1
+        elif char == _COMMA:
+            return pos
+        else:
+            raise ValueError(f"Unterminated JSON string at byte {pos}")
+        pos += 1
+
+
+def _skip_whitespace(buf: Any, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in b" \t\r\n":
+        pos += 1
+    return pos
+
+
+class RecordReader:
+    """Memory-maps a file and yields its records as raw JSON bytes.
+
+    NDJSON files hold one record per line. JSON-LD files are either an array of
+    nodes or a document whose `@graph` array holds them; the document's
+    `@context` is exposed as `context`, flattened into one object, and must
+    precede `@graph`. A JSON-LD document without `@graph` is a single record.
+
+    Records are found by scanning for brackets, commas and strings without
+    decoding them, so they can be spliced into transactions as they are. Each
+    record comes with the byte offset where it ends, which `records()` accepts
+    to resume right after it.
+
+    Example:
+        >>> with RecordReader("people.jsonld") as reader:
+        ...     for end, record in reader.records():
+        ...         print(end, record)
+
+    Exceptions:
+        ValueError: If the file is not valid JSON-LD or NDJSON at a record boundary,
+            or the document's `@context` is remote or follows `@graph`.
+    """
+
+    __slots__ = ("_buf", "_file", "_graph", "context", "format", "path")
+
+    def __init__(self, path: str | os.PathLike[str], format: RecordFormat | None = None):
+        self.path = Path(path)
+        self.format: RecordFormat = format or detect_format(path)
+        self.context: dict[str, Any] | None = None
+        self._file = self.path.open("rb")
+        self._buf: Any = b""
+        try:
+            if os.fstat(self._file.fileno()).st_size:
+                self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(self._buf, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    self._buf.madvise(mmap.MADV_SEQUENTIAL)
+            self._graph = self._read_header() if self.format == "jsonld" else 0
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def size(self) -> int:
+        """Size of the file in bytes."""
+        return len(self._buf)
+
+    def records(self, start: int = 0) -> Iterator[tuple[int, bytes]]:
+        """Yield `(end, record)` pairs, resuming after the record ending at `start`."""
+        if self.format == "ndjson":
+            return self._lines(start)
+        if self._graph < 0:
+            return iter([] if start else [(self.size, bytes(self._buf).strip())])
+        return self._elements(max(start, self._graph))
+
+    def _lines(self, pos: int) -> Iterator[tuple[int, bytes]]:
+        buf, size = self._buf, self.size
+        if pos and pos < size and buf[pos] == ord("\n"):
+            pos += 1
+        while pos < size:
+            end = buf.find(b"\n", pos)
+            if end < 0:
+                end = size
+            record = buf[pos:end].strip()
+            if record:
+                yield end, record
+            pos = end + 1
+
+    def _elements(self, pos: int) -> Iterator[tuple[int, bytes]]:
+        buf = self._buf
+        pos = _skip_whitespace(buf, pos)
+        if pos >= self.size or buf[pos] == ord("]"):
+            return
+        if buf[pos] in b"[,":
+            pos += 1
+        while True:
+            end = _separator(buf, pos)
+            record = buf[pos:end].strip()
+            if record:
+                yield end, record
+            if buf[end] != _COMMA:
+                return
+            pos = end + 1
+
+    def _read_header(self) -> int:
+        """Read a JSON-LD document's `@context` and return where its nodes start.
+
+        Returns -1 for a document without `@graph`.
+        """
+        buf = self._buf
+        pos = _skip_whitespace(buf, 0)
+        if pos >= self.size or buf[pos] == ord("["):
+            return pos
+        if buf[pos] != ord("{"):
+            raise ValueError(f"Expected a JSON-LD array or object at byte {pos}")
+
+        pos += 1
+        context = None
+        while (key := _KEY.match(buf, pos)) is not None:
+            name, pos = json.loads(key.group(1)), key.end()
+            if name == "@graph":
+                if buf[pos] != ord("["):
+                    raise ValueError(f"Expected the @graph array at byte {pos}")
+                self._check_no_context_after(pos)
+                self.context = flatten_context(context)
+                return pos
+            end = _separator(buf, pos)
+            if name == "@context":
+                context = json.loads(buf[pos:end])
+            if buf[end] != _COMMA:
+                break
+            pos = end + 1
+        return -1
+
+    def _check_no_context_after(self, graph: int) -> None:
+        """Reject a document whose `@context` comes after `@graph`.
+
+        Records are streamed from `@graph` before the rest of the document is
+        read, so they would be loaded without it. The graph is only scanned if
+        "@context" occurs somewhere after its start.
+        """
+        buf = self._buf
+        if buf.rfind(b'"@context"', graph) < 0:
+            return
+        end = _separator(buf, graph)
+        while buf[end] == _COMMA and (key := _KEY.match(buf, end + 1)) is not None:
+            if json.loads(key.group(1)) == "@context":
+                raise ValueError(f"@context at byte {key.start(1)} must precede @graph")
+            end = _separator(buf, key.end())
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,23 @@
+"""Cached pydantic type adapters for validating responses into models."""
+
+from typing import TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+_LIST_ADAPTER = "__fluree_list_adapter__"
+
+
+def list_adapter(model: type[M]) -> TypeAdapter[list[M]]:
+    """Get the `TypeAdapter` validating a list of `model`, building it on first use.
+
+    The adapter is stored on the model class itself rather than in a global
+    registry, since it references the class; dynamically created models and
+    their adapters are then garbage collected together.
+    """
+    adapter = vars(model).get(_LIST_ADAPTER)
+    if adapter is None:
+        adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+        setattr(model, _LIST_ADAPTER, adapter)
+    return adapter
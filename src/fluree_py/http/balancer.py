@@ -0,0 +1,196 @@
+"""Load balancing of requests across several Fluree nodes."""
+
+import itertools
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from httpx import Request
+
+
+@dataclass(frozen=True, kw_only=True)
+class HealthPolicy:
+    """Passive health tracking settings for a pool of nodes.
+
+    A node is ejected from selection after `max_failures` consecutive failed
+    requests (transport errors or 5xx responses) and becomes eligible again once
+    `ejection_time` seconds have passed. A single further failure ejects it again.
+    """
+
+    max_failures: int = 3
+    ejection_time: float = 30.0
+
+
+@dataclass(kw_only=True)
+class Node:
+    """Live bookkeeping for a single Fluree node."""
+
+    url: str
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ewma_latency: float | None = None
+    ejected_until: float = 0.0
+
+    def is_available(self, now: float) -> bool:
+        """Check if the node is not currently ejected."""
+        return now >= self.ejected_until
+
+
+@dataclass(frozen=True, kw_only=True)
+class NodeMetrics:
+    """A point-in-time snapshot of a node's statistics."""
+
+    url: str
+    outstanding: int
+    requests: int
+    failures: int
+    ewma_latency: float | None
+    ejected: bool
+
+
+class BalancingStrategy(Protocol):
+    """Protocol for choosing which node serves the next request."""
+
+    def select(self, nodes: Sequence[Node]) -> Node:
+        """Pick one of the given, non-empty, candidate nodes."""
+        ...
+
+
+@dataclass(kw_only=True)
+class RoundRobin:
+    """Cycle through the candidate nodes in turn."""
+
+    _counter: "itertools.count[int]" = field(default_factory=itertools.count, repr=False)
+
+    def select(self, nodes: Sequence[Node]) -> Node:
+        """Pick the next node in rotation."""
+        return nodes[next(self._counter) % len(nodes)]
+
+
+@dataclass(kw_only=True)
+class LeastOutstanding:
+    """Pick the node with the fewest requests currently in flight."""
+
+    def select(self, nodes: Sequence[Node]) -> Node:
+        """Pick the least loaded node, preferring earlier nodes on ties."""
+        return min(nodes, key=lambda node: node.outstanding)
+
+
+@dataclass(kw_only=True)
+class EwmaLatency:
+    """Pick the node with the lowest load-weighted moving average latency.
+
+    Each node's exponentially weighted latency is scaled by its in-flight
+    request count, so a fast node is not flooded once it becomes busy. Nodes
+    without a latency sample yet are tried first.
+    """
+
+    def select(self, nodes: Sequence[Node]) -> Node:
+        """Pick the node with the lowest expected latency."""
+        return min(
+            nodes,
+            key=lambda node: (
+                -1.0 if node.ewma_latency is None else node.ewma_latency * (node.outstanding + 1)
+            ),
+        )
+
+
+@dataclass(kw_only=True)
+class NodePool:
+    """A set of interchangeable nodes with balancing and passive health tracking.
+
+    Example:
+        >>> pool = NodePool(urls=["http://a:8090", "http://b:8090"], strategy=EwmaLatency())
+        >>> node = pool.acquire()
+        >>> pool.release(node, latency=0.012, failed=False)
+    """
+
+    urls: Sequence[str]
+    strategy: BalancingStrategy = field(default_factory=RoundRobin)
+    health: HealthPolicy = field(default_factory=HealthPolicy)
+    latency_decay: float = 0.3
+
+    nodes: list[Node] = field(init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.urls:
+            raise ValueError("A node pool needs at least one URL")
+        self.nodes = [Node(url=url.rstrip("/")) for url in self.urls]
+
+    def acquire(self) -> Node:
+        """Select a node for a request and count it as in flight.
+
+        Ejected nodes are skipped unless every node is ejected, in which case
+        all of them are considered rather than failing the request outright.
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [node for node in self.nodes if node.is_available(now)] or self.nodes
+            node = self.strategy.select(candidates)
+            node.outstanding += 1
+            node.requests += 1
+            return node
+
+    def release(self, node: Node, *, latency: float, failed: bool) -> None:
+        """Record the outcome of a request previously sent to `node`."""
+        with self._lock:
+            node.outstanding -= 1
+            if failed:
+                node.failures += 1
+                node.consecutive_failures += 1
+                if node.consecutive_failures >= self.health.max_failures:
+                    node.ejected_until = time.monotonic() + self.health.ejection_time
+                return
+
+            node.consecutive_failures = 0
+            if node.ewma_latency is None:
+                node.ewma_latency = latency
+            else:
+                node.ewma_latency += self.latency_decay * (latency - node.ewma_latency)
+
+    def abandon(self, node: Node) -> None:
+        """Stop counting a request as in flight without recording an outcome."""
+        with self._lock:
+            node.outstanding -= 1
+
+    def retarget(self, request: Request, node: Node, *, base_url: str | None = None) -> Request:
+        """Rewrite a request aimed at `base_url` so it is sent to `node` instead.
+
+        Builders address `base_url`, the first node of the pool by default;
+        requests for other hosts are returned unchanged.
+        """
+        url = str(request.url)
+        base_url = self.nodes[0].url if base_url is None else base_url.rstrip("/")
+        if node.url == base_url or not url.startswith(base_url):
+            return request
+
+        headers = request.headers.copy()
+        del headers["Host"]
+        return Request(
+            method=request.method,
+            url=node.url + url[len(base_url) :],
+            headers=headers,
+            content=request.content,
+            extensions=request.extensions,
+        )
+
+    def metrics(self) -> list[NodeMetrics]:
+        """Snapshot the statistics of every node in the pool."""
+        with self._lock:
+            now = time.monotonic()
+            return [
+                NodeMetrics(
+                    url=node.url,
+                    outstanding=node.outstanding,
+                    requests=node.requests,
+                    failures=node.failures,
+                    ewma_latency=node.ewma_latency,
+                    ejected=not node.is_available(now),
+                )
+                for node in self.nodes
+            ]
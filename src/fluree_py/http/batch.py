@@ -0,0 +1,198 @@
+"""Batch execution of many request builders over one pooled session."""
+
+import asyncio
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import Literal, overload
+
+from fluree_py.http.protocol.mixin.request import SupportsRequestCreation
+from fluree_py.http.response import FlureeResponse
+from fluree_py.http.session import FlureeSession
+
+DEFAULT_CONCURRENCY = 10
+"""Number of requests kept in flight when no concurrency is given."""
+
+DEFAULT_MAX_WORKERS = DEFAULT_CONCURRENCY
+"""Number of worker threads used by `commit_many` when none is given."""
+
+
+@overload
+async def execute_many(
+    session: FlureeSession,
+    builders: Iterable[SupportsRequestCreation],
+    *,
+    concurrency: int = ...,
+    ordered: bool = ...,
+    return_exceptions: Literal[False] = ...,
+) -> list[FlureeResponse]: ...
+
+
+@overload
+async def execute_many(
+    session: FlureeSession,
+    builders: Iterable[SupportsRequestCreation],
+    *,
+    concurrency: int = ...,
+    ordered: bool = ...,
+    return_exceptions: Literal[True],
+) -> list[FlureeResponse | Exception]: ...
+
+
+async def execute_many(
+    session: FlureeSession,
+    builders: Iterable[SupportsRequestCreation],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = True,
+    return_exceptions: bool = False,
+) -> list[FlureeResponse] | list[FlureeResponse | Exception]:
+    """Execute many builders concurrently over the session's async pool.
+
+    At most `concurrency` requests are in flight at once. With `ordered=True`
+    results line up with the input builders, otherwise they are returned in
+    completion order. By default the first failure cancels the remaining
+    requests and is raised (fail-fast); with `return_exceptions=True` failures
+    are collected in place of their responses instead.
+
+    Example:
+        >>> responses = await execute_many(session, queries, concurrency=32)
+
+    Exceptions:
+        ValueError: If concurrency is less than one.
+        httpx.RequestError: If a request fails and return_exceptions is False.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    items = list(builders)
+    results: list[FlureeResponse | Exception | None] = [None] * len(items) if ordered else []
+    pending = iter(enumerate(items))
+
+    async def worker() -> None:
+        # Workers share one iterator, so each builder is claimed exactly once
+        for index, builder in pending:
+            result: FlureeResponse | Exception
+            try:
+                result = await session.aexecute(builder)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                result = e
+            if ordered:
+                results[index] = result
+            else:
+                results.append(result)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(items)))]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+
+    return results  # type: ignore[return-value]
+
+
+@overload
+def commit_many(
+    session: FlureeSession,
+    builders: Iterable[SupportsRequestCreation],
+    *,
+    max_workers: int = ...,
+    timeout: float | None = ...,
+    return_exceptions: Literal[False] = ...,
+) -> list[FlureeResponse]: ...
+
+
+@overload
+def commit_many(
+    session: FlureeSession,
+    builders: Iterable[SupportsRequestCreation],
+    *,
+    max_workers: int = ...,
+    timeout: float | None = ...,
+    return_exceptions: Literal[True],
+) -> list[FlureeResponse | Exception]: ...
+
+
+def commit_many(
+    session: FlureeSession,
+    builders: Iterable[SupportsRequestCreation],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+) -> list[FlureeResponse] | list[FlureeResponse | Exception]:
+    """Execute many builders on a thread pool sharing the session's sync pool.
+
+    Results line up with the input builders. `timeout` is a deadline in seconds
+    for the whole batch: builders that have not finished by then are abandoned
+    and reported as `TimeoutError`. By default the first failure cancels the
+    builders that have not started yet and is raised; with
+    `return_exceptions=True` failures are collected in place of their responses.
+
+    Requests beyond the pool's `max_connections` wait for a free connection, so
+    `max_workers` is best kept at or below that limit.
+
+    Example:
+        >>> responses = commit_many(session, queries, max_workers=16, timeout=30.0)
+
+    Exceptions:
+        ValueError: If max_workers is less than one.
+        TimeoutError: If the deadline passes and return_exceptions is False.
+        httpx.RequestError: If a request fails and return_exceptions is False.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    items = list(builders)
+    if not items:
+        return []
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)), thread_name_prefix="fluree-commit"
+    )
+    try:
+        futures = [executor.submit(session.execute, builder) for builder in items]
+        pending: set[Future[FlureeResponse]] = set(futures)
+        while pending:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_EXCEPTION)
+            if not return_exceptions:
+                for future in done:
+                    if (error := future.exception()) is not None:
+                        raise error
+            if pending and not done:
+                break
+        return _collect_results(futures, timeout=timeout, return_exceptions=return_exceptions)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _collect_results(
+    futures: list[Future[FlureeResponse]], *, timeout: float | None, return_exceptions: bool
+) -> list[FlureeResponse | Exception]:
+    """Gather the outcome of each future, in order, once the batch is over.
+
+    Unfinished futures missed the deadline and become `TimeoutError`s.
+
+    Exceptions:
+        TimeoutError: If a future is unfinished and return_exceptions is False.
+    """
+    results: list[FlureeResponse | Exception] = []
+    for future in futures:
+        if not future.done():
+            if not return_exceptions:
+                raise TimeoutError(f"Batch did not complete within {timeout} seconds")
+            results.append(TimeoutError(f"Request did not complete within {timeout} seconds"))
+        elif (error := future.exception()) is not None:
+            if not isinstance(error, Exception):
+                raise error
+            results.append(error)
+        else:
+            results.append(future.result())
+    return results
@@ -0,0 +1,13 @@
+"""Caches for the results of read-only Fluree requests."""
+
+from fluree_py.http.cache.base import CachedResult, CacheStats, ResultCache
+from fluree_py.http.cache.disk import DiskResultCache
+from fluree_py.http.cache.memory import MemoryResultCache
+
+__all__ = [
+    "CacheStats",
+    "CachedResult",
+    "DiskResultCache",
+    "MemoryResultCache",
+    "ResultCache",
+]
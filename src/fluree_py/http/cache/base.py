@@ -0,0 +1,87 @@
+"""Common types shared by the query result caches."""
+
+from dataclasses import dataclass
+from typing import Protocol, Self
+
+from httpx import Request, Response
+
+# The cache holds the decoded body, so headers describing the wire encoding no longer apply
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass(frozen=True, kw_only=True)
+class CachedResult:
+    """The parts of a response needed to rebuild it without the network."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+    @classmethod
+    def from_response(cls, response: Response) -> Self:
+        """Capture a fully read response, dropping headers about its wire encoding."""
+        return cls(
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _WIRE_HEADERS
+            ],
+            content=response.content,
+        )
+
+    def to_response(self, request: Request) -> Response:
+        """Rebuild the response as if it had been returned for `request`."""
+        return Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+
+    @property
+    def size(self) -> int:
+        """Approximate number of bytes held by the result."""
+        return len(self.content) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+@dataclass(frozen=True, kw_only=True)
+class CacheStats:
+    """A point-in-time snapshot of a cache's counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    bytes: int
+
+
+class ResultCache(Protocol):
+    """Protocol for caches of read-only request results.
+
+    Entries are tagged with the ledger they were read from, so a successful
+    write to that ledger can drop them. Each ledger has an epoch that moves on
+    every invalidation; results read before the latest invalidation are stale
+    and must not be stored.
+    """
+
+    def get(self, key: str) -> CachedResult | None:
+        """Look up a result by request fingerprint, counting a hit or a miss."""
+        ...
+
+    def put(self, key: str, ledger: str, result: CachedResult, *, epoch: int) -> None:
+        """Store a result read from `ledger` while it was at `epoch`."""
+        ...
+
+    def epoch(self, ledger: str) -> int:
+        """The ledger's current invalidation epoch."""
+        ...
+
+    def invalidate(self, ledger: str) -> None:
+        """Drop every result read from `ledger` and advance its epoch."""
+        ...
+
+    def stats(self) -> CacheStats:
+        """Snapshot the cache's counters."""
+        ...
@@ -0,0 +1,129 @@
+"""Persistent sqlite cache for results of time-pinned queries."""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self
+
+from fluree_py.http.cache.base import CachedResult, CacheStats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    ledger TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_ledger ON results (ledger);
+"""
+
+
+@dataclass(kw_only=True)
+class DiskResultCache:
+    """Keep results in a sqlite database that survives process restarts.
+
+    Meant for requests pinned to fixed commits, whose results never change, so
+    entries do not expire and are only dropped by `invalidate` or `clear`. The
+    database is opened in WAL mode, so several processes can share one file.
+
+    Example:
+        >>> with DiskResultCache(path="fluree-cache.sqlite") as cache:
+        ...     client = FlureeClient(base_url="http://localhost:8090", pinned_cache=cache)
+        ...     client.with_ledger("example/ledger").history().with_t({"at": 42}).commit()
+    """
+
+    path: str | os.PathLike[str]
+
+    _db: sqlite3.Connection = field(init=False, repr=False)
+    _epochs: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _hits: int = field(default=0, init=False, repr=False)
+    _misses: int = field(default=0, init=False, repr=False)
+    _invalidations: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, key: str) -> CachedResult | None:
+        """Look up a result by request fingerprint, counting a hit or a miss."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status_code, headers, content FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        status_code, headers, content = row
+        return CachedResult(
+            status_code=status_code,
+            headers=[(name, value) for name, value in json.loads(headers)],
+            content=content,
+        )
+
+    def put(self, key: str, ledger: str, result: CachedResult, *, epoch: int) -> None:
+        """Store a result read from `ledger` while it was at `epoch`.
+
+        The result is dropped if the ledger has been invalidated since.
+        """
+        with self._lock:
+            if self._epochs.get(ledger, 0) != epoch:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, ledger, result.status_code, json.dumps(result.headers), result.content),
+            )
+
+    def epoch(self, ledger: str) -> int:
+        """The ledger's current invalidation epoch."""
+        with self._lock:
+            return self._epochs.get(ledger, 0)
+
+    def invalidate(self, ledger: str) -> None:
+        """Drop every result read from `ledger` and advance its epoch."""
+        with self._lock:
+            self._epochs[ledger] = self._epochs.get(ledger, 0) + 1
+            self._invalidations += 1
+            self._db.execute("DELETE FROM results WHERE ledger = ?", (ledger,))
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+
+    def stats(self) -> CacheStats:
+        """Snapshot the cache's counters."""
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(content)), 0) FROM results"
+            ).fetchone()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=0,
+                invalidations=self._invalidations,
+                entries=entries,
+                bytes=size,
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,131 @@
+"""In-process LRU cache for query and history results."""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+
+from fluree_py.http.cache.base import CachedResult, CacheStats
+
+
+@dataclass(frozen=True, kw_only=True)
+class _Entry:
+    result: CachedResult
+    ledger: str
+    expires: float
+
+
+@dataclass(kw_only=True)
+class MemoryResultCache:
+    """Keep recent results in memory with LRU, TTL and total size eviction.
+
+    The least recently used entries are evicted once more than `max_entries`
+    results or `max_bytes` of content are held. Entries older than `ttl`
+    seconds are treated as misses; `ttl=None` keeps them until evicted or
+    invalidated. Results larger than `max_bytes` are never stored.
+
+    Example:
+        >>> cache = MemoryResultCache(max_entries=512, ttl=30.0, max_bytes=16 * 2**20)
+        >>> client = FlureeClient(base_url="http://localhost:8090", cache=cache)
+        >>> cache.stats().hits
+        0
+    """
+
+    max_entries: int = 1024
+    ttl: float | None = 60.0
+    max_bytes: int = 64 * 2**20
+
+    _entries: "OrderedDict[str, _Entry]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _by_ledger: defaultdict[str, set[str]] = field(
+        default_factory=lambda: defaultdict(set), init=False, repr=False
+    )
+    _epochs: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _bytes: int = field(default=0, init=False, repr=False)
+    _hits: int = field(default=0, init=False, repr=False)
+    _misses: int = field(default=0, init=False, repr=False)
+    _evictions: int = field(default=0, init=False, repr=False)
+    _invalidations: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {self.max_entries}")
+        if self.max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {self.max_bytes}")
+
+    def get(self, key: str) -> CachedResult | None:
+        """Look up a result by request fingerprint, counting a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.result
+
+    def put(self, key: str, ledger: str, result: CachedResult, *, epoch: int) -> None:
+        """Store a result read from `ledger` while it was at `epoch`.
+
+        The result is dropped if the ledger has been invalidated since.
+        """
+        size = result.size
+        if size > self.max_bytes:
+            return
+        expires = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if self._epochs.get(ledger, 0) != epoch:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(result=result, ledger=ledger, expires=expires)
+            self._by_ledger[ledger].add(key)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def epoch(self, ledger: str) -> int:
+        """The ledger's current invalidation epoch."""
+        with self._lock:
+            return self._epochs.get(ledger, 0)
+
+    def invalidate(self, ledger: str) -> None:
+        """Drop every result read from `ledger` and advance its epoch."""
+        with self._lock:
+            self._epochs[ledger] = self._epochs.get(ledger, 0) + 1
+            self._invalidations += 1
+            for key in list(self._by_ledger.get(ledger, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._by_ledger.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot the cache's counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.result.size
+        keys = self._by_ledger[entry.ledger]
+        keys.discard(key)
+        if not keys:
+            del self._by_ledger[entry.ledger]
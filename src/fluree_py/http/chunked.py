@@ -0,0 +1,471 @@
+"""Committing oversized inserts as a pipeline of size-bounded transactions."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+from httpx import URL, ConnectError, ConnectTimeout, PoolTimeout, Request, TransportError
+
+from fluree_py.http.codec import JSON_CONTENT_TYPE, prepend_member
+from fluree_py.http.response import FlureeResponse
+from fluree_py.http.session import FlureeSession
+
+RETRYABLE_STATUS_CODES = frozenset({413, 429})
+"""Statuses after which a chunk was not applied, so it is split and sent again."""
+
+AMBIGUOUS_STATUS_CODES = frozenset({408})
+"""Statuses, besides 5xx, after which a chunk may or may not have been applied."""
+
+_UNSENT_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+"""Transport errors raised before the request reached the server."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChunkPolicy:
+    """Sizing, pipelining and retry settings for chunked commits.
+
+    Chunks start at `initial_items` items and never exceed `max_items` items or
+    `max_bytes` bytes of encoded insert data, except for a single item that is
+    larger on its own. After each chunk the item count grows by `growth` while
+    chunks commit within `target_latency` seconds, and shrinks by `shrink` when
+    they are slower or fail. Chunks the server did not apply (413 and 429
+    responses, and connection failures) are split in half and retried up to
+    `max_retries` times.
+
+    Other transport errors, such as read timeouts, and 408 and 5xx responses are
+    ambiguous: the server may have committed the chunk before failing. They
+    stop the commit unless `retry_ambiguous` is set, in which case they are
+    retried too. Such retries are not idempotent and can insert a chunk twice,
+    so only enable them for data that tolerates it, such as inserts whose nodes
+    all have an `@id`.
+
+    Exceptions:
+        ValueError: If a size, count or factor is out of range.
+    """
+
+    max_bytes: int = 1024 * 1024
+    max_items: int = 10_000
+    min_items: int = 1
+    initial_items: int = 500
+    concurrency: int = 4
+    target_latency: float = 2.0
+    growth: float = 1.5
+    shrink: float = 0.5
+    max_retries: int = 3
+    retry_ambiguous: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_bytes < 1 or self.concurrency < 1 or self.max_retries < 0:
+            raise ValueError("max_bytes and concurrency must be positive, max_retries not negative")
+        if not 1 <= self.min_items <= self.initial_items <= self.max_items:
+            raise ValueError(
+                "Item counts must satisfy 1 <= min_items <= initial_items <= max_items"
+            )
+        if self.growth < 1 or not 0 < self.shrink < 1:
+            raise ValueError("growth must be at least 1 and shrink between 0 and 1")
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChunkResult:
+    """The outcome of one committed chunk."""
+
+    offset: int
+    """Index of the chunk's first item in the insert array."""
+    count: int
+    size: int
+    """Encoded size of the chunk's insert data in bytes."""
+    latency: float
+    t: int | None
+    tx_id: str | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChunkedCommitResult:
+    """The aggregate outcome of a chunked commit, chunks in insert order."""
+
+    chunks: list[ChunkResult]
+
+    @property
+    def items(self) -> int:
+        """Number of items committed."""
+        return sum(chunk.count for chunk in self.chunks)
+
+    @property
+    def t(self) -> int | None:
+        """The latest ledger `t` reached by the commit."""
+        return max((chunk.t for chunk in self.chunks if chunk.t is not None), default=None)
+
+
+class ChunkedCommitError(Exception):
+    """Raised when a chunk fails for good; earlier chunks may be committed already.
+
+    `committed` lists the chunks that did commit, `response` is the failed
+    chunk's response when the server answered.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        committed: ChunkedCommitResult,
+        response: FlureeResponse | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.committed = committed
+        self.response = response
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TransactionChunk:
+    """A pre-encoded transaction carrying one chunk of a larger insert."""
+
+    read_only: ClassVar[bool] = False
+
+    url: URL
+    ledger: str
+    content: bytes
+
+    def get_request(self) -> Request:
+        """Constructs the HTTP request for the chunk."""
+        return Request(
+            method="POST",
+            url=self.url,
+            content=self.content,
+            headers={"Content-Type": JSON_CONTENT_TYPE},
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChunkedInsert:
+    """An insert transaction split into separately encoded items.
+
+    `base` is the encoded transaction payload without its insert data; each
+    chunk is sent as `base` with a slice of `items` spliced in as `insert`.
+    Items are pulled lazily, so they may come from a generator or, for async
+    commits, an async iterator.
+    """
+
+    url: URL
+    ledger: str
+    base: bytes
+    items: Iterable[bytes] | AsyncIterable[bytes]
+
+    def request_for(self, chunk: "_Chunk") -> TransactionChunk:
+        """Builds the transaction committing one chunk of the items."""
+        data = b"[" + b",".join(chunk.items) + b"]"
+        return TransactionChunk(
+            url=self.url, ledger=self.ledger, content=prepend_member("insert", data, self.base)
+        )
+
+
+@dataclass(kw_only=True)
+class _Chunk:
+    offset: int
+    items: Sequence[bytes]
+    attempts: int = 0
+
+    @property
+    def size(self) -> int:
+        return sum(map(len, self.items)) + len(self.items) + 1
+
+
+@dataclass(kw_only=True)
+class _Cut:
+    """A chunk being filled from the source, up to an item and a byte limit."""
+
+    offset: int
+    limit: int
+    max_bytes: int
+    items: list[bytes] = field(default_factory=list)
+    size: int = 2  # the array brackets
+    overflow: bytes | None = None
+
+    def wants(self) -> bool:
+        return self.overflow is None and len(self.items) < self.limit
+
+    def add(self, item: bytes) -> None:
+        grown = self.size + len(item) + bool(self.items)
+        if self.items and grown > self.max_bytes:
+            self.overflow = item
+            return
+        self.items.append(item)
+        self.size = grown
+
+
+@dataclass(kw_only=True)
+class ChunkPlanner:
+    """Cuts encoded insert items into chunks sized by the policy's feedback loop.
+
+    Items are pulled from the source only when a worker asks for the next
+    chunk, so no more than one chunk per worker, plus chunks queued for a
+    retry, is held in memory. Shared by the workers of one chunked commit;
+    every method is thread safe and `anext` is also safe across tasks.
+    """
+
+    items: Iterable[bytes] | AsyncIterable[bytes]
+    policy: ChunkPolicy = field(default_factory=ChunkPolicy)
+
+    target: int = field(init=False)
+    _source: Iterator[bytes] | AsyncIterator[bytes] = field(init=False, repr=False)
+    _offset: int = field(default=0, init=False)
+    _overflow: bytes | None = field(default=None, init=False, repr=False)
+    _stopped: bool = field(default=False, init=False)
+    _retries: deque[_Chunk] = field(default_factory=deque, init=False)
+    _results: list[ChunkResult] = field(default_factory=list, init=False)
+    _failure: ChunkedCommitError | None = field(default=None, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _pulling: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.target = self.policy.initial_items
+        if isinstance(self.items, AsyncIterable):
+            self._source = aiter(self.items)
+        else:
+            self._source = iter(self.items)
+
+    def next(self) -> _Chunk | None:
+        """Take the next chunk to send, retries first; None once there is none.
+
+        Exceptions:
+            TypeError: If the items come from an async iterator.
+        """
+        if isinstance(self._source, AsyncIterator):
+            raise TypeError("Items from an async iterator can only be committed asynchronously")
+        with self._lock:
+            if self._stopped or self._retries:
+                return self._retry()
+            cut = self._cut()
+            try:
+                while cut.wants() and (item := next(self._source, None)) is not None:
+                    cut.add(item)
+            except BaseException:
+                self._stopped = True
+                raise
+            return self._take(cut)
+
+    async def anext(self) -> _Chunk | None:
+        """Take the next chunk to send, awaiting items from an async source."""
+        async with self._pulling:
+            with self._lock:
+                if self._stopped or self._retries:
+                    return self._retry()
+                cut = self._cut()
+            try:
+                while cut.wants() and (item := await self._apull()) is not None:
+                    cut.add(item)
+            except BaseException:
+                self._stopped = True
+                raise
+            with self._lock:
+                return self._take(cut)
+
+    async def _apull(self) -> bytes | None:
+        if isinstance(self._source, AsyncIterator):
+            return await anext(self._source, None)
+        return next(self._source, None)
+
+    def _retry(self) -> _Chunk | None:
+        if self._failure is not None or not self._retries:
+            return None
+        return self._retries.popleft()
+
+    def _cut(self) -> _Cut:
+        cut = _Cut(offset=self._offset, limit=self.target, max_bytes=self.policy.max_bytes)
+        if self._overflow is not None:
+            cut.add(self._overflow)
+            self._overflow = None
+        return cut
+
+    def _take(self, cut: _Cut) -> _Chunk | None:
+        self._overflow = cut.overflow
+        self._offset += len(cut.items)
+        if not cut.items:
+            self._stopped = True
+            return None
+        return _Chunk(offset=cut.offset, items=cut.items)
+
+    def succeeded(self, chunk: _Chunk, response: FlureeResponse, latency: float) -> ChunkResult:
+        """Record a committed chunk and adapt the chunk size to its latency.
+
+        A body that is not valid JSON still records the chunk, without `t` and `tx_id`.
+        """
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        details = body if isinstance(body, dict) else {}
+        result = ChunkResult(
+            offset=chunk.offset,
+            count=len(chunk.items),
+            size=chunk.size,
+            latency=latency,
+            t=details.get("t"),
+            tx_id=details.get("tx-id"),
+        )
+        with self._lock:
+            self._results.append(result)
+            if latency <= self.policy.target_latency:
+                grown = max(self.target + 1, int(self.target * self.policy.growth))
+                self.target = min(self.policy.max_items, grown)
+            else:
+                self._shrink()
+        return result
+
+    def failed(
+        self, chunk: _Chunk, error: Exception | None, response: FlureeResponse | None
+    ) -> None:
+        """Split and requeue a failed chunk, or stop the commit when it cannot be retried."""
+        retryable = self._retryable(error, response)
+        with self._lock:
+            self._shrink()
+            if retryable and chunk.attempts < self.policy.max_retries:
+                middle = (len(chunk.items) + 1) // 2
+                halves = [
+                    _Chunk(offset=chunk.offset + start, items=part, attempts=chunk.attempts + 1)
+                    for start, part in ((0, chunk.items[:middle]), (middle, chunk.items[middle:]))
+                    if part
+                ]
+                self._retries.extendleft(reversed(halves))
+                return
+            reason = f"status {response.status_code}" if response is not None else error
+            self._stop(
+                f"Chunk at item {chunk.offset} of {len(chunk.items)} items failed: {reason}",
+                error,
+                response,
+            )
+
+    def aborted(self, result: ChunkResult, error: Exception) -> None:
+        """Stop the commit after the `on_commit` callback raised for a committed chunk."""
+        with self._lock:
+            self._stop(f"on_commit failed for the chunk at item {result.offset}: {error}", error)
+
+    def _stop(
+        self, message: str, error: Exception | None, response: FlureeResponse | None = None
+    ) -> None:
+        """Stop handing out chunks and keep the first failure; call with the lock held."""
+        self._stopped = True
+        if self._failure is None:
+            self._failure = ChunkedCommitError(
+                message, committed=ChunkedCommitResult(chunks=[]), response=response
+            )
+            self._failure.__cause__ = error
+
+    def _retryable(self, error: Exception | None, response: FlureeResponse | None) -> bool:
+        """Check if a failed chunk may be sent again under the policy."""
+        if response is None:
+            if isinstance(error, _UNSENT_ERRORS):
+                return True
+            return self.policy.retry_ambiguous and isinstance(error, TransportError)
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            return True
+        ambiguous = (
+            response.status_code in AMBIGUOUS_STATUS_CODES or response.response.is_server_error
+        )
+        return self.policy.retry_ambiguous and ambiguous
+
+    def result(self) -> ChunkedCommitResult:
+        """Return the committed chunks in insert order.
+
+        Exceptions:
+            ChunkedCommitError: If a chunk failed for good.
+        """
+        with self._lock:
+            committed = ChunkedCommitResult(chunks=sorted(self._results, key=lambda c: c.offset))
+            if self._failure is not None:
+                self._failure.committed = committed
+                raise self._failure
+            return committed
+
+    def _shrink(self) -> None:
+        self.target = max(self.policy.min_items, int(self.target * self.policy.shrink))
+
+
+def commit_chunked(
+    session: FlureeSession,
+    insert: ChunkedInsert,
+    policy: ChunkPolicy,
+    on_commit: Callable[[ChunkResult], None] | None = None,
+) -> ChunkedCommitResult:
+    """Commit the insert's items as chunks pipelined over a thread pool.
+
+    `on_commit` is called with each committed chunk, from the worker threads.
+    If it raises, no further chunks are sent and the commit fails.
+
+    Exceptions:
+        ChunkedCommitError: If a chunk fails and cannot be retried.
+    """
+    planner = ChunkPlanner(items=insert.items, policy=policy)
+
+    def worker() -> None:
+        while (chunk := planner.next()) is not None:
+            start = time.monotonic()
+            try:
+                response = session.execute(insert.request_for(chunk))
+            except Exception as e:
+                planner.failed(chunk, e, None)
+                continue
+            if not response.is_success:
+                planner.failed(chunk, None, response)
+                continue
+            result = planner.succeeded(chunk, response, time.monotonic() - start)
+            if on_commit is not None:
+                try:
+                    on_commit(result)
+                except Exception as e:
+                    planner.aborted(result, e)
+
+    with ThreadPoolExecutor(
+        max_workers=policy.concurrency, thread_name_prefix="fluree-chunk"
+    ) as executor:
+        for future in [executor.submit(worker) for _ in range(policy.concurrency)]:
+            future.result()
+    return planner.result()
+
+
+async def acommit_chunked(
+    session: FlureeSession,
+    insert: ChunkedInsert,
+    policy: ChunkPolicy,
+    on_commit: Callable[[ChunkResult], None] | None = None,
+) -> ChunkedCommitResult:
+    """Commit the insert's items as chunks pipelined over the async pool.
+
+    `on_commit` is called with each committed chunk. If it raises, no further
+    chunks are sent and the commit fails.
+
+    Exceptions:
+        ChunkedCommitError: If a chunk fails and cannot be retried.
+    """
+    planner = ChunkPlanner(items=insert.items, policy=policy)
+
+    async def worker() -> None:
+        while (chunk := await planner.anext()) is not None:
+            start = time.monotonic()
+            try:
+                response = await session.aexecute(insert.request_for(chunk))
+            except Exception as e:
+                planner.failed(chunk, e, None)
+                continue
+            if not response.is_success:
+                planner.failed(chunk, None, response)
+                continue
+            result = planner.succeeded(chunk, response, time.monotonic() - start)
+            if on_commit is not None:
+                try:
+                    on_commit(result)
+                except Exception as e:
+                    planner.aborted(result, e)
+
+    # Wait for every worker before raising, so none outlives the commit
+    outcomes = await asyncio.gather(
+        *(worker() for _ in range(policy.concurrency)), return_exceptions=True
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return planner.result()
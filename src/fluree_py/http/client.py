@@ -1,16 +1,285 @@
-from dataclasses import dataclass
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Literal, Self, overload
 
+from httpx import Limits, Timeout
+
+from fluree_py.http.balancer import (
+    BalancingStrategy,
+    HealthPolicy,
+    NodeMetrics,
+    NodePool,
+    RoundRobin,
+)
+from fluree_py.http.batch import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_WORKERS,
+    commit_many,
+    execute_many,
+)
+from fluree_py.http.cache import ResultCache
+from fluree_py.http.codec import JsonCodec, default_codec
 from fluree_py.http.ledger import LedgerSelected
 from fluree_py.http.protocol.ledger import SupportsLedgerOperations
+from fluree_py.http.protocol.mixin.request import SupportsRequestCreation
+from fluree_py.http.response import FlureeResponse
+from fluree_py.http.routing import RequestRouter
+from fluree_py.http.session import DEFAULT_LIMITS, DEFAULT_TIMEOUT, FlureeSession
 from fluree_py.types.common import LedgerName
 
 
 @dataclass(frozen=True, kw_only=True)
 class FlureeClient:
-    """Client for interacting with Fluree databases."""
+    """Client for interacting with Fluree databases.
+
+    The client owns a pooled session that every builder created from it shares,
+    so connections are kept alive between requests. Close the client (or use it
+    as a context manager) to release them. Pass `http2=True` to multiplex
+    concurrent requests over HTTP/2 where the server supports it, and
+    `http1=False` as well to use HTTP/2 with prior knowledge, as needed for
+    cleartext HTTP/2 (h2c) on `http://` URLs.
+
+    Give `base_urls` instead of `base_url` to spread requests over several
+    Fluree nodes using the `balancer` strategy. Nodes that keep failing are
+    ejected for a while according to the `health` policy.
+
+    Give `replica_urls` to send read-only requests (queries and history) to a
+    pool of replicas while transactions and ledger creation stay on the primary
+    node(s). With `read_your_writes` set to a number of seconds, reads of a
+    ledger return to the primary for that long after a successful write to it.
+
+    Pass `coalesce=True` to let concurrent identical queries and history
+    requests share one in-flight HTTP request and its response.
+
+    Give a `cache`, such as `MemoryResultCache`, to serve repeated queries and
+    history requests without the network. Successful transactions and ledger
+    creations through this client invalidate the cached results of their ledger.
+    Queries and history requests pinned to fixed commits use `pinned_cache`
+    instead when one is given, typically a `DiskResultCache` kept across runs.
+
+    Request payloads are serialized, and responses parsed, with `codec`, by
+    default the fastest of `OrjsonCodec`, `MsgspecCodec` and `StdlibJsonCodec`
+    that is installed.
+
+    A `default_context` is sent with every request of the client's builders,
+    merged under any context given with `with_context()`. It is serialized once
+    when the client is created.
+
+    Example:
+        >>> limits = httpx.Limits(max_connections=50, keepalive_expiry=30.0)
+        >>> with FlureeClient(base_url="http://localhost:8090", limits=limits) as client:
+        ...     client.with_ledger("example/ledger").query().with_select(["*"]).commit()
 
-    base_url: str
+        >>> client = FlureeClient(
+        ...     base_urls=["http://node-a:8090", "http://node-b:8090"],
+        ...     balancer=EwmaLatency(),
+        ... )
+
+        >>> client = FlureeClient(
+        ...     base_url="http://primary:8090",
+        ...     replica_urls=["http://replica-a:8090", "http://replica-b:8090"],
+        ...     read_your_writes=2.0,
+        ... )
+
+    Exceptions:
+        ValueError: If neither or both of base_url and base_urls are given,
+            read_your_writes is negative, or both http1 and http2 are disabled.
+    """
+
+    base_url: str | None = None
+    base_urls: Sequence[str] = ()
+    limits: Limits = field(default_factory=lambda: DEFAULT_LIMITS)
+    timeout: Timeout | float | None = field(default_factory=lambda: DEFAULT_TIMEOUT)
+    http1: bool = True
+    http2: bool = False
+    balancer: BalancingStrategy = field(default_factory=RoundRobin)
+    health: HealthPolicy = field(default_factory=HealthPolicy)
+    replica_urls: Sequence[str] = ()
+    read_your_writes: float | None = None
+    coalesce: bool = False
+    cache: ResultCache | None = None
+    pinned_cache: ResultCache | None = None
+    codec: JsonCodec = field(default_factory=default_codec)
+    default_context: dict[str, Any] | None = None
+    session: FlureeSession = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if (self.base_url is None) == (not self.base_urls):
+            raise ValueError("Exactly one of base_url or base_urls must be given")
+
+        if self.read_your_writes is not None and self.read_your_writes < 0:
+            raise ValueError(f"read_your_writes must not be negative, got {self.read_your_writes}")
+
+        router = None
+        if len(self.base_urls) > 1 or self.replica_urls:
+            router = RequestRouter(
+                base_url=self.url,
+                primary=NodePool(
+                    urls=self.base_urls or [self.url],
+                    strategy=self.balancer,
+                    health=self.health,
+                ),
+                replicas=NodePool(
+                    urls=self.replica_urls, strategy=self.balancer, health=self.health
+                )
+                if self.replica_urls
+                else None,
+                read_your_writes=self.read_your_writes,
+            )
+
+        session = FlureeSession(
+            limits=self.limits,
+            timeout=self.timeout,
+            http1=self.http1,
+            http2=self.http2,
+            router=router,
+            coalesce=self.coalesce,
+            cache=self.cache,
+            pinned_cache=self.pinned_cache,
+            codec=self.codec,
+            default_context=self.default_context,
+        )
+        object.__setattr__(self, "session", session)
+
+    @property
+    def url(self) -> str:
+        """The base URL builders address; the first node when several are given."""
+        return self.base_url if self.base_url is not None else self.base_urls[0]
 
     def with_ledger(self, ledger: LedgerName) -> SupportsLedgerOperations:
         """Select a ledger to operate on."""
-        return LedgerSelected(base_url=self.base_url, ledger=ledger)
+        return LedgerSelected(base_url=self.url, ledger=ledger, session=self.session)
+
+    def node_metrics(self) -> list[NodeMetrics]:
+        """Snapshot per-node request, failure, latency and ejection statistics.
+
+        Primary nodes are listed before replica nodes. A client with a single
+        base URL and no replicas reports no nodes.
+        """
+        if self.session.router is None:
+            return []
+        return self.session.router.metrics()
+
+    @overload
+    async def execute_many(
+        self,
+        builders: Iterable[SupportsRequestCreation],
+        *,
+        concurrency: int = ...,
+        ordered: bool = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[FlureeResponse]: ...
+
+    @overload
+    async def execute_many(
+        self,
+        builders: Iterable[SupportsRequestCreation],
+        *,
+        concurrency: int = ...,
+        ordered: bool = ...,
+        return_exceptions: Literal[True],
+    ) -> list[FlureeResponse | Exception]: ...
+
+    async def execute_many(
+        self,
+        builders: Iterable[SupportsRequestCreation],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> list[FlureeResponse] | list[FlureeResponse | Exception]:
+        """Execute many builders concurrently over the client's async pool.
+
+        See `fluree_py.http.batch.execute_many` for the ordering and error modes.
+
+        Exceptions:
+            ValueError: If concurrency is less than one.
+            httpx.RequestError: If a request fails and return_exceptions is False.
+        """
+        if return_exceptions:
+            return await execute_many(
+                self.session,
+                builders,
+                concurrency=concurrency,
+                ordered=ordered,
+                return_exceptions=True,
+            )
+        return await execute_many(self.session, builders, concurrency=concurrency, ordered=ordered)
+
+    @overload
+    def commit_many(
+        self,
+        builders: Iterable[SupportsRequestCreation],
+        *,
+        max_workers: int = ...,
+        timeout: float | None = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[FlureeResponse]: ...
+
+    @overload
+    def commit_many(
+        self,
+        builders: Iterable[SupportsRequestCreation],
+        *,
+        max_workers: int = ...,
+        timeout: float | None = ...,
+        return_exceptions: Literal[True],
+    ) -> list[FlureeResponse | Exception]: ...
+
+    def commit_many(
+        self,
+        builders: Iterable[SupportsRequestCreation],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[FlureeResponse] | list[FlureeResponse | Exception]:
+        """Execute many builders on a thread pool sharing the client's sync pool.
+
+        See `fluree_py.http.batch.commit_many` for the deadline and error modes.
+
+        Exceptions:
+            ValueError: If max_workers is less than one.
+            TimeoutError: If the deadline passes and return_exceptions is False.
+            httpx.RequestError: If a request fails and return_exceptions is False.
+        """
+        if return_exceptions:
+            return commit_many(
+                self.session,
+                builders,
+                max_workers=max_workers,
+                timeout=timeout,
+                return_exceptions=True,
+            )
+        return commit_many(self.session, builders, max_workers=max_workers, timeout=timeout)
+
+    def close(self) -> None:
+        """Close the client's pooled connections."""
+        self.session.close()
+
+    async def aclose(self) -> None:
+        """Close the client's pooled connections, including the async pool."""
+        await self.session.aclose()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,119 @@
+"""JSON codecs used to serialize request payloads and parse responses."""
+
+import json
+from dataclasses import dataclass, field
+from functools import cache
+from importlib import import_module
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Any, Protocol
+
+JSON_CONTENT_TYPE = "application/json"
+"""Content-Type sent with every encoded payload."""
+
+
+class JsonCodec(Protocol):
+    """Protocol for turning payloads into JSON bytes and response bodies back."""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize a payload to compact UTF-8 encoded JSON."""
+        ...
+
+    def loads(self, data: bytes) -> Any:
+        """Parse a UTF-8 encoded JSON document.
+
+        Exceptions:
+            ValueError: If the data is not valid JSON.
+        """
+        ...
+
+
+@dataclass(frozen=True, kw_only=True)
+class StdlibJsonCodec:
+    """Use the standard library, encoding byte for byte like `httpx` does."""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize a payload to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+    def loads(self, data: bytes) -> Any:
+        """Parse a UTF-8 encoded JSON document."""
+        return json.loads(data)
+
+
+def _require(module: str) -> ModuleType:
+    if find_spec(module) is None:
+        raise ImportError(
+            f"The '{module}' package is not installed. "
+            f"Install it with `pip install fluree-py[{module}]`."
+        )
+    return import_module(module)
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrjsonCodec:
+    """Use `orjson`, which works on bytes directly and is several times faster.
+
+    Exceptions:
+        ImportError: If orjson is not installed.
+    """
+
+    _orjson: ModuleType = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_orjson", _require("orjson"))
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize a payload to compact UTF-8 encoded JSON."""
+        return self._orjson.dumps(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes) -> Any:
+        """Parse a UTF-8 encoded JSON document."""
+        return self._orjson.loads(data)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MsgspecCodec:
+    """Use `msgspec`, which works on bytes directly and is several times faster.
+
+    Exceptions:
+        ImportError: If msgspec is not installed.
+    """
+
+    _json: ModuleType = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        _require("msgspec")
+        object.__setattr__(self, "_json", import_module("msgspec.json"))
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize a payload to compact UTF-8 encoded JSON."""
+        return self._json.encode(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes) -> Any:
+        """Parse a UTF-8 encoded JSON document."""
+        return self._json.decode(data)
+
+
+def prepend_member(name: str, value: bytes, payload: bytes) -> bytes:
+    """Splice an encoded value in front of the members of an encoded object.
+
+    `name` is written as is, so it must not need escaping.
+
+    Example:
+        >>> prepend_member("@context", b'{"ex":"http://example.org/"}', b'{"from":"ledger"}')
+        b'{"@context":{"ex":"http://example.org/"},"from":"ledger"}'
+    """
+    body = payload.lstrip()[1:].lstrip()
+    separator = b"" if body.startswith(b"}") else b","
+    return b'{"' + name.encode() + b'":' + value + separator + body
+
+
+@cache
+def default_codec() -> JsonCodec:
+    """Pick the fastest installed codec: orjson, then msgspec, then the stdlib."""
+    if find_spec("orjson") is not None:
+        return OrjsonCodec()
+    if find_spec("msgspec") is not None:
+        return MsgspecCodec()
+    return StdlibJsonCodec()
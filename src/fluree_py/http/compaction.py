@@ -0,0 +1,217 @@
+"""Compaction of full IRIs in insert and delete payloads to prefixed names."""
+
+import re
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+COMPACTED_KEYS = ("insert", "delete")
+"""Payload members whose node data is compacted."""
+
+_ABSOLUTE_IRI = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://")
+_PREFIX_CHARS = re.compile(r"[^a-z0-9]")
+_MAX_PREFIX_LENGTH = 12
+
+
+@dataclass(frozen=True, kw_only=True)
+class CompactionResult:
+    """A payload with compacted IRIs and the prefixes that were added for it."""
+
+    payload: dict[str, Any]
+    prefixes: dict[str, str]
+    bytes_saved: int
+
+
+def _split(iri: str) -> tuple[str, str] | None:
+    """Split an absolute IRI into a namespace ending in '/' or '#' and a local name."""
+    if not _ABSOLUTE_IRI.match(iri):
+        return None
+    cut = max(iri.rfind("/"), iri.rfind("#")) + 1
+    namespace, local = iri[:cut], iri[cut:]
+    # "p:" and "p://..." do not expand back to the same IRI
+    if not local or local.startswith("//") or namespace.endswith("://"):
+        return None
+    return namespace, local
+
+
+def _names(node: Any) -> Iterator[Any]:
+    """Yield the property keys and `@id`/`@type` values of node data.
+
+    Literal values, including JSON literals under `@value`, are not visited and
+    neither are nodes that carry their own `@context`.
+    """
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, dict) and "@context" not in value:
+            for key, member in value.items():
+                if key in ("@id", "@type"):
+                    yield from (member if isinstance(member, list) else [member])
+                elif key != "@value":
+                    yield key
+                    stack.append(member)
+
+
+def _prefix_name(namespace: str, taken: set[str]) -> str:
+    """Derive an unused, readable prefix such as "schema" for a namespace."""
+    parts = urlsplit(namespace)
+    segments = [s for s in re.split(r"[/#]", parts.path) if s]
+    labels = [label for label in (parts.hostname or "").split(".") if label != "www"]
+    for candidate in [*reversed(segments), *labels[:1], "ns"]:
+        base = _PREFIX_CHARS.sub("", candidate.lower())[:_MAX_PREFIX_LENGTH]
+        if base and base[0].isalpha():
+            break
+    else:
+        base = "ns"
+    name, counter = base, 1
+    while name in taken:
+        name, counter = f"{base}{counter}", counter + 1
+    return name
+
+
+def _size(text: str) -> int:
+    return len(text.encode())
+
+
+def _rewrite(node: Any, curies: Mapping[str, str], kept: Counter[str]) -> Any:
+    """Copy node data with every compactable IRI replaced by its prefixed name.
+
+    A key is left as is when its prefixed name is also a key of the same node,
+    so both values survive; such keys are counted in `kept`.
+    """
+    if isinstance(node, list):
+        return [_rewrite(item, curies, kept) for item in node]
+    if not isinstance(node, dict) or "@context" in node:
+        return node
+
+    result: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("@id", "@type"):
+            if isinstance(value, list):
+                result[key] = [curies.get(v, v) if isinstance(v, str) else v for v in value]
+            else:
+                result[key] = curies.get(value, value) if isinstance(value, str) else value
+        elif key == "@value":
+            result[key] = value
+        else:
+            compact = curies.get(key, key)
+            if compact != key and compact in node:
+                kept[key] += 1
+                compact = key
+            result[compact] = _rewrite(value, curies, kept)
+    return result
+
+
+def _choose_prefixes(
+    usage: Counter[str],
+    splits: Mapping[str, tuple[str, str]],
+    context: Mapping[str, Any],
+    taken: set[str],
+) -> tuple[dict[str, str], dict[str, str], int]:
+    """Pick the prefix each namespace in use is compacted with, if any.
+
+    Namespaces the context already defines reuse its term. Others get a new
+    prefix, added to `taken`, when it saves more bytes than its definition
+    costs. Returns the prefix of each namespace, the new prefixes and the bytes
+    their definitions cost.
+    """
+    namespace_usage: Counter[str] = Counter()
+    namespace_bytes: Counter[str] = Counter()
+    for iri, count in usage.items():
+        namespace, _ = splits[iri]
+        namespace_usage[namespace] += count
+        namespace_bytes[namespace] += count * _size(namespace)
+
+    known = {
+        value: term
+        for term, value in context.items()
+        if isinstance(value, str) and not term.startswith("@")
+    }
+    names: dict[str, str] = {}
+    prefixes: dict[str, str] = {}
+    total = 0
+    for namespace, size in namespace_bytes.most_common():
+        if namespace in known:
+            names[namespace] = known[namespace]
+            continue
+        name = _prefix_name(namespace, taken)
+        # Defining the prefix costs "name":"namespace", in the context
+        cost = _size(name) + _size(namespace) + 6
+        if size - namespace_usage[namespace] * (_size(name) + 1) <= cost:
+            continue
+        taken.add(name)
+        names[namespace] = name
+        prefixes[name] = namespace
+        total += cost
+    return names, prefixes, total
+
+
+def compact_payload(
+    payload: Mapping[str, Any], *, context: Mapping[str, Any] | None = None
+) -> CompactionResult:
+    """Rewrite full IRIs in the insert and delete data of a payload as prefixed names.
+
+    Property keys and `@id`/`@type` values that are absolute IRIs are replaced
+    by compact IRIs such as `schema:name`, and the prefixes are merged into the
+    payload's `@context`. Prefixes already in `context` (typically the merged
+    default and payload contexts) are reused; new ones are only added when they
+    save more bytes than their definition costs, and never shadow a term that
+    is already defined. Literal values are left untouched and nodes carrying
+    their own `@context` are skipped, so the data expands to the same IRIs.
+
+    `bytes_saved` is the size difference of the payload encoded as compact JSON.
+
+    Example:
+        >>> result = compact_payload({"ledger": "ex", "insert": data})
+        >>> result.prefixes, result.bytes_saved
+        ({'schema': 'http://schema.org/'}, 4096)
+    """
+    if context is None:
+        context = payload.get("@context") or {}
+    sources = {key: payload[key] for key in COMPACTED_KEYS if payload.get(key)}
+
+    # Every term and prefix in use is off limits for new prefixes, so a plain
+    # key like "schema" never starts expanding as a prefix
+    taken = set(context)
+    usage: Counter[str] = Counter()
+    splits: dict[str, tuple[str, str]] = {}
+    for data in sources.values():
+        for name in _names(data):
+            if not isinstance(name, str):
+                continue
+            split = splits.get(name) or _split(name)
+            if split is None:
+                taken.update((name, name.split(":", 1)[0]))
+                continue
+            splits[name] = split
+            usage[name] += 1
+
+    names, prefixes, cost = _choose_prefixes(usage, splits, context, taken)
+    saved = -cost
+
+    curies: dict[str, str] = {}
+    for iri, count in usage.items():
+        namespace, local = splits[iri]
+        if (name := names.get(namespace)) is not None:
+            curies[iri] = f"{name}:{local}"
+            saved += count * (_size(iri) - _size(curies[iri]))
+
+    compacted = dict(payload)
+    if not curies:
+        return CompactionResult(payload=compacted, prefixes={}, bytes_saved=0)
+
+    kept: Counter[str] = Counter()
+    for key, data in sources.items():
+        compacted[key] = _rewrite(data, curies, kept)
+    saved -= sum(count * (_size(iri) - _size(curies[iri])) for iri, count in kept.items())
+    if prefixes:
+        if not context:
+            # A new "@context":{}, member, less the trailing comma of the last prefix
+            saved -= 13
+        context = {**(compacted.pop("@context", None) or {}), **prefixes}
+        compacted = {"@context": context, **compacted}
+    return CompactionResult(payload=compacted, prefixes=prefixes, bytes_saved=saved)
@@ -1,22 +1,25 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from fluree_py.http.mixin import (
     CommitableMixin,
+    CompactionMixin,
     RequestMixin,
     WithContextMixin,
     WithInsertMixin,
 )
 from fluree_py.http.protocol.endpoint.create import CreateBuilder, CreateReadyToCommit
+from fluree_py.http.session import FlureeSession
 from fluree_py.types.common import JsonArray, JsonObject
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CreateReadyToCommitImpl(
     RequestMixin,
     WithContextMixin["CreateReadyToCommitImpl"],
     WithInsertMixin["CreateReadyToCommitImpl"],
     CommitableMixin["CreateReadyToCommitImpl"],
+    CompactionMixin,
     CreateReadyToCommit,
 ):
     """Implementation of a create operation ready to be committed."""
@@ -25,6 +28,8 @@ class CreateReadyToCommitImpl(
     ledger: str
     data: JsonObject | JsonArray | None
     context: dict[str, Any] | None = None
+    compact_iris: bool = False
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
 
     def get_url(self) -> str:
         """Get the endpoint URL for the create operation."""
@@ -32,6 +37,12 @@ class CreateReadyToCommitImpl(
 
     def build_request_payload(self) -> dict[str, Any]:
         """Build the request payload for the create operation."""
+        if self.compact_iris:
+            return self.compaction().payload
+        return self.build_uncompacted_payload()
+
+    def build_uncompacted_payload(self) -> dict[str, Any]:
+        """Build the create payload with IRIs as given."""
         result: dict[str, Any] = {}
         if self.context:
             result["@context"] = self.context
@@ -39,7 +50,7 @@ class CreateReadyToCommitImpl(
         return result
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CreateBuilderImpl(
     WithContextMixin["CreateBuilderImpl"],
     WithInsertMixin[CreateReadyToCommitImpl],
@@ -51,3 +62,4 @@ class CreateBuilderImpl(
     ledger: str
     data: JsonObject | JsonArray | None = None
     context: dict[str, Any] | None = None
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
@@ -1,31 +1,37 @@
-from dataclasses import dataclass, replace
-from typing import Any
+from dataclasses import dataclass, field, replace
+from typing import Any, ClassVar
 
 from fluree_py.http.mixin import (
     CommitableMixin,
     RequestMixin,
+    StreamMixin,
     WithContextMixin,
 )
 from fluree_py.http.protocol.endpoint import HistoryBuilder
+from fluree_py.http.session import FlureeSession
 from fluree_py.types.common import TimeClause
 from fluree_py.types.http.history import HistoryClause
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class HistoryBuilderImpl(
     RequestMixin,
     WithContextMixin["HistoryBuilderImpl"],
     CommitableMixin["HistoryBuilderImpl"],
+    StreamMixin["HistoryBuilderImpl"],
     HistoryBuilder,
 ):
     """Implementation of a history query builder."""
 
+    read_only: ClassVar[bool] = True
+
     endpoint: str
     ledger: str
     context: dict[str, Any] | None = None
     history: HistoryClause | None = None
     t: TimeClause | None = None
     commit_details: bool | None = None
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
 
     def with_history(self, history: HistoryClause) -> "HistoryBuilderImpl":
         """Add history clause to the query."""
@@ -1,9 +1,10 @@
-from dataclasses import dataclass, replace
-from typing import Any, Self
+from dataclasses import dataclass, field, replace
+from typing import Any, ClassVar, Self
 
 from fluree_py.http.mixin import (
     CommitableMixin,
     RequestMixin,
+    StreamMixin,
     WithContextMixin,
     WithWhereMixin,
 )
@@ -14,20 +15,25 @@ from fluree_py.http.protocol.endpoint.query import (
     QueryBuilder,
     ActiveIdentity,
 )
+from fluree_py.http.session import FlureeSession
+from fluree_py.types.common import TimeClause
 from fluree_py.types.query.select import SelectArray, SelectObject
 from fluree_py.types.query.where import WhereClause
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class QueryBuilderImpl(
     WithContextMixin["QueryBuilderImpl"],
     WithWhereMixin["QueryBuilderImpl"],
     RequestMixin,
     CommitableMixin["QueryBuilderImpl"],
+    StreamMixin["QueryBuilderImpl"],
     QueryBuilder,
 ):
     """Implementation of a query operation builder."""
 
+    read_only: ClassVar[bool] = True
+
     endpoint: str
     ledger: str
     context: dict[str, Any] | None = None
@@ -37,6 +43,8 @@ class QueryBuilderImpl(
     order_by: OrderByClause | None = None
     opts: ActiveIdentity | None = None
     select_fields: dict[str, Any] | list[str] | None = None
+    t: TimeClause | None = None
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
 
     def with_group_by(self, fields: GroupByClause) -> Self:
         """Add group by clause to the query."""
@@ -58,6 +66,10 @@ class QueryBuilderImpl(
         """Add select fields to the query."""
         return replace(self, select_fields=fields)
 
+    def with_t(self, t: TimeClause) -> Self:
+        """Add time clause to the query."""
+        return replace(self, t=t)
+
     def get_url(self) -> str:
         """Get the endpoint URL for the query operation."""
         return self.endpoint
@@ -80,4 +92,6 @@ class QueryBuilderImpl(
             result["opts"] = self.opts
         if self.select_fields:
             result["select"] = self.select_fields
+        if self.t is not None:
+            result["t"] = self.t
         return result
@@ -1,22 +1,36 @@
-from dataclasses import dataclass, replace
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass, field, replace
 from typing import Any
 
+from httpx import URL
+
+from fluree_py.http.chunked import (
+    ChunkedCommitResult,
+    ChunkedInsert,
+    ChunkPolicy,
+    acommit_chunked,
+    commit_chunked,
+)
 from fluree_py.http.mixin import (
     CommitableMixin,
+    CompactionMixin,
     RequestMixin,
     WithContextMixin,
     WithInsertMixin,
     WithWhereMixin,
 )
+from fluree_py.http.mixin.utils import copy_with
 from fluree_py.http.protocol.endpoint import (
     TransactionBuilder,
     TransactionReadyToCommit,
+    TransactionStream,
 )
+from fluree_py.http.session import FlureeSession
 from fluree_py.types.query.where import WhereClause
 from fluree_py.types.common import JsonArray, JsonObject
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TransactionBuilderImpl(
     WithContextMixin["TransactionBuilderImpl"],
     WithInsertMixin["TransactionReadyToCommitImpl"],
@@ -31,22 +45,58 @@ class TransactionBuilderImpl(
     where: WhereClause | None = None
     data: JsonObject | JsonArray | None = None
     delete_data: JsonObject | JsonArray | None = None
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
 
     def with_delete(
         self, data: JsonObject | JsonArray
     ) -> "TransactionReadyToCommitImpl":
         """Add delete operation to the transaction."""
-        updated_fields = self.__dict__.copy()
-        updated_fields["delete_data"] = data
-        return TransactionReadyToCommitImpl(**updated_fields)
+        return copy_with(self, TransactionReadyToCommitImpl, delete_data=data)
+
+    def with_insert_stream(
+        self,
+        source: Iterable[JsonObject] | AsyncIterable[JsonObject],
+        *,
+        batch_size: int = 500,
+        max_in_flight: int = 4,
+    ) -> "TransactionStreamImpl":
+        """Insert items consumed lazily from an iterator or async iterator.
+
+        The items are encoded and committed in batches of up to `batch_size`
+        items (and the policy's byte limit), at most `max_in_flight` batches at
+        a time. A batch is only pulled from the source once a commit slot is
+        free, so memory use does not grow with the size of the source.
 
+        Example:
+            >>> rows = ({"@id": f"ex:{i}", "ex:value": i} for i in range(10**7))
+            >>> ledger.transaction().with_insert_stream(rows).commit().items
+            10000000
 
-@dataclass(frozen=True, kw_only=True)
+        Exceptions:
+            ValueError: If the transaction has a where or delete clause, or a size is not positive.
+        """
+        if self.where or self.delete_data:
+            raise ValueError("Only insert-only transactions can be streamed")
+        policy = ChunkPolicy(
+            initial_items=batch_size, max_items=batch_size, concurrency=max_in_flight
+        )
+        return TransactionStreamImpl(
+            endpoint=self.endpoint,
+            ledger=self.ledger,
+            context=self.context,
+            source=source,
+            policy=policy,
+            session=self.session,
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TransactionReadyToCommitImpl(
     RequestMixin,
     WithContextMixin["TransactionReadyToCommitImpl"],
     WithWhereMixin["TransactionReadyToCommitImpl"],
     CommitableMixin["TransactionReadyToCommitImpl"],
+    CompactionMixin,
     TransactionReadyToCommit,
 ):
     """Implementation of a transaction operation ready to be committed."""
@@ -57,6 +107,8 @@ class TransactionReadyToCommitImpl(
     where: WhereClause | None
     data: JsonObject | JsonArray | None
     delete_data: JsonObject | JsonArray | None
+    compact_iris: bool = False
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
 
     def with_delete(
         self, data: JsonObject | JsonArray
@@ -68,8 +120,64 @@ class TransactionReadyToCommitImpl(
         """Get the endpoint URL for the transaction operation."""
         return self.endpoint
 
+    def commit_chunked(self, policy: ChunkPolicy | None = None) -> ChunkedCommitResult:
+        """Commits a large insert as a pipeline of size-bounded transactions.
+
+        The insert array is split into chunks that the policy sizes by bytes and
+        item count and adapts to the observed commit latency. Each chunk is its
+        own transaction, so a failure leaves the earlier chunks committed.
+
+        Example:
+            >>> result = ledger.transaction().with_insert(rows).commit_chunked()
+            >>> result.items, result.t
+            (100000, 214)
+
+        Exceptions:
+            ChunkedCommitError: If a chunk fails and cannot be retried.
+            ValueError: If the transaction has a where or delete clause.
+        """
+        insert = self._chunked_insert()
+        policy = policy or ChunkPolicy()
+        if self.session is None:
+            with FlureeSession() as session:
+                return commit_chunked(session, insert, policy)
+        return commit_chunked(self.session, insert, policy)
+
+    async def acommit_chunked(self, policy: ChunkPolicy | None = None) -> ChunkedCommitResult:
+        """Commits a large insert as a pipeline of size-bounded transactions asynchronously.
+
+        Exceptions:
+            ChunkedCommitError: If a chunk fails and cannot be retried.
+            ValueError: If the transaction has a where or delete clause.
+        """
+        insert = self._chunked_insert()
+        policy = policy or ChunkPolicy()
+        if self.session is None:
+            async with FlureeSession() as session:
+                return await acommit_chunked(session, insert, policy)
+        return await acommit_chunked(self.session, insert, policy)
+
+    def _chunked_insert(self) -> ChunkedInsert:
+        if self.where or self.delete_data:
+            raise ValueError("Only insert-only transactions can be committed in chunks")
+        payload = self.build_request_payload()
+        data = payload.pop("insert", None) or []
+        items = data if isinstance(data, list) else [data]
+        return ChunkedInsert(
+            url=URL(self.get_url()),
+            ledger=self.ledger,
+            base=self.encode_payload(payload),
+            items=[self.codec.dumps(item) for item in items],
+        )
+
     def build_request_payload(self) -> dict[str, Any]:
         """Build the request payload for the transaction operation."""
+        if self.compact_iris:
+            return self.compaction().payload
+        return self.build_uncompacted_payload()
+
+    def build_uncompacted_payload(self) -> dict[str, Any]:
+        """Build the transaction payload with IRIs as given."""
         result: dict[str, Any] = {}
         if self.context:
             result["@context"] = self.context
@@ -81,3 +189,64 @@ class TransactionReadyToCommitImpl(
         if self.where:
             result["where"] = self.where
         return result
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TransactionStreamImpl(TransactionStream):
+    """Implementation of an insert streamed from an iterator in batches.
+
+    The source is consumed by the first commit, so a stream commits once.
+    """
+
+    endpoint: str
+    ledger: str
+    context: dict[str, Any] | None
+    source: Iterable[JsonObject] | AsyncIterable[JsonObject] = field(repr=False)
+    policy: ChunkPolicy
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
+
+    def commit(self) -> ChunkedCommitResult:
+        """Commits the streamed items batch by batch.
+
+        Exceptions:
+            ChunkedCommitError: If a batch fails and cannot be retried.
+            TypeError: If the source is an async iterator.
+        """
+        insert = self._chunked_insert()
+        if self.session is None:
+            with FlureeSession() as session:
+                return commit_chunked(session, insert, self.policy)
+        return commit_chunked(self.session, insert, self.policy)
+
+    async def acommit(self) -> ChunkedCommitResult:
+        """Commits the streamed items batch by batch asynchronously.
+
+        Exceptions:
+            ChunkedCommitError: If a batch fails and cannot be retried.
+        """
+        insert = self._chunked_insert()
+        if self.session is None:
+            async with FlureeSession() as session:
+                return await acommit_chunked(session, insert, self.policy)
+        return await acommit_chunked(self.session, insert, self.policy)
+
+    def _chunked_insert(self) -> ChunkedInsert:
+        # An empty transaction renders the payload around the insert data
+        base = TransactionReadyToCommitImpl(
+            endpoint=self.endpoint,
+            ledger=self.ledger,
+            context=self.context,
+            where=None,
+            data=None,
+            delete_data=None,
+            session=self.session,
+        )
+        dumps = base.codec.dumps
+        items: Iterable[bytes] | AsyncIterable[bytes]
+        if isinstance(self.source, AsyncIterable):
+            items = (dumps(item) async for item in self.source)
+        else:
+            items = map(dumps, self.source)
+        return ChunkedInsert(
+            url=URL(self.endpoint), ledger=self.ledger, base=base.encode_payload(), items=items
+        )
@@ -0,0 +1,39 @@
+"""Stable fingerprints identifying semantically identical requests."""
+
+import hashlib
+import json
+
+from httpx import URL, Request
+
+
+def canonical_body(content: bytes) -> bytes:
+    """Re-encode a JSON body with sorted keys and compact separators.
+
+    Bodies that are not valid JSON are returned unchanged.
+    """
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        return content
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def fingerprint(request: Request) -> str:
+    """Hash a request's method, URL and canonicalized body.
+
+    Requests whose JSON payloads only differ in key order or whitespace share
+    the same fingerprint.
+
+    Example:
+        >>> fingerprint(query.get_request())
+        '5f1d0c...'
+    """
+    return content_fingerprint(request.method, request.url, request.content)
+
+
+def content_fingerprint(method: str, url: URL | str, content: bytes) -> str:
+    """Hash the method, URL and canonicalized body of a request that is not built yet."""
+    digest = hashlib.sha256()
+    digest.update(f"{method} {url}\n".encode())
+    digest.update(canonical_body(content))
+    return digest.hexdigest()
@@ -0,0 +1,201 @@
+"""Group commit: merging small concurrent insert transactions into shared requests."""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self
+
+from httpx import URL
+
+from fluree_py.http.chunked import TransactionChunk
+from fluree_py.http.codec import prepend_member
+from fluree_py.http.endpoint.transact import TransactionReadyToCommitImpl
+from fluree_py.http.protocol.endpoint import TransactionReadyToCommit
+from fluree_py.http.response import FlureeResponse
+from fluree_py.http.session import FlureeSession
+
+_GroupKey = tuple[int, URL, bytes]
+
+
+@dataclass(kw_only=True)
+class _Group:
+    """Transactions collected for one merged request."""
+
+    session: FlureeSession
+    url: URL
+    ledger: str
+    base: bytes
+    deadline: float
+    parts: list[bytes] = field(default_factory=list)
+    futures: list[asyncio.Future[FlureeResponse]] = field(default_factory=list)
+    size: int = 0
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def request(self, parts: list[bytes]) -> TransactionChunk:
+        data = b"[" + b",".join(parts) + b"]"
+        return TransactionChunk(
+            url=self.url, ledger=self.ledger, content=prepend_member("insert", data, self.base)
+        )
+
+
+@dataclass(kw_only=True)
+class GroupCommitWriter:
+    """Commits concurrent insert-only transactions to the same ledger as one request.
+
+    Transactions with the same endpoint, ledger and context are collected for
+    up to `max_delay` seconds, or until `max_transactions` or `max_bytes` of
+    insert data are reached, and their insert data is sent as one transaction.
+    Every caller receives the shared response. While a merged request is in
+    flight the next group keeps filling, so each ledger has one request in
+    flight at a time and groups grow with the load.
+
+    When a merged request is rejected with a 4xx status, its transactions are retried one by one
+    (unless `isolate_failures` is off), so a single invalid insert only fails
+    its own caller. All transactions of a group commit, or fail, together
+    otherwise.
+
+    Transactions use the session of their builder, or one owned by the writer
+    and closed by `aclose()` when they were built without a client.
+
+    Example:
+        >>> async with GroupCommitWriter(max_delay=0.005) as writer:
+        ...     response = await writer.commit(ledger.transaction().with_insert(event))
+
+    Exceptions:
+        ValueError: If a limit is not positive.
+    """
+
+    max_delay: float = 0.005
+    max_transactions: int = 500
+    max_bytes: int = 1024 * 1024
+    isolate_failures: bool = True
+
+    _groups: dict[_GroupKey, deque[_Group]] = field(default_factory=dict, init=False)
+    _runners: dict[_GroupKey, asyncio.Task[None]] = field(default_factory=dict, init=False)
+    _session: FlureeSession | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_delay < 0 or self.max_transactions < 1 or self.max_bytes < 1:
+            raise ValueError("max_delay must not be negative and the size limits positive")
+
+    async def commit(self, transaction: TransactionReadyToCommit) -> FlureeResponse:
+        """Commits the transaction as part of the next request to its ledger.
+
+        Exceptions:
+            httpx.RequestError: If the merged request fails.
+            TypeError: If the transaction was not built by this library.
+            ValueError: If the transaction has a where or delete clause, or no insert data.
+        """
+        if not isinstance(transaction, TransactionReadyToCommitImpl):
+            raise TypeError(f"Cannot group commit {type(transaction).__name__}")
+        if transaction.where or transaction.delete_data or not transaction.data:
+            raise ValueError("Only transactions with insert data alone can be group committed")
+        payload = transaction.build_request_payload()
+        encoded = transaction.codec.dumps(payload.pop("insert"))
+        part = encoded.strip()[1:-1] if isinstance(transaction.data, list) else encoded
+        base = transaction.encode_payload(payload)
+        session = transaction.session or self._own_session()
+        url = URL(transaction.get_url())
+
+        loop = asyncio.get_running_loop()
+        key = (id(session), url, base)
+        groups = self._groups.setdefault(key, deque())
+        group = groups[-1] if groups else None
+        if group is None or group.full.is_set():
+            group = _Group(
+                session=session,
+                url=url,
+                ledger=transaction.ledger,
+                base=base,
+                deadline=loop.time() + self.max_delay,
+            )
+            groups.append(group)
+
+        future: asyncio.Future[FlureeResponse] = loop.create_future()
+        group.parts.append(part)
+        group.futures.append(future)
+        group.size += len(part) + 1
+        if len(group.parts) >= self.max_transactions or group.size >= self.max_bytes:
+            group.full.set()
+        if key not in self._runners:
+            self._runners[key] = asyncio.create_task(self._run(key))
+        return await future
+
+    async def flush(self) -> None:
+        """Sends every collected transaction now and waits for the responses."""
+        for groups in self._groups.values():
+            for group in groups:
+                group.full.set()
+        while self._runners:
+            await asyncio.gather(*self._runners.values(), return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Flushes the writer and closes the session it owns, if any."""
+        await self.flush()
+        if self._session is not None:
+            await self._session.aclose()
+
+    def _own_session(self) -> FlureeSession:
+        if self._session is None:
+            self._session = FlureeSession()
+        return self._session
+
+    async def _run(self, key: _GroupKey) -> None:
+        """Sends the groups of one key in order, one request at a time."""
+        loop = asyncio.get_running_loop()
+        groups = self._groups[key]
+        try:
+            while groups:
+                group = groups[0]
+                delay = group.deadline - loop.time()
+                if delay > 0 and not group.full.is_set():
+                    try:
+                        await asyncio.wait_for(group.full.wait(), delay)
+                    except TimeoutError:
+                        pass
+                group.full.set()
+                groups.popleft()
+                await self._send(group)
+        finally:
+            del self._runners[key]
+            if not groups:
+                del self._groups[key]
+
+    async def _send(self, group: _Group) -> None:
+        try:
+            response = await group.session.aexecute(group.request(group.parts))
+        except Exception as e:
+            for future in group.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        isolate = self.isolate_failures and response.response.is_client_error
+        if not isolate or len(group.parts) == 1:
+            for future in group.futures:
+                if not future.done():
+                    future.set_result(response)
+            return
+
+        async def alone(part: bytes, future: asyncio.Future[FlureeResponse]) -> None:
+            try:
+                result = await group.session.aexecute(group.request([part]))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+        await asyncio.gather(*map(alone, group.parts, group.futures))
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from fluree_py.http.endpoint import (
     CreateBuilderImpl,
@@ -12,35 +12,45 @@ from fluree_py.http.protocol import (
     QueryBuilder,
     TransactionBuilder,
 )
+from fluree_py.http.session import FlureeSession
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LedgerSelected:
     """Selected ledger for operations."""
 
     base_url: str
     ledger: str
+    session: FlureeSession | None = field(default=None, repr=False, compare=False)
 
     def create(self) -> CreateBuilder:
         """Create a new ledger."""
         return CreateBuilderImpl(
-            endpoint=f"{self.base_url}/fluree/create", ledger=self.ledger
+            endpoint=f"{self.base_url}/fluree/create",
+            ledger=self.ledger,
+            session=self.session,
         )
 
     def transaction(self) -> TransactionBuilder:
         """Execute ledger transactions."""
         return TransactionBuilderImpl(
-            endpoint=f"{self.base_url}/fluree/transact", ledger=self.ledger
+            endpoint=f"{self.base_url}/fluree/transact",
+            ledger=self.ledger,
+            session=self.session,
         )
 
     def query(self) -> QueryBuilder:
         """Query the ledger."""
         return QueryBuilderImpl(
-            endpoint=f"{self.base_url}/fluree/query", ledger=self.ledger
+            endpoint=f"{self.base_url}/fluree/query",
+            ledger=self.ledger,
+            session=self.session,
         )
 
     def history(self) -> HistoryBuilder:
         """Query ledger history."""
         return HistoryBuilderImpl(
-            endpoint=f"{self.base_url}/fluree/history", ledger=self.ledger
+            endpoint=f"{self.base_url}/fluree/history",
+            ledger=self.ledger,
+            session=self.session,
         )
@@ -1,16 +1,21 @@
 """Mixins for Fluree ledger operations providing request handling, data insertion, context management, and commit capabilities."""
 
 from fluree_py.http.mixin.commit import CommitMixin, AsyncCommitMixin, CommitableMixin
+from fluree_py.http.mixin.compaction import CompactionMixin
 from fluree_py.http.mixin.context import WithContextMixin
 from fluree_py.http.mixin.insert import WithInsertMixin
-from fluree_py.http.mixin.request import RequestMixin
+from fluree_py.http.mixin.request import PreparedRequest, RequestMixin
+from fluree_py.http.mixin.stream import StreamMixin
 from fluree_py.http.mixin.where import WithWhereMixin
 __all__ = [
     "CommitMixin",
     "AsyncCommitMixin",
     "CommitableMixin",
+    "CompactionMixin",
     "WithContextMixin",
     "WithInsertMixin",
+    "PreparedRequest",
     "RequestMixin",
+    "StreamMixin",
     "WithWhereMixin",
 ]
@@ -2,46 +2,60 @@
 
 from typing import Generic, TypeVar
 
-from httpx import AsyncClient, Client
-
-from fluree_py.http.protocol.mixin.commit import SupportsAsyncCommit, SupportsCommit
-from fluree_py.http.protocol.mixin.request import SupportsRequestCreation
+from fluree_py.http.protocol.mixin.commit import (
+    HasSession,
+    SupportsAsyncCommit,
+    SupportsCommit,
+)
 from fluree_py.http.response import FlureeResponse
+from fluree_py.http.session import FlureeSession
 
-T = TypeVar("T", bound=SupportsRequestCreation)
+T = TypeVar("T", bound=HasSession)
 
 
 class CommitMixin(SupportsCommit, Generic[T]):
     """Synchronous commit functionality for Fluree transactions."""
 
+    __slots__ = ()
+
     def commit(self: T) -> FlureeResponse:
         """Executes the transaction synchronously.
 
+        Uses the pooled session the builder was created with, or a short-lived
+        one when the builder was constructed without a client.
+
         Exceptions:
             httpx.RequestError: If the HTTP request fails.
             TypeError: If the type parameter cannot be resolved.
         """
-        request = self.get_request()
-        with Client() as client:
-            response = client.send(request)
-        return FlureeResponse(response=response)
+        if self.session is None:
+            with FlureeSession() as session:
+                return session.execute(self)
+        return self.session.execute(self)
 
 
 class AsyncCommitMixin(SupportsAsyncCommit, Generic[T]):
     """Asynchronous commit functionality for Fluree transactions."""
 
+    __slots__ = ()
+
     async def acommit(self: T) -> FlureeResponse:
         """Executes the transaction asynchronously.
 
+        Uses the pooled session the builder was created with, or a short-lived
+        one when the builder was constructed without a client.
+
         Exceptions:
             httpx.RequestError: If the HTTP request fails.
             TypeError: If the type parameter cannot be resolved.
         """
-        request = self.get_request()
-        async with AsyncClient() as client:
-            response = await client.send(request)
-        return FlureeResponse(response=response)
+        if self.session is None:
+            async with FlureeSession() as session:
+                return await session.aexecute(self)
+        return await self.session.aexecute(self)
 
 
 class CommitableMixin(CommitMixin[T], AsyncCommitMixin[T], Generic[T]):
     """Combines synchronous and asynchronous commit capabilities."""
+
+    __slots__ = ()
@@ -0,0 +1,42 @@
+"""Mixin for compacting full IRIs in insert and delete payloads."""
+
+from typing import TypeVar
+
+from fluree_py.http.compaction import CompactionResult, compact_payload
+from fluree_py.http.mixin.utils import copy_with
+from fluree_py.http.protocol.mixin.compaction import (
+    HasUncompactedPayload,
+    SupportsCompaction,
+)
+
+T = TypeVar("T", bound=HasUncompactedPayload)
+
+
+class CompactionMixin(SupportsCompaction):
+    """Opt-in compaction of full IRIs in insert and delete data to prefixed names."""
+
+    __slots__ = ()
+
+    def with_compaction(self: T) -> T:
+        """Compact full IRIs in the payload to prefixed names when it is sent.
+
+        Example:
+            >>> ledger.transaction().with_insert(data).with_compaction().commit()
+        """
+        return copy_with(self, type(self), compact_iris=True)
+
+    def compaction(self: T) -> CompactionResult:
+        """Compact the payload's IRIs and report the prefixes added and bytes saved.
+
+        Prefixes of the session's default context and of the builder's own
+        context are reused rather than defined again.
+
+        Example:
+            >>> builder.compaction().bytes_saved
+            18342
+        """
+        payload = self.build_uncompacted_payload()
+        session = getattr(self, "session", None)
+        default = None if session is None else session.default_context
+        context = (default or {}) | (payload.get("@context") or {})
+        return compact_payload(payload, context=context)
@@ -1,7 +1,7 @@
 """Mixin for managing context data in Fluree operations."""
 
 from typing import Any, Generic, TypeVar, cast
-from fluree_py.http.mixin.utils import resolve_base_class_reference
+from fluree_py.http.mixin.utils import copy_with, resolve_base_class_reference
 from fluree_py.http.protocol.mixin import HasContextData
 
 
@@ -12,6 +12,8 @@ T = TypeVar("T", bound="HasContextData")
 class WithContextMixin(Generic[T]):
     """Provides context management for Fluree operations."""
 
+    __slots__ = ()
+
     def with_context(self, context: dict[str, Any]) -> T:
         """Updates the operation's context with new data.
 
@@ -19,8 +21,4 @@ class WithContextMixin(Generic[T]):
             TypeError: If the type parameter cannot be resolved.
         """
         resolved_type = resolve_base_class_reference(self.__class__, "WithContextMixin")
-
-        # Manually create a new instance with updated context
-        updated_fields = self.__dict__.copy()
-        updated_fields["context"] = context
-        return cast(T, resolved_type(**updated_fields))
+        return cast(T, copy_with(self, resolved_type, context=context))
@@ -2,7 +2,7 @@
 
 from typing import Generic, TypeVar, cast
 
-from fluree_py.http.mixin.utils import resolve_base_class_reference
+from fluree_py.http.mixin.utils import copy_with, resolve_base_class_reference
 from fluree_py.http.protocol.mixin import HasInsertData
 from fluree_py.types.common  import JsonArray, JsonObject
 
@@ -13,6 +13,8 @@ T = TypeVar("T", bound="HasInsertData")
 class WithInsertMixin(Generic[T]):
     """Provides data insertion capabilities for Fluree operations."""
 
+    __slots__ = ()
+
     def with_insert(self, data: JsonObject | JsonArray) -> T:
         """Updates the operation with new data to be inserted.
 
@@ -20,8 +22,4 @@ class WithInsertMixin(Generic[T]):
             TypeError: If the type parameter cannot be resolved.
         """
         resolved_type = resolve_base_class_reference(self.__class__, "WithInsertMixin")
-
-        # Create a new instance of the resolved type
-        updated_fields = self.__dict__.copy()
-        updated_fields["data"] = data
-        return cast(T, resolved_type(**updated_fields))
+        return cast(T, copy_with(self, resolved_type, data=data))
@@ -1,30 +1,114 @@
 """Base mixin for HTTP request handling in Fluree operations."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import ClassVar
 
-from httpx import Request
+from httpx import URL, Headers, Request
 
-from fluree_py.http.protocol.mixin.request import SupportsRequestCreation
+from fluree_py.http.codec import (
+    JSON_CONTENT_TYPE,
+    JsonCodec,
+    default_codec,
+    prepend_member,
+)
+from fluree_py.http.fingerprint import content_fingerprint
+from fluree_py.http.protocol.mixin.request import SupportsFingerprint
 from fluree_py.types.common import JsonObject
 
 
-@dataclass(frozen=True, kw_only=True)
-class RequestMixin(ABC, SupportsRequestCreation):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PreparedRequest:
+    """The parts of a request that stay the same for an immutable builder."""
+
+    url: URL
+    content: bytes
+    headers: Headers
+    _fingerprint: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def fingerprint(self) -> str:
+        """The request's fingerprint, computed on first access."""
+        fingerprint = self._fingerprint
+        if fingerprint is None:
+            fingerprint = content_fingerprint("POST", self.url, self.content)
+            object.__setattr__(self, "_fingerprint", fingerprint)
+        return fingerprint
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RequestMixin(ABC, SupportsFingerprint):
     """Base class for creating and managing HTTP requests."""
 
+    read_only: ClassVar[bool] = False
+    """Whether the request only reads data and may be served by a replica."""
+
+    _prepared: PreparedRequest | None = field(default=None, init=False, repr=False, compare=False)
+
     def get_request(self) -> Request:
         """Constructs an HTTP request with the operation's data.
 
+        The URL, body and headers are computed on the first call and reused
+        afterwards, so committing the same builder repeatedly skips building
+        and encoding the payload. Builders are immutable, so the values passed
+        to them must not be mutated after the first request either.
+
         Exceptions:
             NotImplementedError: If get_url() or build_request_payload() are not implemented.
         """
+        prepared = self.prepare()
         return Request(
             method="POST",
-            url=self.get_url(),
-            json=self.build_request_payload(),
+            url=prepared.url,
+            content=prepared.content,
+            headers=prepared.headers,
         )
 
+    def prepare(self) -> PreparedRequest:
+        """Returns the builder's serialized request parts, computing them once."""
+        prepared = self._prepared
+        if prepared is None:
+            content = self.encode_payload()
+            prepared = PreparedRequest(
+                url=URL(self.get_url()),
+                content=content,
+                headers=Headers(
+                    {
+                        "Content-Type": JSON_CONTENT_TYPE,
+                        "Content-Length": str(len(content)),
+                    }
+                ),
+            )
+            object.__setattr__(self, "_prepared", prepared)
+        return prepared
+
+    def fingerprint(self) -> str:
+        """Returns the fingerprint of the builder's request, computing it once."""
+        return self.prepare().fingerprint
+
+    def encode_payload(self, payload: JsonObject | None = None) -> bytes:
+        """Serialize the payload, adding the session's default context if any.
+
+        The builder's own context is merged over the default one. Without it,
+        the default context, encoded once by the session, is spliced into the
+        body as raw bytes. `payload` defaults to `build_request_payload()`.
+        """
+        if payload is None:
+            payload = self.build_request_payload()
+        session = getattr(self, "session", None)
+        if session is None or session.default_context is None:
+            return self.codec.dumps(payload)
+        if "@context" in payload:
+            payload["@context"] = session.default_context | payload["@context"]
+            return self.codec.dumps(payload)
+        return prepend_member("@context", session.encoded_context, self.codec.dumps(payload))
+
+    @property
+    def codec(self) -> JsonCodec:
+        """The codec serializing the payload, taken from the builder's session if any."""
+        session = getattr(self, "session", None)
+        return default_codec() if session is None else session.codec
+
     @abstractmethod
     def get_url(self) -> str:
         """Returns the endpoint URL for the request.
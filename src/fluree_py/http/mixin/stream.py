@@ -0,0 +1,59 @@
+"""Mixins for streaming large responses from the Fluree ledger."""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Generic, TypeVar
+
+from fluree_py.http.protocol.mixin.commit import HasSession
+from fluree_py.http.protocol.mixin.stream import SupportsStream
+from fluree_py.http.response import FlureeResponse
+from fluree_py.http.session import FlureeSession
+
+T = TypeVar("T", bound=HasSession)
+
+
+class StreamMixin(SupportsStream, Generic[T]):
+    """Streaming of responses whose bodies are too large to buffer."""
+
+    __slots__ = ()
+
+    @contextmanager
+    def stream(self: T) -> Iterator[FlureeResponse]:
+        """Executes the request and streams the response body.
+
+        Use `iter_items()` on the response to walk a large result array with
+        bounded memory.
+
+        Example:
+            >>> with ledger.query().with_select({"?s": ["*"]}).stream() as response:
+            ...     for item in response.iter_items():
+            ...         process(item)
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+        """
+        if self.session is None:
+            with FlureeSession() as session, session.stream(self) as response:
+                yield response
+        else:
+            with self.session.stream(self) as response:
+                yield response
+
+    @asynccontextmanager
+    async def astream(self: T) -> AsyncIterator[FlureeResponse]:
+        """Executes the request asynchronously and streams the response body.
+
+        Example:
+            >>> async with ledger.query().with_select({"?s": ["*"]}).astream() as response:
+            ...     async for item in response.aiter_items():
+            ...         process(item)
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+        """
+        if self.session is None:
+            async with FlureeSession() as session, session.astream(self) as response:
+                yield response
+        else:
+            async with self.session.astream(self) as response:
+                yield response
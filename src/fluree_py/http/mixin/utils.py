@@ -1,7 +1,20 @@
-"""Utility functions for resolving generic type parameters in mixins."""
+"""Utility functions for resolving generic type parameters and copying builders in mixins."""
 
 import sys
-from typing import Any, ForwardRef
+from dataclasses import fields
+from typing import Any, ForwardRef, TypeVar
+from weakref import WeakKeyDictionary
+
+T = TypeVar("T")
+
+_resolved_types: WeakKeyDictionary[type[Any], dict[str, type[Any] | None]] = WeakKeyDictionary()
+"""Type parameters already resolved, keyed by class and then generic base name.
+
+A class that resolves to itself is stored as None, so the entry does not keep it alive.
+"""
+
+_init_fields: WeakKeyDictionary[type[Any], tuple[str, ...]] = WeakKeyDictionary()
+"""Constructor field names of the dataclasses copied so far."""
 
 
 def find_base_class(cls: type[Any], base_name: str) -> type[Any]:
@@ -19,9 +32,22 @@ def find_base_class(cls: type[Any], base_name: str) -> type[Any]:
 def resolve_base_class_reference(cls: type[Any], base_name: str) -> type[Any]:
     """Resolves the type parameter from a generic base class.
 
+    The result is cached per class, so builders only pay for the lookup once.
+
     Exceptions:
         TypeError: If no type argument is found or if the type cannot be resolved.
     """
+    resolved = _resolved_types.get(cls)
+    if resolved is None:
+        resolved = _resolved_types[cls] = {}
+    if base_name not in resolved:
+        resolved_type = _resolve(cls, base_name)
+        resolved[base_name] = None if resolved_type is cls else resolved_type
+    return resolved[base_name] or cls
+
+
+def _resolve(cls: type[Any], base_name: str) -> type[Any]:
+    """Resolves the type parameter of `cls`'s generic base named `base_name`."""
     base_class = find_base_class(cls, base_name)
 
     if not hasattr(base_class, "__args__"):
@@ -52,3 +78,21 @@ def resolve_base_class_reference(cls: type[Any], base_name: str) -> type[Any]:
         raise TypeError(f"Unable to resolve type argument {type_arg}")
 
     return resolved_type
+
+
+def init_field_names(cls: type[Any]) -> tuple[str, ...]:
+    """Lists the names of a dataclass's constructor fields, cached per class."""
+    names = _init_fields.get(cls)
+    if names is None:
+        names = _init_fields[cls] = tuple(f.name for f in fields(cls) if f.init)
+    return names
+
+
+def copy_with(instance: Any, target: type[T], **changes: Any) -> T:
+    """Creates a `target` dataclass from `instance`'s fields with some replaced.
+
+    Example:
+        >>> ready = copy_with(builder, TransactionReadyToCommitImpl, data=data)
+    """
+    values = {name: getattr(instance, name) for name in init_field_names(type(instance))}
+    return target(**(values | changes))
@@ -2,7 +2,7 @@
 
 from typing import Generic, TypeVar, cast
 
-from fluree_py.http.mixin.utils import resolve_base_class_reference
+from fluree_py.http.mixin.utils import copy_with, resolve_base_class_reference
 from fluree_py.http.protocol.mixin.where import HasWhereData
 from fluree_py.types.query.where import WhereClause
 
@@ -12,6 +12,8 @@ T = TypeVar("T", bound="HasWhereData")
 class WithWhereMixin(Generic[T]):
     """Provides where clause capabilities for Fluree queries."""
 
+    __slots__ = ()
+
     def with_where(self: T, clause: WhereClause) -> T:
         """Updates the query with a new where clause.
 
@@ -19,8 +21,4 @@ class WithWhereMixin(Generic[T]):
             TypeError: If the type parameter cannot be resolved.
         """
         resolved_type = resolve_base_class_reference(self.__class__, "WithWhereMixin")
-
-        # Create a new instance of the resolved type
-        updated_fields = self.__dict__.copy()
-        updated_fields["where"] = clause
-        return cast(T, resolved_type(**updated_fields))
+        return cast(T, copy_with(self, resolved_type, where=clause))
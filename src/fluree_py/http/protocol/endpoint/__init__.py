@@ -7,6 +7,7 @@ from fluree_py.http.protocol.endpoint.query import QueryBuilder
 from fluree_py.http.protocol.endpoint.transaction import (
     TransactionBuilder,
     TransactionReadyToCommit,
+    TransactionStream,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "QueryBuilder",
     "TransactionBuilder",
     "TransactionReadyToCommit",
+    "TransactionStream",
 ]
@@ -4,6 +4,7 @@ from typing import Protocol
 
 from fluree_py.http.protocol.mixin import (
     SupportsCommitable,
+    SupportsCompaction,
     SupportsContext,
     SupportsInsert,
     SupportsRequestCreation,
@@ -17,12 +18,17 @@ class CreateBuilder(
 ):
     """Protocol for building create operations."""
 
-    pass
+    __slots__ = ()
 
 
 class CreateReadyToCommit(
-    SupportsRequestCreation, SupportsCommitable, HasInsertData, HasContextData, Protocol
+    SupportsRequestCreation,
+    SupportsCommitable,
+    SupportsCompaction,
+    HasInsertData,
+    HasContextData,
+    Protocol,
 ):
     """Protocol for create operations ready to be committed."""
 
-    pass
+    __slots__ = ()
@@ -6,6 +6,7 @@ from fluree_py.http.protocol.mixin import (
     SupportsCommitable,
     SupportsContext,
     SupportsRequestCreation,
+    SupportsStream,
 )
 from fluree_py.types.common import TimeClause
 from fluree_py.types.http.history import HistoryClause
@@ -15,10 +16,13 @@ class HistoryBuilder(
     SupportsContext["HistoryBuilder"],
     SupportsRequestCreation,
     SupportsCommitable,
+    SupportsStream,
     Protocol,
 ):
     """Protocol for history builders."""
 
+    __slots__ = ()
+
     def with_history(self, history: HistoryClause) -> Self: ...
     def with_t(self, t: TimeClause) -> Self: ...
     def with_commit_details(self, commit_details: bool) -> Self: ...
@@ -9,8 +9,10 @@ from fluree_py.http.protocol.mixin import (
     SupportsCommitable,
     SupportsContext,
     SupportsRequestCreation,
+    SupportsStream,
     SupportsWhere,
 )
+from fluree_py.types.common import TimeClause
 from fluree_py.types.query.select import SelectArray, SelectObject
 from fluree_py.types.query.query import (
     OrderByClause,
@@ -25,12 +27,16 @@ class QueryBuilder(
     SupportsWhere["QueryBuilder"],
     SupportsRequestCreation,
     SupportsCommitable,
+    SupportsStream,
     Protocol,
 ):
     """Protocol for building query operations."""
 
+    __slots__ = ()
+
     def with_order_by(self, fields: OrderByClause) -> Self: ...
     def with_opts(self, opts: ActiveIdentity) -> Self: ...
     def with_select(self, fields: SelectObject | SelectArray) -> Self: ...
     def with_group_by(self, fields: GroupByClause) -> Self: ...
     def with_having(self, condition: HavingClause) -> Self: ...
+    def with_t(self, t: TimeClause) -> Self: ...
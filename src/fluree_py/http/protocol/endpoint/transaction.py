@@ -1,9 +1,12 @@
 """Protocols for building and executing transactions in the Fluree ledger."""
 
+from collections.abc import AsyncIterable, Iterable
 from typing import Protocol, Self
 
+from fluree_py.http.chunked import ChunkedCommitResult, ChunkPolicy
 from fluree_py.http.protocol.mixin import (
     SupportsCommitable,
+    SupportsCompaction,
     SupportsContext,
     SupportsRequestCreation,
     HasInsertData,
@@ -21,14 +24,25 @@ class TransactionBuilder(
 ):
     """Protocol for building transaction operations."""
 
+    __slots__ = ()
+
     def with_delete(
         self, data: JsonObject | JsonArray
     ) -> "TransactionReadyToCommit": ...
 
+    def with_insert_stream(
+        self,
+        source: Iterable[JsonObject] | AsyncIterable[JsonObject],
+        *,
+        batch_size: int = 500,
+        max_in_flight: int = 4,
+    ) -> "TransactionStream": ...
+
 
 class TransactionReadyToCommit(
     SupportsRequestCreation,
     SupportsCommitable,
+    SupportsCompaction,
     SupportsContext["TransactionReadyToCommit"],
     SupportsWhere["TransactionReadyToCommit"],
     HasInsertData,
@@ -36,4 +50,22 @@ class TransactionReadyToCommit(
 ):
     """Protocol for transaction operations ready to be committed."""
 
+    __slots__ = ()
+
     def with_delete(self, data: JsonObject | JsonArray) -> Self: ...
+
+    def commit_chunked(self, policy: ChunkPolicy | None = None) -> ChunkedCommitResult: ...
+
+    async def acommit_chunked(
+        self, policy: ChunkPolicy | None = None
+    ) -> ChunkedCommitResult: ...
+
+
+class TransactionStream(Protocol):
+    """Protocol for inserts streamed from an iterator in batches."""
+
+    __slots__ = ()
+
+    def commit(self) -> ChunkedCommitResult: ...
+
+    async def acommit(self) -> ChunkedCommitResult: ...
@@ -1,23 +1,41 @@
 """Protocol mixin modules for Fluree ledger operations."""
 
+from fluree_py.http.protocol.mixin.compaction import (
+    HasUncompactedPayload,
+    SupportsCompaction,
+)
 from fluree_py.http.protocol.mixin.context import HasContextData, SupportsContext
 from fluree_py.http.protocol.mixin.insert import HasInsertData, SupportsInsert
 from fluree_py.http.protocol.mixin.where import SupportsWhere
 from fluree_py.http.protocol.mixin.commit import (
+    HasSession,
     SupportsCommit,
     SupportsAsyncCommit,
     SupportsCommitable,
 )
-from fluree_py.http.protocol.mixin.request import SupportsRequestCreation
+from fluree_py.http.protocol.mixin.stream import SupportsStream
+from fluree_py.http.protocol.mixin.request import (
+    HasTimeClause,
+    SupportsFingerprint,
+    SupportsRequestCreation,
+    SupportsRouting,
+)
 
 __all__ = [
     "HasContextData",
     "HasInsertData",
+    "HasSession",
+    "HasTimeClause",
+    "HasUncompactedPayload",
     "SupportsContext",
     "SupportsInsert",
     "SupportsWhere",
     "SupportsCommit",
     "SupportsAsyncCommit",
     "SupportsCommitable",
+    "SupportsCompaction",
+    "SupportsFingerprint",
     "SupportsRequestCreation",
+    "SupportsRouting",
+    "SupportsStream",
 ]
@@ -1,11 +1,26 @@
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
+from fluree_py.http.protocol.mixin.request import SupportsRequestCreation
 from fluree_py.http.response import FlureeResponse
 
+if TYPE_CHECKING:
+    from fluree_py.http.session import FlureeSession
+
+
+class HasSession(SupportsRequestCreation, Protocol):
+    """Protocol for request builders that may carry a pooled session."""
+
+    __slots__ = ()
+
+    @property
+    def session(self) -> "FlureeSession | None": ...
+
 
 class SupportsCommit(Protocol):
     """Protocol for objects that support synchronous commit operations."""
 
+    __slots__ = ()
+
     def commit(self) -> FlureeResponse:
         """Executes the transaction synchronously.
 
@@ -19,6 +34,8 @@ class SupportsCommit(Protocol):
 class SupportsAsyncCommit(Protocol):
     """Protocol for objects that support asynchronous commit operations."""
 
+    __slots__ = ()
+
     async def acommit(self) -> FlureeResponse:
         """Executes the transaction asynchronously.
 
@@ -32,4 +49,4 @@ class SupportsAsyncCommit(Protocol):
 class SupportsCommitable(SupportsCommit, SupportsAsyncCommit, Protocol):
     """Protocol for objects that support both sync and async commit operations."""
 
-    pass
+    __slots__ = ()
@@ -0,0 +1,29 @@
+from typing import Protocol, Self
+
+from fluree_py.http.compaction import CompactionResult
+from fluree_py.types.common import JsonObject
+
+
+class HasUncompactedPayload(Protocol):
+    """Protocol for builders whose payload can be built before IRI compaction."""
+
+    __slots__ = ()
+
+    @property
+    def compact_iris(self) -> bool: ...
+
+    def build_uncompacted_payload(self) -> JsonObject: ...
+
+
+class SupportsCompaction(Protocol):
+    """Protocol for objects whose insert and delete data can have IRIs compacted."""
+
+    __slots__ = ()
+
+    def with_compaction(self) -> Self:
+        """Compact full IRIs in the payload to prefixed names when it is sent."""
+        ...
+
+    def compaction(self) -> CompactionResult:
+        """Compact the payload's IRIs and report the prefixes added and bytes saved."""
+        ...
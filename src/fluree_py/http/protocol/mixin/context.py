@@ -4,6 +4,8 @@ from typing import Any, Generic, Protocol, TypeVar
 class HasContextData(Protocol):
     """Protocol for objects that have context data."""
 
+    __slots__ = ()
+
     context: dict[str, Any] | None
 
 
@@ -13,6 +15,8 @@ T = TypeVar("T", bound="HasContextData", covariant=True)
 class SupportsContext(Generic[T], Protocol):
     """Protocol for objects that support context operations."""
 
+    __slots__ = ()
+
     context: dict[str, Any] | None
 
     def with_context(self, context: dict[str, Any]) -> T: ...
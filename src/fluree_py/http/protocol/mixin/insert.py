@@ -6,6 +6,8 @@ from fluree_py.types.common import JsonArray, JsonObject
 class HasInsertData(Protocol):
     """Protocol for objects that have insert data."""
 
+    __slots__ = ()
+
     data: JsonObject | JsonArray | None
 
 
@@ -15,6 +17,8 @@ T = TypeVar("T", bound="HasInsertData", covariant=True)
 class SupportsInsert(Generic[T], Protocol):
     """Protocol for objects that support insert operations."""
 
+    __slots__ = ()
+
     data: JsonObject | JsonArray | None
 
     def with_insert(self, data: JsonObject | JsonArray) -> T: ...
@@ -1,9 +1,45 @@
-from typing import Protocol
+from typing import ClassVar, Protocol, runtime_checkable
 
 from httpx import Request
 
+from fluree_py.types.common import TimeClause
+
 
 class SupportsRequestCreation(Protocol):
     """Protocol for objects that support HTTP request creation."""
 
+    __slots__ = ()
+
     def get_request(self) -> Request: ...
+
+
+@runtime_checkable
+class SupportsFingerprint(SupportsRequestCreation, Protocol):
+    """Protocol for requests that keep their fingerprint once computed."""
+
+    __slots__ = ()
+
+    def fingerprint(self) -> str: ...
+
+
+@runtime_checkable
+class SupportsRouting(SupportsRequestCreation, Protocol):
+    """Protocol for requests that tell the routing layer what they target."""
+
+    __slots__ = ()
+
+    read_only: ClassVar[bool]
+    """Whether the request only reads data and may be served by a replica."""
+
+    @property
+    def ledger(self) -> str: ...
+
+
+@runtime_checkable
+class HasTimeClause(Protocol):
+    """Protocol for requests that can be pinned to a point in ledger time."""
+
+    __slots__ = ()
+
+    @property
+    def t(self) -> TimeClause | None: ...
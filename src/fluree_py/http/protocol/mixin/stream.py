@@ -0,0 +1,26 @@
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Protocol
+
+from fluree_py.http.response import FlureeResponse
+
+
+class SupportsStream(Protocol):
+    """Protocol for objects whose responses can be streamed incrementally."""
+
+    __slots__ = ()
+
+    def stream(self) -> AbstractContextManager[FlureeResponse]:
+        """Executes the request and streams the response body.
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+        """
+        ...
+
+    def astream(self) -> AbstractAsyncContextManager[FlureeResponse]:
+        """Executes the request asynchronously and streams the response body.
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+        """
+        ...
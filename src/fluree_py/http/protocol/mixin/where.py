@@ -6,6 +6,8 @@ from fluree_py.types.query.where import WhereClause
 class HasWhereData(Protocol):
     """Protocol for objects that have where clause data."""
 
+    __slots__ = ()
+
     where: WhereClause | None
 
 
@@ -15,6 +17,8 @@ T = TypeVar("T", bound="HasWhereData", covariant=True)
 class SupportsWhere(Generic[T], Protocol):
     """Protocol for objects that support where clause operations."""
 
+    __slots__ = ()
+
     where: WhereClause | None = None
 
     def with_where(self, clause: WhereClause) -> T: ...
@@ -1,20 +1,38 @@
-from dataclasses import dataclass
-from typing import TypeVar, cast
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, cast
 
 from httpx import Headers, Response
+from pydantic import BaseModel
 
+from fluree_py.http.adapter import list_adapter
+from fluree_py.http.codec import JsonCodec, default_codec
+from fluree_py.http.streaming import JsonArrayParser
 from fluree_py.types.common import JsonArray, JsonObject
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+_UNPARSED: Any = object()
 
 
 @dataclass(frozen=True, kw_only=True)
 class FlureeResponse:
     response: Response
+    codec: JsonCodec = field(default_factory=default_codec, repr=False, compare=False)
+    _parsed: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
 
     def json(self) -> JsonObject | JsonArray:
-        """Parse the response as JSON."""
-        return self.response.json()
+        """Parse the response as JSON.
+
+        The raw body is parsed once, on first call, with the response's codec;
+        later calls (and `cast`) return the same object, so copy it before
+        mutating it.
+        """
+        if self._parsed is _UNPARSED:
+            object.__setattr__(self, "_parsed", self.codec.loads(self.response.content))
+        return self._parsed  # type: ignore[no-any-return]
 
     @property
     def text(self) -> str:
@@ -41,6 +59,65 @@ class FlureeResponse:
         """Check if the response was successful."""
         return self.response.is_success
 
+    def iter_items(self) -> Iterator[Any]:
+        """Yield the elements of a JSON array response as they arrive.
+
+        On a streamed response (see `stream()` on query and history builders)
+        only the element being received is buffered; on a buffered response the
+        elements are parsed from the content already read.
+
+        Exceptions:
+            ValueError: If the body is not a well-formed JSON array.
+        """
+        parser = JsonArrayParser()
+        for chunk in self.response.iter_bytes():
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    async def aiter_items(self) -> AsyncIterator[Any]:
+        """Asynchronously yield the elements of a JSON array response as they arrive.
+
+        Exceptions:
+            ValueError: If the body is not a well-formed JSON array.
+        """
+        parser = JsonArrayParser()
+        async for chunk in self.response.aiter_bytes():
+            for item in parser.feed(chunk):
+                yield item
+        for item in parser.close():
+            yield item
+
+    def as_models(self, model: type[M]) -> list[M]:
+        """Validate a JSON array response into a list of `model` instances.
+
+        The raw body is validated in a single call with a cached type adapter,
+        without building intermediate Python dicts. If the body was already
+        parsed by `json()`, the parsed result is validated instead.
+
+        Example:
+            >>> class Person(BaseModel):
+            ...     id: str = Field(alias="@id")
+            ...     name: str
+            >>> people = query.with_select(from_pydantic(Person)).commit().as_models(Person)
+
+        Exceptions:
+            pydantic.ValidationError: If the body does not match the model.
+        """
+        adapter = list_adapter(model)
+        if self._parsed is _UNPARSED:
+            return adapter.validate_json(self.response.content)
+        return adapter.validate_python(self._parsed)
+
+    def as_model(self, model: type[M]) -> M:
+        """Validate a JSON object response into a `model` instance.
+
+        Exceptions:
+            pydantic.ValidationError: If the body does not match the model.
+        """
+        if self._parsed is _UNPARSED:
+            return model.model_validate_json(self.response.content)
+        return model.model_validate(self._parsed)
+
     def cast(self, type_: type[T]) -> T:
         """Cast the JSON response to a specific type."""
         return cast(T, self.json())
@@ -0,0 +1,95 @@
+"""Routing of read requests to replicas and write requests to the primary."""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TypeGuard
+
+from httpx import Response
+
+from fluree_py.http.balancer import NodeMetrics, NodePool
+from fluree_py.http.protocol.mixin.request import (
+    HasTimeClause,
+    SupportsRequestCreation,
+    SupportsRouting,
+)
+from fluree_py.types.common import is_pinned_time
+
+
+def is_read_only(builder: SupportsRequestCreation) -> TypeGuard[SupportsRouting]:
+    """Check if a builder declares its request as read-only."""
+    return isinstance(builder, SupportsRouting) and builder.read_only
+
+
+def is_time_pinned(builder: SupportsRequestCreation) -> bool:
+    """Check if a builder's request is pinned to fixed commits of its ledger."""
+    return isinstance(builder, HasTimeClause) and is_pinned_time(builder.t)
+
+
+@dataclass(kw_only=True)
+class RequestRouter:
+    """Choose the node pool that serves each request.
+
+    Read-only requests (queries and history) go to the `replicas` pool when one
+    is configured, everything else goes to the `primary` pool. With
+    `read_your_writes` set, reads of a ledger are kept on the primary for that
+    many seconds after a successful write to it, so callers see their own
+    changes before the replicas catch up.
+
+    Builders address `base_url`; requests are rewritten to the chosen node.
+
+    Example:
+        >>> router = RequestRouter(
+        ...     base_url="http://primary:8090",
+        ...     primary=NodePool(urls=["http://primary:8090"]),
+        ...     replicas=NodePool(urls=["http://replica-a:8090", "http://replica-b:8090"]),
+        ...     read_your_writes=2.0,
+        ... )
+    """
+
+    base_url: str
+    primary: NodePool
+    replicas: NodePool | None = None
+    read_your_writes: float | None = None
+
+    _recent_writes: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def route(self, builder: SupportsRequestCreation) -> NodePool:
+        """Pick the pool for the builder's request."""
+        if self.replicas is None or not is_read_only(builder) or self.follows_write(builder):
+            return self.primary
+        return self.replicas
+
+    def follows_write(self, builder: SupportsRequestCreation) -> bool:
+        """Check if a read falls within the read-your-writes window of its ledger."""
+        if self.read_your_writes is None or not is_read_only(builder):
+            return False
+        return self._recently_written(builder.ledger)
+
+    def observe(self, builder: SupportsRequestCreation, response: Response) -> None:
+        """Record a successful write so later reads of its ledger stay on the primary."""
+        if (
+            self.read_your_writes is None
+            or not response.is_success
+            or not isinstance(builder, SupportsRouting)
+            or builder.read_only
+        ):
+            return
+        with self._lock:
+            self._recent_writes[builder.ledger] = time.monotonic() + self.read_your_writes
+
+    def metrics(self) -> list[NodeMetrics]:
+        """Snapshot the primary nodes followed by the replica nodes."""
+        replicas = [] if self.replicas is None else self.replicas.metrics()
+        return self.primary.metrics() + replicas
+
+    def _recently_written(self, ledger: str) -> bool:
+        with self._lock:
+            until = self._recent_writes.get(ledger)
+            if until is None:
+                return False
+            if until > time.monotonic():
+                return True
+            del self._recent_writes[ledger]
+            return False
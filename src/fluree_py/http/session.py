@@ -0,0 +1,425 @@
+"""Long-lived, pooled HTTP connections shared by every builder of a client."""
+
+import asyncio
+import threading
+import time
+import warnings
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from types import TracebackType
+from typing import Any, Self
+
+from httpx import AsyncClient, Client, Limits, Request, Response, Timeout, TransportError
+
+from fluree_py.http.cache.base import CachedResult, ResultCache
+from fluree_py.http.codec import JsonCodec, default_codec
+from fluree_py.http.fingerprint import fingerprint
+from fluree_py.http.protocol.mixin.request import (
+    SupportsFingerprint,
+    SupportsRequestCreation,
+    SupportsRouting,
+)
+from fluree_py.http.response import FlureeResponse
+from fluree_py.http.routing import RequestRouter, is_read_only, is_time_pinned
+from fluree_py.http.singleflight import SingleFlight
+
+DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+"""Connection pool limits used when none are given (mirrors the httpx defaults)."""
+
+DEFAULT_TIMEOUT = Timeout(timeout=5.0)
+"""Request timeout used when none is given (mirrors the httpx defaults)."""
+
+
+async def _close_with_loop(client: AsyncClient) -> AsyncGenerator[None, None]:
+    """Close the client when its event loop shuts down its async generators.
+
+    `asyncio.run()` and `asyncio.Runner` do so before closing the loop, the last
+    point at which the client's connections can still be closed cleanly.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def _close_on_loop(client: AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Close an async client on the loop its connections belong to, unless that is closed."""
+    if not client.is_closed and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+@dataclass(kw_only=True)
+class FlureeSession:
+    """Owns the sync and async connection pools used to send Fluree requests.
+
+    The underlying `httpx.Client` and `httpx.AsyncClient` are created lazily on
+    first use and reused for every request afterwards, so keep-alive connections
+    are shared across queries and transactions.
+
+    With `http2=True` concurrent requests are multiplexed over a few HTTP/2
+    connections. HTTP/2 is negotiated per connection (via TLS ALPN), so servers
+    that only speak HTTP/1.1, including plain `http://` endpoints, keep working
+    over HTTP/1.1. With `http1=False` as well, HTTP/2 is spoken with prior
+    knowledge instead: plain `http://` endpoints are reached over cleartext
+    HTTP/2 (h2c), and servers that only speak HTTP/1.1 cannot be reached. If the
+    optional `h2` package is missing the session warns and falls back to
+    HTTP/1.1.
+
+    When a `RequestRouter` is given, every request is balanced across the nodes
+    of the pool it routes to and each outcome feeds that pool's latency and
+    health tracking.
+
+    With `coalesce=True`, concurrent read-only requests with the same URL and
+    canonical payload share a single HTTP request and its `FlureeResponse`.
+    Reads inside a read-your-writes window are never coalesced, so they cannot
+    join a request that started before the write.
+
+    With a `cache`, successful read-only results are served from it until they
+    expire, and a successful transaction or ledger creation drops the cached
+    results of its ledger.
+
+    Read-only requests pinned to fixed commits (an explicit `t` that never says
+    "latest") use `pinned_cache` instead when one is given. Their results
+    cannot change, so writes never invalidate it.
+
+    Payloads of builders using the session are serialized, and responses parsed,
+    with `codec`, by default the fastest installed of orjson, msgspec and the
+    standard library.
+
+    A `default_context` is sent as the `@context` of every request built with
+    the session and merged under the builder's own context when it has one. It
+    is encoded once, when the session is created, and spliced into bodies as is.
+
+    Example:
+        >>> with FlureeSession() as session:
+        ...     response = session.execute(builder)
+
+    Exceptions:
+        ValueError: If both http1 and http2 are disabled.
+    """
+
+    limits: Limits = field(default_factory=lambda: DEFAULT_LIMITS)
+    timeout: Timeout | float | None = field(default_factory=lambda: DEFAULT_TIMEOUT)
+    http1: bool = True
+    http2: bool = False
+    router: RequestRouter | None = None
+    coalesce: bool = False
+    cache: ResultCache | None = None
+    pinned_cache: ResultCache | None = None
+    codec: JsonCodec = field(default_factory=default_codec)
+    default_context: dict[str, Any] | None = None
+    encoded_context: bytes | None = field(default=None, init=False, repr=False)
+    flights: SingleFlight[FlureeResponse] = field(
+        default_factory=SingleFlight, init=False, repr=False
+    )
+
+    _client: Client | None = field(default=None, init=False, repr=False)
+    _async_client: AsyncClient | None = field(default=None, init=False, repr=False)
+    _async_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+    _async_closer: AsyncGenerator[None, None] | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.default_context is not None:
+            self.encoded_context = self.codec.dumps(self.default_context)
+        if not self.http1 and not self.http2:
+            raise ValueError("At least one of http1 and http2 must be enabled")
+        if self.http2 and find_spec("h2") is None:
+            warnings.warn(
+                "HTTP/2 was requested but the 'h2' package is not installed; "
+                "falling back to HTTP/1.1. Install it with `pip install fluree-py[http2]`.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+            self.http1, self.http2 = True, False
+
+    @property
+    def client(self) -> Client:
+        """The pooled synchronous client, created on first access.
+
+        Exceptions:
+            RuntimeError: If the session has been closed.
+        """
+        self._ensure_open()
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = Client(
+                        limits=self.limits, timeout=self.timeout, http1=self.http1, http2=self.http2
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """The pooled asynchronous client bound to the running event loop.
+
+        Pooled connections cannot outlive the event loop that opened them, so a
+        fresh client is created whenever the session is used from a new loop,
+        and the previous one is closed on its own loop if that is still open.
+        A client is also closed when its loop shuts down, as at the end of
+        `asyncio.run()`.
+
+        Exceptions:
+            RuntimeError: If the session has been closed or no event loop is running.
+        """
+        self._ensure_open()
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            if self._async_client is not None and self._async_loop is not None:
+                _close_on_loop(self._async_client, self._async_loop)
+            client = AsyncClient(
+                limits=self.limits, timeout=self.timeout, http1=self.http1, http2=self.http2
+            )
+            closer = _close_with_loop(client)
+            # Start the generator, so the loop registers it, up to its yield
+            with suppress(StopIteration):
+                closer.asend(None).send(None)
+            self._async_client, self._async_loop, self._async_closer = client, loop, closer
+        return self._async_client
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if the session has been closed."""
+        return self._closed
+
+    def execute(self, builder: SupportsRequestCreation) -> FlureeResponse:
+        """Send the builder's request over the pooled synchronous client.
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+            RuntimeError: If the session has been closed.
+        """
+        request = builder.get_request()
+        if not is_read_only(builder):
+            response = self._wrap(self._send(builder, request))
+            self._written(builder, response)
+            return response
+        cache = self._cache_for(builder)
+        if cache is None and not self._coalesces(builder):
+            return self._wrap(self._send(builder, request))
+
+        key = self._fingerprint(builder, request)
+        if cache is not None and (result := cache.get(key)) is not None:
+            return self._wrap(result.to_response(request))
+        epoch = 0 if cache is None else cache.epoch(builder.ledger)
+        if self._coalesces(builder):
+            response = self.flights.do(key, lambda: self._wrap(self._send(builder, request)))
+        else:
+            response = self._wrap(self._send(builder, request))
+        if cache is not None and response.is_success:
+            result = CachedResult.from_response(response.response)
+            cache.put(key, builder.ledger, result, epoch=epoch)
+        return response
+
+    async def aexecute(self, builder: SupportsRequestCreation) -> FlureeResponse:
+        """Send the builder's request over the pooled asynchronous client.
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+            RuntimeError: If the session has been closed.
+        """
+        request = builder.get_request()
+        if not is_read_only(builder):
+            response = self._wrap(await self._asend(builder, request))
+            self._written(builder, response)
+            return response
+        cache = self._cache_for(builder)
+        if cache is None and not self._coalesces(builder):
+            return self._wrap(await self._asend(builder, request))
+
+        key = self._fingerprint(builder, request)
+        if cache is not None and (result := cache.get(key)) is not None:
+            return self._wrap(result.to_response(request))
+        epoch = 0 if cache is None else cache.epoch(builder.ledger)
+        if self._coalesces(builder):
+
+            async def send() -> FlureeResponse:
+                return self._wrap(await self._asend(builder, request))
+
+            response = await self.flights.ado(key, send)
+        else:
+            response = self._wrap(await self._asend(builder, request))
+        if cache is not None and response.is_success:
+            result = CachedResult.from_response(response.response)
+            cache.put(key, builder.ledger, result, epoch=epoch)
+        return response
+
+    @contextmanager
+    def stream(self, builder: SupportsRequestCreation) -> Iterator[FlureeResponse]:
+        """Send the builder's request and stream the response body.
+
+        The body is not read up front; consume it with `iter_items()` (or
+        `iter_bytes()` on the underlying response) inside the `with` block. The
+        connection returns to the pool when the block exits. Streamed requests
+        bypass the result caches and are never coalesced.
+
+        Example:
+            >>> with session.stream(query) as response:
+            ...     for item in response.iter_items():
+            ...         process(item)
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+            RuntimeError: If the session has been closed.
+        """
+        response = self._send(builder, builder.get_request(), stream=True)
+        try:
+            yield self._wrap(response)
+        finally:
+            response.close()
+
+    @asynccontextmanager
+    async def astream(self, builder: SupportsRequestCreation) -> AsyncIterator[FlureeResponse]:
+        """Send the builder's request asynchronously and stream the response body.
+
+        Example:
+            >>> async with session.astream(query) as response:
+            ...     async for item in response.aiter_items():
+            ...         process(item)
+
+        Exceptions:
+            httpx.RequestError: If the HTTP request fails.
+            RuntimeError: If the session has been closed.
+        """
+        response = await self._asend(builder, builder.get_request(), stream=True)
+        try:
+            yield self._wrap(response)
+        finally:
+            await response.aclose()
+
+    def _wrap(self, response: Response) -> FlureeResponse:
+        return FlureeResponse(response=response, codec=self.codec)
+
+    def _fingerprint(self, builder: SupportsRequestCreation, request: Request) -> str:
+        if isinstance(builder, SupportsFingerprint):
+            return builder.fingerprint()
+        return fingerprint(request)
+
+    def _coalesces(self, builder: SupportsRequestCreation) -> bool:
+        if not self.coalesce or not is_read_only(builder):
+            return False
+        return self.router is None or not self.router.follows_write(builder)
+
+    def _cache_for(self, builder: SupportsRequestCreation) -> ResultCache | None:
+        if self.pinned_cache is not None and is_time_pinned(builder):
+            return self.pinned_cache
+        return self.cache
+
+    def _written(self, builder: SupportsRequestCreation, response: FlureeResponse) -> None:
+        if self.cache is not None and response.is_success and isinstance(builder, SupportsRouting):
+            self.cache.invalidate(builder.ledger)
+
+    def _send(
+        self, builder: SupportsRequestCreation, request: Request, *, stream: bool = False
+    ) -> Response:
+        if self.router is None:
+            return self.client.send(request, stream=stream)
+
+        pool = self.router.route(builder)
+        node = pool.acquire()
+        start = time.perf_counter()
+        try:
+            response = self.client.send(
+                pool.retarget(request, node, base_url=self.router.base_url), stream=stream
+            )
+        except TransportError:
+            pool.release(node, latency=time.perf_counter() - start, failed=True)
+            raise
+        except BaseException:
+            pool.abandon(node)
+            raise
+        latency = time.perf_counter() - start
+        pool.release(node, latency=latency, failed=response.is_server_error)
+        self.router.observe(builder, response)
+        return response
+
+    async def _asend(
+        self, builder: SupportsRequestCreation, request: Request, *, stream: bool = False
+    ) -> Response:
+        if self.router is None:
+            return await self.async_client.send(request, stream=stream)
+
+        pool = self.router.route(builder)
+        node = pool.acquire()
+        start = time.perf_counter()
+        try:
+            response = await self.async_client.send(
+                pool.retarget(request, node, base_url=self.router.base_url), stream=stream
+            )
+        except TransportError:
+            pool.release(node, latency=time.perf_counter() - start, failed=True)
+            raise
+        except BaseException:
+            pool.abandon(node)
+            raise
+        latency = time.perf_counter() - start
+        pool.release(node, latency=latency, failed=response.is_server_error)
+        self.router.observe(builder, response)
+        return response
+
+    def close(self) -> None:
+        """Close the synchronous pool, and the asynchronous one without waiting for it.
+
+        The asynchronous pool can only be closed on its event loop, so it is
+        scheduled there and a `ResourceWarning` suggests `aclose()` instead.
+        """
+        async_client, loop = self._release_async_client()
+        with self._lock:
+            self._closed = True
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+        if async_client is not None and loop is not None and not async_client.is_closed:
+            warnings.warn(
+                "FlureeSession.close() cannot wait for the asynchronous connection pool "
+                "to close; use `await session.aclose()` instead.",
+                ResourceWarning,
+                stacklevel=2,
+            )
+            _close_on_loop(async_client, loop)
+
+    async def aclose(self) -> None:
+        """Close both the synchronous and asynchronous pools."""
+        async_client, loop = self._release_async_client()
+        self.close()
+        if async_client is None or loop is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await async_client.aclose()
+        else:
+            _close_on_loop(async_client, loop)
+
+    def _release_async_client(self) -> tuple[AsyncClient | None, asyncio.AbstractEventLoop | None]:
+        with self._lock:
+            client, loop = self._async_client, self._async_loop
+            self._async_client, self._async_loop, self._async_closer = None, None, None
+        return client, loop
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the session has been closed.")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,96 @@
+"""Coalescing of identical concurrent calls into a single execution."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(kw_only=True)
+class _Call(Generic[T]):
+    done: threading.Event = field(default_factory=threading.Event)
+    result: T | None = None
+    error: BaseException | None = None
+
+
+@dataclass(kw_only=True)
+class SingleFlight(Generic[T]):
+    """Share one in-flight call between concurrent callers using the same key.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight wait for it and receive the same result or exception. Once the call
+    finishes the key is forgotten, so later callers start a fresh call.
+
+    Example:
+        >>> flights: SingleFlight[FlureeResponse] = SingleFlight()
+        >>> response = flights.do(key, lambda: session.execute(query))
+    """
+
+    coalesced: int = field(default=0, init=False)
+    """Number of callers that were served by another caller's in-flight call."""
+
+    _calls: dict[str, _Call[T]] = field(default_factory=dict, init=False, repr=False)
+    _tasks: dict[tuple[asyncio.AbstractEventLoop, str], "asyncio.Task[T]"] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run `fn` unless a call for `key` is in flight, then share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await `fn` unless a call for `key` is in flight, then share its outcome.
+
+        Calls are shared per event loop. A cancelled caller does not cancel the
+        shared call for the others.
+        """
+        loop = asyncio.get_running_loop()
+        flight = (loop, key)
+        with self._lock:
+            task = self._tasks.get(flight)
+            if task is None:
+                task = self._tasks[flight] = loop.create_task(_run(fn))
+                task.add_done_callback(lambda done: self._forget(flight, done))
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(
+        self, flight: tuple[asyncio.AbstractEventLoop, str], task: "asyncio.Task[T]"
+    ) -> None:
+        with self._lock:
+            self._tasks.pop(flight, None)
+        # Mark the outcome as retrieved, every waiter may have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+async def _run(fn: Callable[[], Awaitable[T]]) -> T:
+    return await fn()
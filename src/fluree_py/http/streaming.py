@@ -0,0 +1,114 @@
+"""Incremental parsing of JSON arrays from a stream of byte chunks."""
+
+import codecs
+import json
+import re
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_CONTAINER_START = frozenset('{["')
+
+# Parser states, in the order they are normally visited
+_EXPECT_ARRAY = 0
+_EXPECT_FIRST = 1
+_EXPECT_ITEM = 2
+_EXPECT_SEPARATOR = 3
+_DONE = 4
+
+
+class JsonArrayParser:
+    """Split a top-level JSON array into its elements as bytes arrive.
+
+    Only the text of elements not yet complete is buffered, so memory stays
+    bounded by the largest element rather than the whole array. Elements are
+    decoded with the C accelerated `json` scanner; an element that is still
+    incomplete is retried only once the buffered text has doubled, which keeps
+    very large elements linear in their size.
+
+    Example:
+        >>> parser = JsonArrayParser()
+        >>> parser.feed(b'[{"@id": "ex:a"}, {"@i')
+        [{'@id': 'ex:a'}]
+        >>> parser.feed(b'd": "ex:b"}]')
+        [{'@id': 'ex:b'}]
+        >>> parser.close()
+        []
+
+    Exceptions:
+        ValueError: If the stream is not a well-formed JSON array.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _EXPECT_ARRAY
+        self._pending = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Consume a chunk and return the elements it completed.
+
+        Exceptions:
+            ValueError: If the data is not a well-formed JSON array.
+        """
+        self._buffer += self._text.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """Finish the stream and return any elements still held back.
+
+        Exceptions:
+            ValueError: If the array was not terminated or is malformed.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Incomplete JSON array")
+        return items
+
+    def _parse(self, *, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer, pos, size = self._buffer, 0, len(self._buffer)
+        while (pos := _WHITESPACE.match(buffer, pos).end()) < size:  # type: ignore[union-attr]
+            char = buffer[pos]
+            if self._state == _EXPECT_ARRAY:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                self._state, pos = _EXPECT_FIRST, pos + 1
+            elif self._state == _EXPECT_FIRST and char == "]":
+                self._state, pos = _DONE, pos + 1
+            elif self._state in (_EXPECT_FIRST, _EXPECT_ITEM):
+                if (decoded := self._decode(buffer, pos, final=final)) is None:
+                    break
+                item, pos = decoded
+                items.append(item)
+                self._state = _EXPECT_SEPARATOR
+            elif self._state == _EXPECT_SEPARATOR and char in ",]":
+                self._state, pos = (_EXPECT_ITEM if char == "," else _DONE), pos + 1
+            elif self._state == _DONE:
+                raise ValueError("Unexpected data after the end of the JSON array")
+            else:
+                raise ValueError(f"Unexpected {char!r} in JSON array")
+        self._buffer = buffer[pos:]
+        return items
+
+    def _decode(self, buffer: str, pos: int, *, final: bool) -> tuple[Any, int] | None:
+        size = len(buffer)
+        if not final and size - pos < 2 * self._pending:
+            return None
+        try:
+            item, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._pending = size - pos
+            return None
+        # A number or literal is only complete once its delimiter arrived,
+        # "12" may be the start of "12.5"
+        if buffer[pos] not in _CONTAINER_START and not final:
+            after = _WHITESPACE.match(buffer, end).end()  # type: ignore[union-attr]
+            if after == size or buffer[after] not in ",]":
+                self._pending = 0
+                return None
+        self._pending = 0
+        return item, end
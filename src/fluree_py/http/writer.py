@@ -0,0 +1,242 @@
+"""Write-behind buffering of inserts, flushed to a ledger in the background."""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Literal, Self
+
+from fluree_py.http.protocol.ledger import SupportsLedgerOperations
+from fluree_py.http.response import FlureeResponse
+from fluree_py.types.common import JsonObject
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["block", "drop", "raise"]
+"""What a write does when the buffer is full: wait for room, discard the item, or raise."""
+
+
+class BufferFullError(Exception):
+    """Raised when writing to a full buffer under the "raise" overflow policy."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class WriterStats:
+    """Item counters of a buffered writer."""
+
+    written: int
+    """Items accepted into the buffer."""
+    flushed: int
+    """Items committed successfully."""
+    failed: int
+    """Items whose commit failed."""
+    dropped: int
+    """Items discarded because the buffer was full."""
+    pending: int
+    """Items buffered or being committed."""
+
+
+@dataclass(kw_only=True)
+class BufferedLedgerWriter:
+    """Buffers inserts and commits them to a ledger in the background.
+
+    Writes return as soon as the item is buffered. A background task commits
+    the buffer in transactions of up to `batch_size` items whenever a full
+    batch is buffered, and everything buffered every `flush_interval`
+    seconds. At most `max_pending` items are buffered; a write to a full
+    buffer follows the `overflow` policy.
+
+    Commits go through `ledger`, usually `client.with_ledger(...)`, so they
+    share the client's pooled connections. Failed commits are not retried;
+    their items are counted as failed and passed to `on_error` with the failed
+    response or exception. `on_error` runs on the background task; exceptions
+    it raises are logged and do not stop the writer.
+
+    Example:
+        >>> async with BufferedLedgerWriter(ledger=client.with_ledger("metrics")) as writer:
+        ...     await writer.write({"@id": "ex:sample-1", "ex:value": 0.5})
+
+    Exceptions:
+        ValueError: If a size or the interval is not positive.
+    """
+
+    ledger: SupportsLedgerOperations
+    context: JsonObject | None = None
+    batch_size: int = 500
+    flush_interval: float = 1.0
+    max_pending: int = 10_000
+    overflow: OverflowPolicy = "block"
+    on_error: Callable[[list[JsonObject], FlureeResponse | Exception], None] | None = None
+
+    _buffer: deque[JsonObject] = field(default_factory=deque, init=False, repr=False)
+    _runner: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+    _wakeup: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _room: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _idle: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _draining: bool = field(default=False, init=False)
+    _closed: bool = field(default=False, init=False)
+    _in_flight: int = field(default=0, init=False)
+    _written: int = field(default=0, init=False)
+    _flushed: int = field(default=0, init=False)
+    _failed: int = field(default=0, init=False)
+    _dropped: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.batch_size < 1 or self.max_pending < 1 or self.flush_interval <= 0:
+            raise ValueError("batch_size, max_pending and flush_interval must be positive")
+        self._idle.set()
+
+    @property
+    def stats(self) -> WriterStats:
+        """Current counters of the writer."""
+        return WriterStats(
+            written=self._written,
+            flushed=self._flushed,
+            failed=self._failed,
+            dropped=self._dropped,
+            pending=len(self._buffer) + self._in_flight,
+        )
+
+    async def write(self, data: JsonObject) -> bool:
+        """Buffers an item, waiting for room under the "block" policy.
+
+        Returns False when the item was dropped.
+
+        Exceptions:
+            BufferFullError: If the buffer is full under the "raise" policy.
+            RuntimeError: If the writer has been closed.
+        """
+        self._ensure_open()
+        while len(self._buffer) >= self.max_pending:
+            if self.overflow != "block":
+                return self._overflow()
+            self._room.clear()
+            await self._room.wait()
+            self._ensure_open()
+        self._append(data)
+        return True
+
+    def write_nowait(self, data: JsonObject) -> bool:
+        """Buffers an item without waiting; a full buffer raises under the "block" policy.
+
+        Must be called from the event loop's thread. Returns False when the
+        item was dropped.
+
+        Exceptions:
+            BufferFullError: If the buffer is full under the "block" or "raise" policy.
+            RuntimeError: If the writer has been closed.
+        """
+        self._ensure_open()
+        if len(self._buffer) >= self.max_pending:
+            return self._overflow()
+        self._append(data)
+        return True
+
+    async def flush(self) -> None:
+        """Commits everything buffered so far and waits until it is done."""
+        if self._idle.is_set():
+            return
+        self._draining = True
+        self._wakeup.set()
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Flushes the buffer and stops the background task; later writes raise.
+
+        Exceptions:
+            RuntimeError: If buffered items could not be flushed.
+        """
+        self._closed = True
+        self._room.set()
+        await self.flush()
+        if (runner := self._runner) is not None:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+        if self._buffer:
+            raise RuntimeError(f"Writer closed with {len(self._buffer)} items not flushed")
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Writer is closed")
+
+    def _overflow(self) -> bool:
+        if self.overflow == "drop":
+            self._dropped += 1
+            return False
+        raise BufferFullError(f"Buffer holds {self.max_pending} items")
+
+    def _append(self, data: JsonObject) -> None:
+        self._buffer.append(data)
+        self._written += 1
+        self._idle.clear()
+        if self._runner is None:
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+        if len(self._buffer) >= self.max_pending:
+            # Commit a full buffer right away, so blocked writes need not wait for the interval
+            self._draining = True
+            self._wakeup.set()
+        elif len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                    drain = self._draining
+                except TimeoutError:
+                    drain = True
+                self._wakeup.clear()
+                self._draining = False
+                # Woken by a full batch, send full batches only; drain on timeouts and flushes
+                while len(self._buffer) >= self.batch_size or (drain and self._buffer):
+                    size = min(self.batch_size, len(self._buffer))
+                    batch = [self._buffer.popleft() for _ in range(size)]
+                    self._room.set()
+                    await self._commit(batch)
+                if not self._buffer:
+                    self._idle.set()
+        except Exception:
+            logger.exception("Buffered writer stopped with %d items buffered", len(self._buffer))
+        finally:
+            # Let waiting flushes return if the task failed; the next write restarts it
+            self._runner = None
+            self._idle.set()
+
+    async def _commit(self, batch: list[JsonObject]) -> None:
+        self._in_flight = len(batch)
+        transaction = self.ledger.transaction()
+        if self.context:
+            transaction = transaction.with_context(self.context)
+        try:
+            response = await transaction.with_insert(batch).acommit()
+        except Exception as e:
+            self._failed_batch(batch, e)
+        else:
+            if response.is_success:
+                self._flushed += len(batch)
+            else:
+                self._failed_batch(batch, response)
+        finally:
+            self._in_flight = 0
+
+    def _failed_batch(self, batch: list[JsonObject], error: FlureeResponse | Exception) -> None:
+        self._failed += len(batch)
+        if self.on_error is not None:
+            try:
+                self.on_error(batch, error)
+            except Exception:
+                logger.exception("on_error callback of a buffered writer failed")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
@@ -0,0 +1,101 @@
+"""Bulk load an NDJSON or JSON-LD file into a Fluree ledger.
+
+The load is checkpointed after every committed chunk; run the same command
+again to resume an interrupted load.
+
+Usage:
+    python -m fluree_py.load people.jsonld --ledger example/people --create
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+from fluree_py.bulk import BulkLoader, LoadStats, flatten_context
+from fluree_py.http.chunked import ChunkedCommitError, ChunkPolicy
+from fluree_py.http.client import FlureeClient
+
+
+def _format(stats: LoadStats) -> str:
+    return (
+        f"{stats.records} records, {stats.bytes / 1e6:.1f} MB in {stats.elapsed:.1f}s "
+        f"({stats.records_per_second:.0f} records/s, "
+        f"{stats.bytes_per_second / 1e6:.2f} MB/s), t={stats.t}"
+    )
+
+
+def _reporter(interval: float) -> Callable[[LoadStats], None]:
+    last = 0.0
+
+    def report(stats: LoadStats) -> None:
+        nonlocal last
+        if (now := time.monotonic()) - last >= interval:
+            last = now
+            print(_format(stats), file=sys.stderr)
+
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("source", help="NDJSON (.ndjson, .jsonl) or JSON-LD file")
+    parser.add_argument("--ledger", required=True)
+    parser.add_argument("--url", default="http://localhost:8090", help="Fluree server URL")
+    parser.add_argument("--create", action="store_true", help="create the ledger first")
+    parser.add_argument("--format", choices=["ndjson", "jsonld"], help="default: by suffix")
+    parser.add_argument("--context", help="JSON file with an @context for every transaction")
+    parser.add_argument("--checkpoint", help="default: <source>.checkpoint")
+    parser.add_argument("--batch-size", type=int, default=500, help="initial records per chunk")
+    parser.add_argument("--max-batch-size", type=int, default=10_000)
+    parser.add_argument("--max-bytes", type=int, default=1024 * 1024, help="per chunk")
+    parser.add_argument("--concurrency", type=int, default=4, help="chunks in flight")
+    parser.add_argument(
+        "--retry-ambiguous",
+        action="store_true",
+        help="also retry chunks after timeouts and server errors, which may insert them twice",
+    )
+    parser.add_argument("--progress-interval", type=float, default=1.0, help="seconds")
+    args = parser.parse_args(argv)
+
+    context = None
+    if args.context:
+        with open(args.context, "rb") as f:
+            context = json.load(f)
+        if isinstance(context, dict) and "@context" in context:
+            context = context["@context"]
+        try:
+            context = flatten_context(context)
+        except ValueError as e:
+            parser.error(str(e))
+    policy = ChunkPolicy(
+        initial_items=args.batch_size,
+        max_items=max(args.max_batch_size, args.batch_size),
+        max_bytes=args.max_bytes,
+        concurrency=args.concurrency,
+        retry_ambiguous=args.retry_ambiguous,
+    )
+
+    with FlureeClient(base_url=args.url) as client:
+        loader = BulkLoader(
+            client=client,
+            ledger=args.ledger,
+            context=context,
+            create=args.create,
+            policy=policy,
+            progress=_reporter(args.progress_interval),
+        )
+        try:
+            stats = loader.load(args.source, format=args.format, checkpoint=args.checkpoint)
+        except ChunkedCommitError as e:
+            print(f"Load stopped: {e}", file=sys.stderr)
+            return 1
+    print(_format(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
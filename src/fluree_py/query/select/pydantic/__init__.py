@@ -6,7 +6,11 @@ from fluree_py.query.select.pydantic.error import (
     ModelConfigError,
     TypeProcessingError,
 )
-from fluree_py.query.select.pydantic.builder import FlureeSelectBuilder, from_pydantic
+from fluree_py.query.select.pydantic.builder import (
+    FlureeSelectBuilder,
+    Projection,
+    from_pydantic,
+)
 from fluree_py.query.select.pydantic.warning import (
     ListOrderWarning,
     PossibleEmptyModelWarning,
@@ -21,6 +25,7 @@ __all__ = [
     "ModelConfigError",
     "TypeProcessingError",
     "FlureeSelectBuilder",
+    "Projection",
     "ListOrderWarning",
     "PossibleEmptyModelWarning",
 ]
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
+from threading import Lock
 from types import UnionType
 from typing import (
     Any,
+    Literal,
     Protocol,
     Type,
     TypeAlias,
@@ -12,6 +14,7 @@ from typing import (
     get_type_hints,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ConfigDict
 
@@ -43,6 +46,14 @@ FieldType: TypeAlias = Union[
     None,
 ]  # More specific type for field types in Pydantic models
 
+Projection: TypeAlias = Literal["wildcard", "explicit"]
+"""How a select names the predicates of a node.
+
+`"wildcard"` selects every predicate with `"*"`; `"explicit"` lists only the
+predicates a model declares, falling back to `"*"` for models that allow extra
+fields.
+"""
+
 
 @runtime_checkable
 class HasModelConfig(Protocol):
@@ -51,10 +62,29 @@ class HasModelConfig(Protocol):
     model_config: ConfigDict
 
 
+@dataclass(frozen=True)
+class _PendingSelect:
+    """A model whose select list still has to be filled in."""
+
+    model: Type[BaseModel]
+    select: list[Any]
+    depth: int
+    path: frozenset[Type[BaseModel]]
+    leaf: bool = False
+    """Nested models of a leaf are only referenced, not expanded."""
+
+
 @dataclass
 class FlureeSelectBuilder:
     """Builds Fluree select queries from Pydantic models.
 
+    Nested models are expanded into sub-selects until a model repeats on its
+    own path. The repeat is selected as a leaf, with its own predicates but
+    only references to its nested models, so recursive models crawl each
+    relationship once. With `max_depth` they are instead expanded to exactly
+    that many levels, past which the related nodes are returned as
+    `{"@id": ...}` references.
+
     Example:
         >>> class User(BaseModel):
         ...     id: str
@@ -62,11 +92,45 @@ class FlureeSelectBuilder:
         >>> builder = FlureeSelectBuilder()
         >>> query = builder.build(User)
         >>> assert query == ["*"]
+        >>> FlureeSelectBuilder(projection="explicit").build(User)
+        ['@id', 'name']
     """
 
+    projection: Projection = "wildcard"
+    max_depth: int | None = None
     warning_manager: WarningManager = field(default_factory=WarningManager)
     select: list[Any] = field(default_factory=lambda: ["*"])
-    _processed_models: set[Type[BaseModel]] = field(default_factory=set)
+    _pending: list[_PendingSelect] = field(default_factory=list)
+    _type_hints: dict[Type[BaseModel], dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.max_depth is not None and self.max_depth < 0:
+            raise ValueError(f"max_depth must not be negative, got {self.max_depth}")
+
+    def _get_type_hints(self, model: Type[BaseModel]) -> dict[str, Any]:
+        """Resolve a model's type hints once per build."""
+        hints = self._type_hints.get(model)
+        if hints is None:
+            hints = self._type_hints[model] = get_type_hints(model, include_extras=True)
+        return hints
+
+    def _initial_select(self, model: Type[BaseModel]) -> list[Any]:
+        """Start a model's select with the predicates it always needs."""
+        if self.projection == "wildcard" or TypeChecker.allows_extra(model):
+            return ["*"]
+        return ["@id"] if "id" in self._get_type_hints(model) else []
+
+    def _predicate(self, model: Type[BaseModel], field_name: str) -> str:
+        """Name the predicate a field is read from, honouring its alias."""
+        if self.projection == "wildcard":
+            return field_name
+        info = model.model_fields.get(field_name)
+        return info.alias if info is not None and info.alias else field_name
+
+    def _select_predicate(self, field_name: str, select: list[Any]) -> None:
+        """Add a field's predicate unless the select already covers it with "*"."""
+        if "*" not in select:
+            select.append(field_name)
 
     def _validate_model_config(self, model: Type[BaseModel]) -> None:
         """Validate the model configuration.
@@ -91,46 +155,75 @@ class FlureeSelectBuilder:
                 ) from e
             raise
 
+    def _references_only(self, parent: _PendingSelect) -> bool:
+        """Check if nested models below `parent` are selected as references only."""
+        if self.max_depth is not None:
+            return parent.depth >= self.max_depth
+        return parent.leaf
+
     def _process_nested_model(
         self,
         field_name: str,
         field_type: Type[BaseModel],
-    ) -> dict[str, Any]:
-        """Process a nested model and return its select structure.
+        parent: _PendingSelect,
+    ) -> None:
+        """Add a nested model's select to its parent and queue it for processing.
 
         Raises:
             MissingIdFieldError: If the nested model requires an id field but doesn't have one
             ModelConfigError: If there's an issue with the model configuration
         """
-        # Prevent infinite recursion
-        if field_type in self._processed_models:
-            return {field_name: ["*"]}
-        self._processed_models.add(field_type)
+        # Stop the crawl here, the server then returns references to the nodes
+        if self._references_only(parent):
+            self._select_predicate(field_name, parent.select)
+            return
 
         # Validate model configuration
         self._validate_model_config(field_type)
 
-        if TypeChecker.check_model_requires_id(
-            field_type
-        ) and not TypeChecker.check_model_has_id(field_type):
+        fields = self._get_type_hints(field_type)
+        if TypeChecker.check_model_requires_id(field_type) and "id" not in fields:
             raise MissingIdFieldError(
                 f"Nested model '{field_type.__name__}' must have an 'id' field"
             )
 
-        fields = get_type_hints(field_type, include_extras=True)
-        select = ["*"]
-
-        for nested_field_name, nested_field_type in fields.items():
-            if TypeChecker.is_id_field(nested_field_name):
-                continue
+        select = self._initial_select(field_type)
+        parent.select.append({field_name: select})
+        self._pending.append(
+            _PendingSelect(
+                model=field_type,
+                select=select,
+                depth=parent.depth + 1,
+                path=parent.path | {field_type},
+                leaf=self.max_depth is None and field_type in parent.path,
+            )
+        )
 
-            real_type = TypeChecker.get_real_type(nested_field_type)
-            self._process_field(nested_field_name, real_type, select)
+    def _compile(self, root: _PendingSelect) -> None:
+        """Fill in the selects of a model and all its nested models.
 
-        return {field_name: select}
+        Models are processed from an explicit stack rather than by recursion,
+        so deep model graphs are not limited by Python's recursion limit.
+        """
+        self._pending.append(root)
+        while self._pending:
+            node = self._pending.pop()
+            for field_name, field_type in self._get_type_hints(node.model).items():
+                if TypeChecker.is_id_field(field_name):
+                    continue
+
+                # The root model only unwraps `X | None` unions
+                real_type = (
+                    self._handle_union_type(field_type)
+                    if node is root
+                    else TypeChecker.get_real_type(field_type)
+                )
+                self._process_field(
+                    self._predicate(node.model, field_name), real_type, node
+                )
 
     def _process_field(
-        self, field_name: str, field_type: Any, select: list[Any]
+        self, field_name: str, field_type: Any, node: _PendingSelect
     ) -> None:
         """Process a field and add its select structure to the result.
 
@@ -149,23 +242,26 @@ class FlureeSelectBuilder:
                     if args:
                         inner_type = TypeChecker.get_real_type(args[0])
                         if TypeChecker.is_base_model(inner_type):
-                            select.append(
-                                self._process_nested_model(field_name, inner_type)
-                            )
+                            self._process_nested_model(field_name, inner_type, node)
                         elif TypeChecker.is_dict_type(inner_type):
-                            select.append({field_name: ["*"]})
+                            node.select.append({field_name: ["*"]})
+                        else:
+                            self._select_predicate(field_name, node.select)
+                    else:
+                        self._select_predicate(field_name, node.select)
                     return
 
                 case t if TypeChecker.is_base_model(t):
-                    select.append(self._process_nested_model(field_name, t))
+                    self._process_nested_model(field_name, t, node)
                     return
 
                 case t if TypeChecker.is_dict_type(t):
-                    select.append({field_name: ["*"]})
+                    node.select.append({field_name: ["*"]})
                     return
 
                 case t if TypeChecker.is_primitive_type(t):
-                    # Primitive types are included in "*" so we don't need to add them explicitly
+                    # Primitive types are included in "*" and only listed when explicit
+                    self._select_predicate(field_name, node.select)
                     return
 
                 case _:
@@ -272,7 +368,7 @@ class FlureeSelectBuilder:
             if isinstance(pydantic_model, BaseModel)
             else pydantic_model
         )
-        fields = get_type_hints(model_type, include_extras=True)
+        fields = self._get_type_hints(model_type)
 
         # Early validation checks
         if "id" not in fields:
@@ -284,13 +380,18 @@ class FlureeSelectBuilder:
         # Check for deeply nested structures
         self._check_deeply_nested_structures(fields)
 
-        # Process each field
-        for field_name, field_type in fields.items():
-            if field_name == "id":
-                continue
+        if self.projection == "explicit":
+            self.select = self._initial_select(model_type)
 
-            field_type = self._handle_union_type(field_type)
-            self._process_field(field_name, field_type, self.select)
+        # Process each field and nested model
+        self._compile(
+            _PendingSelect(
+                model=model_type,
+                select=self.select,
+                depth=0,
+                path=frozenset({model_type}),
+            )
+        )
 
         # Check for optional fields
         self._check_optional_fields(fields)
@@ -300,15 +401,75 @@ class FlureeSelectBuilder:
         return self.select
 
 
-def from_pydantic(model: Type[BaseModel]) -> list[Any]:
+_SelectOptions: TypeAlias = tuple[Projection, int | None]
+_compiled_selects: "WeakKeyDictionary[Type[BaseModel], dict[_SelectOptions, list[Any]]]" = (
+    WeakKeyDictionary()
+)
+_compiled_selects_lock = Lock()
+
+
+def _copy_select(select: list[Any]) -> list[Any]:
+    """Copy a select structure, which only holds lists, dicts and strings.
+
+    Nested lists are copied from an explicit stack, as selects of deep model
+    chains nest deeper than Python's recursion limit.
+    """
+    copy: list[Any] = []
+    stack = [(select, copy)]
+    while stack:
+        source, target = stack.pop()
+        for item in source:
+            if isinstance(item, dict):
+                nested: dict[str, list[Any]] = {}
+                for key, value in item.items():
+                    nested[key] = []
+                    stack.append((value, nested[key]))
+                item = nested
+            target.append(item)
+    return copy
+
+
+def from_pydantic(
+    model: Type[BaseModel],
+    *,
+    projection: Projection = "wildcard",
+    max_depth: int | None = None,
+) -> list[Any]:
     """Convert a Pydantic model to a Fluree select query structure.
 
+    With `projection="explicit"` the select names only the predicates the
+    model declares (by alias where one is set) instead of `"*"`, so the server
+    returns just what the model consumes. Models configured with
+    `extra="allow"` still select `"*"` since they keep undeclared predicates.
+
+    Recursive models are expanded until a model repeats on its path, the
+    repeat being selected without its nested models, or to `max_depth` levels
+    of nesting when given, which bounds the server's graph crawl either way.
+
+    The select is compiled once per model class and options and cached for
+    the life of the class, so warnings are emitted on the first call only. Each
+    call returns a fresh copy that is safe to modify.
+
     Example:
         >>> class User(BaseModel):
         ...     id: str
         ...     name: str
         >>> query = from_pydantic(User)
         >>> assert query == ["*"]
+        >>> from_pydantic(User, projection="explicit")
+        ['@id', 'name']
+
+    Raises:
+        ValueError: If max_depth is negative
     """
-    builder = FlureeSelectBuilder()
-    return builder.build(model)
+    model_type = type(model) if isinstance(model, BaseModel) else model
+    options = (projection, max_depth)
+    with _compiled_selects_lock:
+        select = _compiled_selects.get(model_type, {}).get(options)
+    if select is None:
+        builder = FlureeSelectBuilder(projection=projection, max_depth=max_depth)
+        select = builder.build(model_type)
+        with _compiled_selects_lock:
+            compiled = _compiled_selects.setdefault(model_type, {})
+            select = compiled.setdefault(options, select)
+    return _copy_select(select)
@@ -94,3 +94,10 @@ class TypeChecker:
 
         extra = config.get("extra", "ignore")
         return extra in ("forbid", None)
+
+    @classmethod
+    def allows_extra(cls, model: Type[BaseModel]) -> bool:
+        """Check if a model keeps undeclared fields, so it needs every predicate."""
+        if not cls.has_model_config(model):
+            return False
+        return model.model_config.get("extra") == "allow"
@@ -77,3 +77,16 @@ Examples:
     - {"t": {"from": 123, "to": 456}}
     - {"t": 123}
 """
+
+
+def is_pinned_time(t: Any) -> bool:
+    """Checks if a time clause refers only to fixed commits, never to "latest".
+
+    A commit number, `{"at": n}` and `{"from": n, "to": m}` are pinned; a clause
+    that is missing, mentions "latest" or leaves a range open is not.
+    """
+    if is_time_commit(t):
+        return True
+    if not is_time_constraint(t) or not all(is_time_commit(v) for v in t.values()):
+        return False
+    return "at" in t or ("from" in t and "to" in t)
@@ -0,0 +1,153 @@
+import json
+import threading
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+import respx
+from httpx import Request, Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.bulk import BulkLoader, Checkpoint, LoadStats
+from fluree_py.http.chunked import ChunkedCommitError, ChunkPolicy
+from fluree_py.load import main
+
+CONTEXT = {"ex": "http://example.org/"}
+NODES = [{"@id": f"ex:{i}", "ex:value": i} for i in range(50)]
+
+
+class Server:
+    """Answers create and transact requests, optionally failing one request."""
+
+    def __init__(self, fail_at: int | None = None) -> None:
+        self.t = 0
+        self.inserted: list[dict] = []
+        self.payloads: list[dict] = []
+        self.fail_at = fail_at
+        self.lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        payload = json.loads(request.content)
+        with self.lock:
+            self.payloads.append(payload)
+            if len(self.payloads) == self.fail_at:
+                return Response(400, json={"error": "invalid"})
+            self.t += 1
+            self.inserted.extend(payload["insert"])
+            return Response(200, json={"ledger": payload["ledger"], "t": self.t})
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090", assert_all_called=False) as respx_mock:
+        yield respx_mock
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "nodes.jsonld"
+    path.write_text(json.dumps({"@context": CONTEXT, "@graph": NODES}, indent=1))
+    return path
+
+
+def loader(concurrency: int = 2, **kwargs) -> BulkLoader:
+    client = FlureeClient(base_url="http://localhost:8090")
+    policy = ChunkPolicy(initial_items=5, max_items=5, concurrency=concurrency)
+    return BulkLoader(client=client, ledger="test", policy=policy, **kwargs)
+
+
+def test_loads_and_checkpoints(mocked_api: MockRouter, source: Path):
+    server = Server()
+    create = mocked_api.post("/fluree/create").mock(side_effect=server)
+    mocked_api.post("/fluree/transact").mock(side_effect=server)
+    reports: list[LoadStats] = []
+
+    stats = loader(create=True, progress=reports.append).load(source)
+
+    assert create.call_count == 1
+    assert sorted(server.inserted, key=lambda node: node["ex:value"]) == NODES
+    assert all(payload["@context"] == CONTEXT for payload in server.payloads)
+    assert stats.records == len(NODES)
+    assert stats.t == server.t
+    assert stats.records_per_second > 0
+    assert [report.records for report in reports] == sorted(r.records for r in reports)
+
+    checkpoint = Checkpoint.load(Path(f"{source}.checkpoint"))
+    assert checkpoint is not None
+    assert checkpoint.records == len(NODES)
+    assert stats.offset == checkpoint.offset
+
+    # A finished load is not repeated
+    assert loader().load(source).records == 0
+    assert len(server.inserted) == len(NODES)
+
+
+def test_resumes_from_checkpoint(mocked_api: MockRouter, source: Path):
+    server = Server(fail_at=4)
+    mocked_api.post("/fluree/transact").mock(side_effect=server)
+
+    with pytest.raises(ChunkedCommitError):
+        loader(concurrency=1).load(source)
+    checkpoint = Checkpoint.load(Path(f"{source}.checkpoint"))
+    assert checkpoint is not None
+    assert checkpoint.records == 15
+
+    stats = loader().load(source)
+
+    assert stats.records == len(NODES) - 15
+    assert sorted(server.inserted, key=lambda node: node["ex:value"]) == NODES
+
+
+def test_failing_progress_callback_stops_the_load(mocked_api: MockRouter, source: Path):
+    server = Server()
+    mocked_api.post("/fluree/transact").mock(side_effect=server)
+
+    def progress(stats: LoadStats) -> None:
+        raise OSError("disk full")
+
+    with pytest.raises(ChunkedCommitError) as excinfo:
+        loader(concurrency=1, progress=progress).load(source)
+
+    assert isinstance(excinfo.value.__cause__, OSError)
+    assert excinfo.value.committed.items == 5
+    assert len(server.payloads) == 1
+
+
+def test_rejects_foreign_checkpoint(source: Path):
+    path = Path(f"{source}.checkpoint")
+    Checkpoint(source=str(source.resolve()), size=1, ledger="test", offset=0, records=0).save(path)
+
+    with pytest.raises(ValueError):
+        loader().load(source)
+
+
+def test_list_context_is_merged_with_loader_context(mocked_api: MockRouter, tmp_path: Path):
+    server = Server()
+    mocked_api.post("/fluree/transact").mock(side_effect=server)
+    path = tmp_path / "nodes.jsonld"
+    path.write_text(json.dumps({"@context": [CONTEXT, {"a": "b"}], "@graph": NODES}))
+
+    loader(context={"schema": "http://schema.org/"}).load(path)
+
+    expected = CONTEXT | {"a": "b", "schema": "http://schema.org/"}
+    assert all(payload["@context"] == expected for payload in server.payloads)
+
+
+@pytest.mark.parametrize("document", [{"@context": CONTEXT}, CONTEXT, [CONTEXT]])
+def test_command_line(
+    mocked_api: MockRouter, tmp_path: Path, capsys: pytest.CaptureFixture, document: object
+):
+    server = Server()
+    mocked_api.post("/fluree/transact").mock(side_effect=server)
+    path = tmp_path / "nodes.ndjson"
+    path.write_text("\n".join(json.dumps(node) for node in NODES))
+    context = tmp_path / "context.json"
+    context.write_text(json.dumps(document))
+
+    code = main([str(path), "--ledger", "test", "--context", str(context), "--batch-size", "7"])
+
+    assert code == 0
+    assert "50 records" in capsys.readouterr().out
+    assert len(server.inserted) == len(NODES)
+    assert all(payload["@context"] == CONTEXT for payload in server.payloads)
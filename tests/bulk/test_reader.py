@@ -0,0 +1,118 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fluree_py.bulk import RecordReader, detect_format, flatten_context
+
+NODES = [
+    {"@id": "ex:a", "ex:label": 'brackets ]} and "quotes", inside'},
+    {"@id": "ex:b", "ex:list": [1, {"ex:nested": [2, 3]}]},
+    {"@id": "ex:c"},
+]
+
+
+def read(path: Path, start: int = 0) -> list[dict]:
+    with RecordReader(path) as reader:
+        return [json.loads(record) for _, record in reader.records(start)]
+
+
+def test_detect_format():
+    assert detect_format("dump.ndjson") == "ndjson"
+    assert detect_format("dump.JSONL") == "ndjson"
+    assert detect_format("dump.jsonld") == "jsonld"
+    assert detect_format("dump.json") == "jsonld"
+
+
+def test_reads_ndjson_lines(tmp_path: Path):
+    path = tmp_path / "nodes.ndjson"
+    path.write_text("\n".join(json.dumps(node) for node in NODES) + "\n\n")
+
+    assert read(path) == NODES
+
+
+def test_reads_jsonld_array(tmp_path: Path):
+    path = tmp_path / "nodes.json"
+    path.write_text(json.dumps(NODES, indent=2))
+
+    assert read(path) == NODES
+
+
+def test_reads_jsonld_graph_and_context(tmp_path: Path):
+    path = tmp_path / "nodes.jsonld"
+    context = {"ex": "http://example.org/"}
+    path.write_text(json.dumps({"@context": context, "@graph": NODES}, indent=1))
+
+    with RecordReader(path) as reader:
+        assert reader.context == context
+        assert [json.loads(record) for _, record in reader.records()] == NODES
+
+
+def test_flattens_list_context(tmp_path: Path):
+    path = tmp_path / "nodes.jsonld"
+    context = [{"ex": "http://example.org/"}, {"schema": "http://schema.org/"}]
+    path.write_text(json.dumps({"@context": context, "@graph": NODES}))
+
+    with RecordReader(path) as reader:
+        assert reader.context == {"ex": "http://example.org/", "schema": "http://schema.org/"}
+    assert flatten_context([{"ex": "http://example.org/"}, None, {"a": "b"}]) == {"a": "b"}
+
+
+def test_rejects_remote_context(tmp_path: Path):
+    path = tmp_path / "nodes.jsonld"
+    path.write_text(json.dumps({"@context": ["https://schema.org/", {}], "@graph": NODES}))
+
+    with pytest.raises(ValueError, match="Remote @context"):
+        RecordReader(path)
+
+
+def test_rejects_context_after_graph(tmp_path: Path):
+    path = tmp_path / "nodes.jsonld"
+    nested = [*NODES, {"@id": "ex:d", "@context": {"ex": "http://example.org/"}}]
+    path.write_text(json.dumps({"@graph": nested, "@context": {"ex": "http://example.org/"}}))
+    valid = tmp_path / "valid.jsonld"
+    valid.write_text(json.dumps({"@graph": nested, "ex:note": "no @context here"}))
+
+    with pytest.raises(ValueError, match="must precede @graph"):
+        RecordReader(path)
+    assert read(valid) == nested
+
+
+def test_reads_single_jsonld_node(tmp_path: Path):
+    path = tmp_path / "node.jsonld"
+    node = {"@context": {"ex": "http://example.org/"}, "@id": "ex:a"}
+    path.write_text(json.dumps(node))
+
+    with RecordReader(path) as reader:
+        assert reader.context is None
+        assert [json.loads(record) for _, record in reader.records()] == [node]
+
+
+@pytest.mark.parametrize("name", ["nodes.ndjson", "nodes.json"])
+def test_resumes_after_record_end(tmp_path: Path, name: str):
+    path = tmp_path / name
+    if name.endswith(".ndjson"):
+        path.write_text("\n".join(json.dumps(node) for node in NODES))
+    else:
+        path.write_text(json.dumps(NODES))
+
+    with RecordReader(path) as reader:
+        ends = [end for end, _ in reader.records()]
+
+    assert read(path, ends[0]) == NODES[1:]
+    assert read(path, ends[-1]) == []
+
+
+def test_empty_file(tmp_path: Path):
+    path = tmp_path / "empty.ndjson"
+    path.write_bytes(b"")
+
+    assert read(path) == []
+
+
+def test_truncated_array(tmp_path: Path):
+    path = tmp_path / "broken.json"
+    path.write_text('[{"@id": "ex:a"}, {"@id": ')
+
+    with pytest.raises(ValueError):
+        read(path)
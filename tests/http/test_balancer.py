@@ -0,0 +1,113 @@
+from typing import Generator
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.balancer import (
+    EwmaLatency,
+    HealthPolicy,
+    LeastOutstanding,
+    Node,
+    NodePool,
+)
+
+NODES = ["http://node-a:8090", "http://node-b:8090"]
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(assert_all_called=False) as respx_mock:
+        respx_mock.post("http://node-a:8090/fluree/query", name="a").return_value = Response(
+            200, json=[]
+        )
+        respx_mock.post("http://node-b:8090/fluree/query", name="b").return_value = Response(
+            200, json=[]
+        )
+        yield respx_mock
+
+
+def test_round_robin_spreads_requests(mocked_api: MockRouter):
+    client = FlureeClient(base_urls=NODES)
+    query = client.with_ledger("test").query()
+
+    for _ in range(4):
+        query.commit()
+
+    assert mocked_api["a"].call_count == 2
+    assert mocked_api["b"].call_count == 2
+    assert mocked_api["b"].calls.last.request.headers["Host"] == "node-b:8090"
+    assert [m.requests for m in client.node_metrics()] == [2, 2]
+
+
+def test_failing_node_is_ejected(mocked_api: MockRouter):
+    mocked_api["b"].side_effect = httpx.ConnectError("connection refused")
+    client = FlureeClient(base_urls=NODES, health=HealthPolicy(max_failures=1))
+    query = client.with_ledger("test").query()
+
+    query.commit()
+    with pytest.raises(httpx.ConnectError):
+        query.commit()
+    for _ in range(3):
+        query.commit()
+
+    assert mocked_api["a"].call_count == 4
+    assert mocked_api["b"].call_count == 1
+
+    node_a, node_b = client.node_metrics()
+    assert not node_a.ejected and node_a.ewma_latency is not None
+    assert node_b.ejected and node_b.failures == 1
+
+
+def test_server_errors_count_as_failures(mocked_api: MockRouter):
+    mocked_api["a"].return_value = Response(503)
+    client = FlureeClient(base_urls=NODES, health=HealthPolicy(max_failures=2))
+    query = client.with_ledger("test").query()
+
+    for _ in range(6):
+        query.commit()
+
+    assert mocked_api["a"].call_count == 2
+    assert client.node_metrics()[0].ejected
+
+
+@pytest.mark.asyncio
+async def test_async_requests_are_balanced(mocked_api: MockRouter):
+    client = FlureeClient(base_urls=NODES)
+
+    await client.execute_many([client.with_ledger("test").query()] * 6, concurrency=2)
+
+    assert mocked_api["a"].call_count == 3
+    assert mocked_api["b"].call_count == 3
+    assert all(m.outstanding == 0 for m in client.node_metrics())
+
+
+def test_least_outstanding_strategy():
+    nodes = [Node(url="a", outstanding=3), Node(url="b", outstanding=1)]
+
+    assert LeastOutstanding().select(nodes).url == "b"
+
+
+def test_ewma_strategy_prefers_fast_and_unsampled_nodes():
+    pool = NodePool(urls=["a", "b", "c"], strategy=EwmaLatency())
+    a, b, c = pool.nodes
+    pool.acquire()
+    pool.release(a, latency=0.5, failed=False)
+    pool.acquire()
+    pool.release(b, latency=0.1, failed=False)
+
+    assert pool.acquire() is c
+    pool.release(c, latency=0.3, failed=False)
+    assert pool.acquire() is b
+
+
+def test_client_requires_one_kind_of_url():
+    with pytest.raises(ValueError):
+        FlureeClient()
+    with pytest.raises(ValueError):
+        FlureeClient(base_url=NODES[0], base_urls=NODES)
+
+    assert FlureeClient(base_url=NODES[0]).node_metrics() == []
@@ -0,0 +1,162 @@
+import asyncio
+import json
+from collections.abc import Generator
+
+import pytest
+import respx
+from httpx import Request, Response
+
+from fluree_py import FlureeClient
+from fluree_py.http.writer import BufferedLedgerWriter, BufferFullError
+
+
+class Server:
+    """Commits transactions, failing those that insert an invalid node."""
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.payloads: list[dict] = []
+
+    async def __call__(self, request: Request) -> Response:
+        payload = json.loads(request.content)
+        self.payloads.append(payload)
+        await asyncio.sleep(self.delay)
+        if any(node.get("invalid") for node in payload["insert"]):
+            return Response(400, json={"error": "invalid node"})
+        return Response(200, json={"ledger": payload["ledger"], "t": len(self.payloads)})
+
+
+@pytest.fixture
+def server() -> Generator[Server, None, None]:
+    server = Server()
+    with respx.mock(base_url="http://localhost:8090", assert_all_called=False) as respx_mock:
+        respx_mock.post("/fluree/transact").mock(side_effect=server)
+        yield server
+
+
+def writer(**kwargs) -> BufferedLedgerWriter:
+    client = FlureeClient(base_url="http://localhost:8090")
+    return BufferedLedgerWriter(ledger=client.with_ledger("metrics"), **kwargs)
+
+
+def sample(i: int, **extra) -> dict:
+    return {"@id": f"ex:sample-{i}", "ex:value": i, **extra}
+
+
+@pytest.mark.asyncio
+async def test_full_batches_flush_in_background(server: Server):
+    buffered = writer(batch_size=10, flush_interval=60)
+
+    for i in range(25):
+        assert await buffered.write(sample(i))
+    await asyncio.sleep(0.05)
+
+    assert [len(payload["insert"]) for payload in server.payloads] == [10, 10]
+    assert buffered.stats.pending == 5
+
+    await buffered.close()
+
+    assert [len(payload["insert"]) for payload in server.payloads] == [10, 10, 5]
+    assert buffered.stats.flushed == 25
+    assert buffered.stats.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_interval_flushes_partial_batches(server: Server):
+    buffered = writer(batch_size=100, flush_interval=0.02, context={"ex": "http://example.org/"})
+
+    buffered.write_nowait(sample(1))
+    await asyncio.sleep(0.1)
+
+    assert len(server.payloads) == 1
+    assert server.payloads[0]["@context"] == {"ex": "http://example.org/"}
+    await buffered.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_waits_for_commit(server: Server):
+    server.delay = 0.02
+    buffered = writer(batch_size=100, flush_interval=60)
+    for i in range(3):
+        buffered.write_nowait(sample(i))
+
+    await buffered.flush()
+
+    assert buffered.stats.flushed == 3
+    assert buffered.stats.pending == 0
+    await buffered.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_counted(server: Server):
+    errors: list[tuple[list, object]] = []
+    buffered = writer(batch_size=2, on_error=lambda batch, error: errors.append((batch, error)))
+
+    for i in range(4):
+        await buffered.write(sample(i, invalid=i == 3))
+    await buffered.close()
+
+    assert buffered.stats.flushed == 2
+    assert buffered.stats.failed == 2
+    assert errors[0][0] == [sample(2, invalid=False), sample(3, invalid=True)]
+
+
+@pytest.mark.asyncio
+async def test_overflow_drop_and_raise(server: Server):
+    server.delay = 0.05
+    dropping = writer(batch_size=2, max_pending=2, overflow="drop", flush_interval=60)
+    raising = writer(batch_size=2, max_pending=2, overflow="raise", flush_interval=60)
+
+    results = [dropping.write_nowait(sample(i)) for i in range(4)]
+    for i in range(2):
+        raising.write_nowait(sample(i))
+    with pytest.raises(BufferFullError):
+        raising.write_nowait(sample(2))
+
+    assert results == [True, True, False, False]
+    assert dropping.stats.dropped == 2
+    await dropping.close()
+    await raising.close()
+
+
+@pytest.mark.asyncio
+async def test_overflow_block_waits_for_room(server: Server):
+    server.delay = 0.02
+    buffered = writer(batch_size=2, max_pending=2, overflow="block", flush_interval=60)
+
+    await asyncio.gather(*(buffered.write(sample(i)) for i in range(10)))
+    await buffered.close()
+
+    assert buffered.stats.flushed == 10
+    assert buffered.stats.dropped == 0
+    with pytest.raises(RuntimeError):
+        await buffered.write(sample(11))
+
+
+@pytest.mark.asyncio
+async def test_raising_on_error_does_not_stop_draining(
+    server: Server, caplog: pytest.LogCaptureFixture
+):
+    def on_error(batch: list, error: object) -> None:
+        raise ValueError("callback failed")
+
+    buffered = writer(batch_size=2, flush_interval=60, on_error=on_error)
+    for i in range(5):
+        await buffered.write(sample(i, invalid=True))
+    await buffered.close()
+
+    assert buffered.stats.failed == 5
+    assert buffered.stats.pending == 0
+    assert "on_error callback" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_smaller_than_batch_is_committed(server: Server):
+    buffered = writer(batch_size=10, max_pending=3, overflow="block", flush_interval=60)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(buffered.write(sample(i)) for i in range(7))), timeout=1
+    )
+    await buffered.close()
+
+    assert buffered.stats.flushed == 7
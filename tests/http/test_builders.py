@@ -0,0 +1,86 @@
+import gc
+import json
+import weakref
+
+import pytest
+
+from fluree_py import FlureeClient
+from fluree_py.http.endpoint import (
+    QueryBuilderImpl,
+    TransactionBuilderImpl,
+    TransactionReadyToCommitImpl,
+)
+from fluree_py.http.mixin.utils import init_field_names, resolve_base_class_reference
+
+
+def test_builders_are_slotted():
+    ledger = FlureeClient(base_url="http://localhost:8090").with_ledger("test")
+
+    query = ledger.query().with_context({"ex": "http://example.org/"}).with_where([])
+    transaction = ledger.transaction().with_insert({"@id": "ex:freddy"})
+
+    assert not hasattr(query, "__dict__")
+    assert not hasattr(transaction, "__dict__")
+    assert not hasattr(ledger, "__dict__")
+
+
+def test_builder_copies_keep_fields():
+    client = FlureeClient(base_url="http://localhost:8090")
+    builder = client.with_ledger("test").transaction().with_context({"ex": "http://example.org/"})
+    assert isinstance(builder, TransactionBuilderImpl)
+
+    deleting = builder.with_delete({"@id": "ex:freddy"})
+
+    assert isinstance(deleting, TransactionReadyToCommitImpl)
+    assert deleting.session is client.session
+    assert json.loads(deleting.get_request().content) == {
+        "@context": {"ex": "http://example.org/"},
+        "ledger": "test",
+        "delete": {"@id": "ex:freddy"},
+    }
+
+
+def test_generic_resolution_is_cached(monkeypatch: pytest.MonkeyPatch):
+    assert resolve_base_class_reference(QueryBuilderImpl, "WithWhereMixin") is QueryBuilderImpl
+
+    def fail(cls: type, base_name: str) -> type:
+        raise AssertionError("resolved twice")
+
+    monkeypatch.setattr("fluree_py.http.mixin.utils.find_base_class", fail)
+    assert resolve_base_class_reference(QueryBuilderImpl, "WithWhereMixin") is QueryBuilderImpl
+
+
+def test_generic_resolution_does_not_keep_classes_alive():
+    namespace = {"__slots__": (), "__module__": QueryBuilderImpl.__module__}
+    dynamic = type("DynamicQueryBuilder", (QueryBuilderImpl,), namespace)
+    resolve_base_class_reference(dynamic, "WithWhereMixin")
+    init_field_names(dynamic)
+    collected = weakref.ref(dynamic)
+
+    del dynamic
+    gc.collect()
+
+    assert collected() is None
+
+
+def test_serialized_request_is_reused():
+    query = (
+        FlureeClient(base_url="http://localhost:8090")
+        .with_ledger("test")
+        .query()
+        .with_where([{"@id": "?s"}])
+    )
+    assert isinstance(query, QueryBuilderImpl)
+
+    first = query.get_request()
+    first.headers["X-Trace"] = "1"
+    second = query.get_request()
+
+    assert query.prepare() is query.prepare()
+    assert second.content is first.content
+    assert "X-Trace" not in second.headers
+    assert second.headers["Content-Length"] == str(len(second.content))
+
+    selecting = query.with_select({"?s": ["*"]})
+    assert json.loads(selecting.get_request().content)["select"] == {"?s": ["*"]}
+    assert selecting.prepare() is not query.prepare()
@@ -0,0 +1,141 @@
+import gzip
+import json
+import time
+from typing import Generator
+
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.cache import CachedResult, MemoryResultCache
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090", assert_all_called=False) as respx_mock:
+        respx_mock.post("/fluree/query", name="query").return_value = Response(
+            200, json=[{"@id": "ex:freddy"}]
+        )
+        respx_mock.post("/fluree/history", name="history").return_value = Response(200, json=[])
+        respx_mock.post("/fluree/transact", name="transact").return_value = Response(200)
+        yield respx_mock
+
+
+def result(size: int) -> CachedResult:
+    return CachedResult(status_code=200, headers=[], content=b"x" * size)
+
+
+def test_repeated_query_is_served_from_cache(mocked_api: MockRouter):
+    cache = MemoryResultCache()
+    client = FlureeClient(base_url="http://localhost:8090", cache=cache)
+    query = client.with_ledger("test").query().with_where([{"@id": "?s"}])
+
+    first = query.commit()
+    second = query.commit()
+
+    assert mocked_api["query"].call_count == 1
+    assert second.json() == first.json() == [{"@id": "ex:freddy"}]
+    assert second.headers["content-type"] == "application/json"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_compressed_response_is_replayed_decoded(mocked_api: MockRouter):
+    body = json.dumps([{"@id": "ex:freddy"}]).encode()
+    mocked_api["query"].return_value = Response(
+        200,
+        content=gzip.compress(body),
+        headers={"content-encoding": "gzip", "content-type": "application/json"},
+    )
+    client = FlureeClient(base_url="http://localhost:8090", cache=MemoryResultCache())
+    query = client.with_ledger("test").query()
+
+    query.commit()
+    cached = query.commit()
+
+    assert mocked_api["query"].call_count == 1
+    assert cached.json() == [{"@id": "ex:freddy"}]
+    assert "content-encoding" not in cached.headers
+    assert cached.headers["content-type"] == "application/json"
+
+
+def test_transaction_invalidates_only_its_ledger(mocked_api: MockRouter):
+    cache = MemoryResultCache()
+    client = FlureeClient(base_url="http://localhost:8090", cache=cache)
+    query, other = client.with_ledger("test").query(), client.with_ledger("other").query()
+
+    query.commit()
+    other.commit()
+    client.with_ledger("test").transaction().with_insert({"@id": "ex:a"}).commit()
+    query.commit()
+    other.commit()
+
+    assert mocked_api["query"].call_count == 3
+    assert cache.stats().invalidations == 1
+
+
+def test_failed_transaction_and_errors_are_not_cached(mocked_api: MockRouter):
+    mocked_api["transact"].return_value = Response(400)
+    mocked_api["history"].return_value = Response(500)
+    cache = MemoryResultCache()
+    client = FlureeClient(base_url="http://localhost:8090", cache=cache)
+
+    client.with_ledger("test").query().commit()
+    client.with_ledger("test").transaction().with_insert({"@id": "ex:a"}).commit()
+    client.with_ledger("test").history().commit()
+    client.with_ledger("test").history().commit()
+
+    assert cache.stats().invalidations == 0
+    assert cache.stats().entries == 1
+    assert mocked_api["history"].call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_queries_use_cache(mocked_api: MockRouter):
+    cache = MemoryResultCache()
+    client = FlureeClient(base_url="http://localhost:8090", cache=cache)
+    query = client.with_ledger("test").query()
+
+    await query.acommit()
+    await query.acommit()
+
+    assert mocked_api["query"].call_count == 1
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = MemoryResultCache(max_entries=2, max_bytes=100)
+
+    cache.put("a", "ledger", result(10), epoch=0)
+    cache.put("b", "ledger", result(10), epoch=0)
+    cache.get("a")
+    cache.put("c", "ledger", result(10), epoch=0)
+    assert cache.get("b") is None and cache.get("a") is not None
+
+    cache.put("d", "ledger", result(95), epoch=0)
+    assert cache.stats().entries == 1 and cache.get("d") is not None
+
+    cache.put("e", "ledger", result(101), epoch=0)
+    assert cache.get("e") is None
+    assert cache.stats().evictions == 3
+
+
+def test_ttl_expiry():
+    cache = MemoryResultCache(ttl=0.01)
+
+    cache.put("a", "ledger", result(1), epoch=0)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.stats().entries == 0
+
+
+def test_stale_epoch_is_not_stored():
+    cache = MemoryResultCache()
+
+    epoch = cache.epoch("ledger")
+    cache.invalidate("ledger")
+    cache.put("a", "ledger", result(1), epoch=epoch)
+
+    assert cache.get("a") is None
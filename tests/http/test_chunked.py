@@ -0,0 +1,246 @@
+import json
+import threading
+from collections.abc import Generator
+
+import pytest
+import respx
+from httpx import ConnectError, ReadTimeout, Request, Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.chunked import ChunkedCommitError, ChunkPlanner, ChunkPolicy
+from fluree_py.http.response import FlureeResponse
+
+ROWS = [{"@id": f"ex:{i}", "ex:value": i} for i in range(100)]
+
+
+class Ledger:
+    """Answers transactions like a server, counting `t` up per commit."""
+
+    def __init__(self, fail_above: int | None = None, status: int = 413) -> None:
+        self.t = 0
+        self.inserted: list[dict] = []
+        self.payloads: list[dict] = []
+        self.fail_above = fail_above
+        self.status = status
+        self.lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        payload = json.loads(request.content)
+        with self.lock:
+            self.payloads.append(payload)
+            if self.fail_above is not None and len(payload["insert"]) > self.fail_above:
+                return Response(self.status, json={"error": "too large"})
+            self.t += 1
+            self.inserted.extend(payload["insert"])
+            return Response(
+                200, json={"ledger": payload["ledger"], "t": self.t, "tx-id": f"tx{self.t}"}
+            )
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        yield respx_mock
+
+
+def builder():
+    client = FlureeClient(
+        base_url="http://localhost:8090", default_context={"ex": "http://example.org/"}
+    )
+    return client.with_ledger("test").transaction()
+
+
+def transaction(rows: list[dict] = ROWS):
+    return builder().with_insert(rows)
+
+
+def test_chunked_commit_splits_insert(mocked_api: MockRouter):
+    ledger = Ledger()
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+
+    policy = ChunkPolicy(initial_items=10, max_items=20, concurrency=2)
+    result = transaction().commit_chunked(policy)
+
+    assert result.items == len(ROWS)
+    assert result.t == ledger.t == len(result.chunks)
+    assert sorted(ledger.inserted, key=lambda row: row["ex:value"]) == ROWS
+    assert [chunk.offset for chunk in result.chunks] == sorted(c.offset for c in result.chunks)
+    assert all(chunk.count <= 20 for chunk in result.chunks)
+    assert {chunk.tx_id for chunk in result.chunks} == {f"tx{t}" for t in range(1, ledger.t + 1)}
+    assert all(payload["@context"] == {"ex": "http://example.org/"} for payload in ledger.payloads)
+    assert all(payload["ledger"] == "test" for payload in ledger.payloads)
+
+
+def test_chunked_commit_bounds_chunk_bytes(mocked_api: MockRouter):
+    ledger = Ledger()
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+
+    result = transaction().commit_chunked(ChunkPolicy(max_bytes=200, concurrency=1))
+
+    assert result.items == len(ROWS)
+    assert all(chunk.size <= 200 for chunk in result.chunks)
+    assert all(len(json.dumps(p["insert"], separators=(",", ":"))) <= 200 for p in ledger.payloads)
+
+
+def test_chunked_commit_splits_rejected_chunks(mocked_api: MockRouter):
+    ledger = Ledger(fail_above=8)
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+
+    result = transaction().commit_chunked(ChunkPolicy(initial_items=25, concurrency=1))
+
+    assert result.items == len(ROWS)
+    assert max(chunk.count for chunk in result.chunks) <= 8
+    assert len(ledger.inserted) == len(ROWS)
+
+
+def test_chunked_commit_fails_fast_on_client_errors(mocked_api: MockRouter):
+    ledger = Ledger(fail_above=30, status=400)
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+
+    policy = ChunkPolicy(initial_items=20, concurrency=1, growth=2)
+    with pytest.raises(ChunkedCommitError) as excinfo:
+        transaction().commit_chunked(policy)
+
+    assert excinfo.value.response is not None
+    assert excinfo.value.response.status_code == 400
+    assert excinfo.value.committed.items == 20
+    assert len(ledger.payloads) == 2
+
+
+@pytest.mark.parametrize("status", [408, 503])
+def test_ambiguous_failures_are_not_retried_by_default(mocked_api: MockRouter, status: int):
+    ledger = Ledger(fail_above=15, status=status)
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+
+    with pytest.raises(ChunkedCommitError) as excinfo:
+        transaction().commit_chunked(ChunkPolicy(initial_items=30, concurrency=1))
+
+    assert excinfo.value.committed.items == 0
+    assert len(ledger.payloads) == 1
+
+
+def test_only_unsent_transport_errors_are_retried(mocked_api: MockRouter):
+    ledger = Ledger()
+    errors: list[Exception] = [ConnectError("refused")]
+
+    def flaky(request: Request) -> Response:
+        if errors:
+            raise errors.pop()
+        return ledger(request)
+
+    mocked_api.post("/fluree/transact").mock(side_effect=flaky)
+    policy = ChunkPolicy(initial_items=50, concurrency=1)
+
+    assert transaction().commit_chunked(policy).items == len(ROWS)
+
+    errors.append(ReadTimeout("no response"))
+    with pytest.raises(ChunkedCommitError):
+        transaction().commit_chunked(policy)
+
+
+def test_chunks_with_unreadable_bodies_are_committed(mocked_api: MockRouter):
+    mocked_api.post("/fluree/transact").mock(return_value=Response(200, content=b""))
+
+    result = transaction().commit_chunked(ChunkPolicy(initial_items=50, concurrency=1))
+
+    assert result.items == len(ROWS)
+    assert [(chunk.t, chunk.tx_id) for chunk in result.chunks] == [(None, None)] * 2
+
+
+@pytest.mark.asyncio
+async def test_async_chunked_commit(mocked_api: MockRouter):
+    ledger = Ledger(fail_above=15, status=503)
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+
+    policy = ChunkPolicy(initial_items=30, concurrency=3, retry_ambiguous=True)
+    result = await transaction().acommit_chunked(policy)
+
+    assert result.items == len(ROWS)
+    assert sorted(ledger.inserted, key=lambda row: row["ex:value"]) == ROWS
+
+
+def test_chunked_commit_rejects_where_and_delete():
+    builder = transaction().with_where([{"@id": "?s"}])
+
+    with pytest.raises(ValueError):
+        builder.commit_chunked()
+
+
+def test_planner_adapts_to_latency():
+    policy = ChunkPolicy(initial_items=10, max_items=40, target_latency=1.0)
+    planner = ChunkPlanner(items=[b"{}"] * 1000, policy=policy)
+    response = Response(200, json={"t": 1})
+
+    fast = FlureeResponse(response=response)
+    for _ in range(5):
+        chunk = planner.next()
+        assert chunk is not None
+        planner.succeeded(chunk, fast, latency=0.1)
+    assert planner.target == 40
+
+    chunk = planner.next()
+    assert chunk is not None and len(chunk.items) == 40
+    planner.succeeded(chunk, fast, latency=5.0)
+    assert planner.target == 20
+
+
+def test_policy_validation():
+    with pytest.raises(ValueError):
+        ChunkPolicy(initial_items=10, max_items=5)
+    with pytest.raises(ValueError):
+        ChunkPolicy(shrink=1.5)
+
+
+def test_insert_stream_pulls_lazily(mocked_api: MockRouter):
+    ledger = Ledger()
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+    pulled = 0
+
+    def rows():
+        nonlocal pulled
+        for row in ROWS:
+            pulled += 1
+            # Only the batches in flight, and the item that ends a batch, are read ahead
+            assert pulled - len(ledger.inserted) <= 2 * 7 + 1
+            yield row
+
+    client = FlureeClient(base_url="http://localhost:8090")
+    stream = (
+        client.with_ledger("test")
+        .transaction()
+        .with_insert_stream(rows(), batch_size=7, max_in_flight=2)
+    )
+    result = stream.commit()
+
+    assert result.items == len(ROWS)
+    assert all(chunk.count <= 7 for chunk in result.chunks)
+    assert sorted(ledger.inserted, key=lambda row: row["ex:value"]) == ROWS
+    assert all(set(payload) == {"ledger", "insert"} for payload in ledger.payloads)
+
+
+@pytest.mark.asyncio
+async def test_insert_stream_from_async_iterator(mocked_api: MockRouter):
+    ledger = Ledger(fail_above=5, status=429)
+    mocked_api.post("/fluree/transact").mock(side_effect=ledger)
+
+    async def rows():
+        for row in ROWS:
+            yield row
+
+    stream = builder().with_insert_stream(rows(), batch_size=10, max_in_flight=3)
+    result = await stream.acommit()
+
+    assert result.items == len(ROWS)
+    assert sorted(ledger.inserted, key=lambda row: row["ex:value"]) == ROWS
+    assert all(payload["@context"] == {"ex": "http://example.org/"} for payload in ledger.payloads)
+
+
+def test_insert_stream_requires_async_commit_for_async_iterators():
+    async def rows():
+        yield ROWS[0]
+
+    stream = builder().with_insert_stream(rows())
+
+    with pytest.raises(TypeError):
+        stream.commit()
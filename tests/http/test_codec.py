@@ -0,0 +1,110 @@
+import json
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import Any, Generator
+
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http import codec as codec_module
+from fluree_py.http.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_codec,
+)
+from fluree_py.http.endpoint import TransactionBuilderImpl
+
+PAYLOAD = {
+    "@context": {"ex": "http://example.org/"},
+    "insert": [{"@id": "ex:é", "ex:n": [1, 2.5, None, True], "ex:nested": {"a": "\"'\\"}}],
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class RecordingCodec:
+    payloads: list[Any] = field(default_factory=list)
+    bodies: list[bytes] = field(default_factory=list)
+
+    def dumps(self, obj: Any) -> bytes:
+        self.payloads.append(obj)
+        return json.dumps(obj).encode()
+
+    def loads(self, data: bytes) -> Any:
+        self.bodies.append(data)
+        return json.loads(data)
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        respx_mock.post("/fluree/transact", name="transact").return_value = Response(
+            200, json={"ledger": "test", "t": 2}
+        )
+        yield respx_mock
+
+
+def installed_codecs() -> list[Any]:
+    codecs: list[Any] = [StdlibJsonCodec]
+    codecs += [OrjsonCodec] if find_spec("orjson") else []
+    codecs += [MsgspecCodec] if find_spec("msgspec") else []
+    return codecs
+
+
+@pytest.mark.parametrize("codec", installed_codecs())
+def test_codecs_match_httpx_encoding(codec: Any):
+    expected = json.dumps(PAYLOAD, ensure_ascii=False, separators=(",", ":")).encode()
+
+    assert codec().dumps(PAYLOAD) == expected
+    assert codec().loads(expected) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", installed_codecs())
+def test_codecs_reject_invalid_json(codec: Any):
+    with pytest.raises(ValueError):
+        codec().loads(b'{"a": ')
+
+
+def test_response_is_parsed_once(mocked_api: MockRouter):
+    codec = RecordingCodec()
+    client = FlureeClient(base_url="http://localhost:8090", codec=codec)
+    response = client.with_ledger("test").transaction().with_insert({"@id": "ex:a"}).commit()
+
+    first = response.json()
+    assert response.json() is first
+    assert response.cast(dict) is first
+    assert codec.bodies == [b'{"ledger":"test","t":2}']
+
+
+def test_client_codec_encodes_payload(mocked_api: MockRouter):
+    codec = RecordingCodec()
+    client = FlureeClient(base_url="http://localhost:8090", codec=codec)
+
+    client.with_ledger("test").transaction().with_insert({"@id": "ex:a"}).commit()
+
+    request = mocked_api["transact"].calls.last.request
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == codec.payloads[0]
+    assert codec.payloads[0]["insert"] == {"@id": "ex:a"}
+
+
+def test_builder_without_session_uses_default_codec():
+    builder = TransactionBuilderImpl(endpoint="http://localhost:8090/fluree/transact", ledger="t")
+    ready = builder.with_insert({"@id": "ex:a"})
+
+    assert ready.codec is default_codec()  # type: ignore[attr-defined]
+    assert json.loads(ready.get_request().content)["ledger"] == "t"
+
+
+def test_missing_package_raises_and_default_falls_back(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(codec_module, "find_spec", lambda name: None)
+    default_codec.cache_clear()
+    try:
+        with pytest.raises(ImportError, match="orjson"):
+            OrjsonCodec()
+        assert isinstance(default_codec(), StdlibJsonCodec)
+    finally:
+        default_codec.cache_clear()
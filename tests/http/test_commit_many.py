@@ -0,0 +1,78 @@
+import json
+import threading
+import time
+from typing import Generator
+
+import httpx
+import pytest
+import respx
+from httpx import Request, Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.protocol.endpoint import QueryBuilder
+
+
+def query_side_effect(request: Request) -> Response:
+    ledger = json.loads(request.content)["from"]
+    if ledger == "broken":
+        raise httpx.ConnectError("connection refused", request=request)
+    if ledger == "slow":
+        time.sleep(0.5)
+    return Response(200, json={"ledger": ledger, "thread": threading.get_ident()})
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        respx_mock.post("/fluree/query", name="query").side_effect = query_side_effect
+        yield respx_mock
+
+
+def queries(client: FlureeClient, *ledgers: str) -> list[QueryBuilder]:
+    return [client.with_ledger(ledger).query() for ledger in ledgers]
+
+
+def test_commit_many_ordered(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    responses = client.commit_many(queries(client, "1", "2", "3", "4"), max_workers=4)
+
+    assert [r.json()["ledger"] for r in responses] == ["1", "2", "3", "4"]
+    assert threading.get_ident() not in {r.json()["thread"] for r in responses}
+
+
+def test_commit_many_fail_fast(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    with pytest.raises(httpx.ConnectError):
+        client.commit_many(queries(client, "1", "broken", "3"))
+
+
+def test_commit_many_collects_errors(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    results = client.commit_many(queries(client, "1", "broken", "3"), return_exceptions=True)
+
+    assert isinstance(results[1], httpx.ConnectError)
+    assert [r.json()["ledger"] for r in results if not isinstance(r, Exception)] == ["1", "3"]
+
+
+def test_commit_many_deadline(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+    builders = queries(client, "1", "slow", "3")
+
+    results = client.commit_many(builders, timeout=0.2, return_exceptions=True)
+    assert isinstance(results[1], TimeoutError)
+    assert not isinstance(results[0], Exception)
+
+    with pytest.raises(TimeoutError):
+        client.commit_many(builders, timeout=0.2)
+
+
+def test_commit_many_empty():
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    assert client.commit_many([]) == []
+    with pytest.raises(ValueError):
+        client.commit_many([], max_workers=0)
@@ -0,0 +1,115 @@
+import json
+from typing import Generator
+
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.compaction import compact_payload
+
+SCHEMA = "http://schema.org/"
+PEOPLE = "http://example.org/people/"
+
+
+def people(count: int) -> list[dict]:
+    return [
+        {
+            "@id": f"{PEOPLE}{i}",
+            "@type": f"{SCHEMA}Person",
+            f"{SCHEMA}name": f"Person {i}",
+            f"{SCHEMA}url": f"{SCHEMA}literal-stays",
+            f"{SCHEMA}knows": {"@id": f"{PEOPLE}0"},
+        }
+        for i in range(count)
+    ]
+
+
+def encoded(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        respx_mock.post("/fluree/transact", name="transact").return_value = Response(200, json={})
+        yield respx_mock
+
+
+def test_compaction_rewrites_keys_ids_and_types():
+    payload = {"ledger": "test", "insert": people(10)}
+
+    result = compact_payload(payload)
+
+    assert result.prefixes == {"schema": SCHEMA, "people": PEOPLE}
+    assert result.payload["@context"] == result.prefixes
+    assert result.payload["insert"][1] == {
+        "@id": "people:1",
+        "@type": "schema:Person",
+        "schema:name": "Person 1",
+        "schema:url": f"{SCHEMA}literal-stays",
+        "schema:knows": {"@id": "people:0"},
+    }
+    assert result.bytes_saved == len(encoded(payload)) - len(encoded(result.payload))
+    assert payload["insert"][1]["@id"] == f"{PEOPLE}1"
+
+
+def test_compaction_respects_existing_terms():
+    payload = {
+        "@context": {"s": SCHEMA, "schema": "http://other.org/"},
+        "ledger": "test",
+        "insert": [{"@id": "ex:a", "people": 1, f"{PEOPLE}x": {"@value": {SCHEMA: 1}}}] * 5
+        + people(5),
+    }
+
+    result = compact_payload(payload)
+
+    # "people" is a plain key in the data, so the new prefix must not take its name
+    assert result.payload["insert"][0]["people1:x"] == {"@value": {SCHEMA: 1}}
+    assert result.prefixes == {"people1": PEOPLE}
+    assert result.payload["@context"] == {
+        "s": SCHEMA,
+        "schema": "http://other.org/",
+        "people1": PEOPLE,
+    }
+    assert result.payload["insert"][5]["s:name"] == "Person 0"
+
+
+def test_compaction_skips_unprofitable_prefixes():
+    payload = {"ledger": "test", "insert": {"@id": f"{PEOPLE}1", f"{SCHEMA}name": "a"}}
+
+    result = compact_payload(payload)
+
+    assert result.prefixes == {}
+    assert result.bytes_saved == 0
+    assert result.payload == payload
+
+
+def test_compaction_keeps_keys_that_collide_with_prefixed_names():
+    payload = {
+        "@context": {"schema": SCHEMA},
+        "ledger": "test",
+        "insert": [{f"{SCHEMA}name": "a", "schema:name": "b"}, *people(5)],
+    }
+
+    result = compact_payload(payload)
+
+    assert result.payload["insert"][0] == {f"{SCHEMA}name": "a", "schema:name": "b"}
+    assert result.payload["insert"][1]["schema:name"] == "Person 0"
+    assert result.bytes_saved == len(encoded(payload)) - len(encoded(result.payload))
+
+
+def test_transaction_with_compaction(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090", default_context={"schema": SCHEMA})
+    builder = client.with_ledger("test").transaction().with_insert(people(10))
+
+    compacting = builder.with_compaction()
+    compacting.commit()
+
+    sent = json.loads(mocked_api["transact"].calls.last.request.content)
+    assert sent["@context"] == {"schema": SCHEMA, "people": PEOPLE}
+    assert sent["insert"][0]["schema:name"] == "Person 0"
+    assert compacting.compaction().prefixes == {"people": PEOPLE}
+    assert compacting.compaction().bytes_saved > 0
+    assert "@context" not in builder.build_request_payload()
@@ -0,0 +1,64 @@
+import json
+from typing import Generator
+
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.codec import StdlibJsonCodec
+
+CONTEXT = {"ex": "http://example.org/", "schema": "http://schema.org/"}
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090", assert_all_called=False) as respx_mock:
+        respx_mock.post("/fluree/query", name="query").return_value = Response(200, json=[])
+        respx_mock.post("/fluree/transact", name="transact").return_value = Response(200, json={})
+        yield respx_mock
+
+
+def sent(mocked_api: MockRouter, route: str) -> dict:
+    return json.loads(mocked_api[route].calls.last.request.content)
+
+
+@pytest.mark.parametrize("codec", [None, StdlibJsonCodec()])
+def test_default_context_is_sent(mocked_api: MockRouter, codec: StdlibJsonCodec | None):
+    client = FlureeClient(
+        base_url="http://localhost:8090",
+        default_context=CONTEXT,
+        **({} if codec is None else {"codec": codec}),
+    )
+    ledger = client.with_ledger("test")
+
+    ledger.query().with_where([{"@id": "?s"}]).commit()
+    ledger.transaction().with_insert({"@id": "ex:freddy"}).commit()
+
+    assert sent(mocked_api, "query") == {
+        "@context": CONTEXT,
+        "from": "test",
+        "where": [{"@id": "?s"}],
+    }
+    assert sent(mocked_api, "transact")["@context"] == CONTEXT
+    assert client.session.encoded_context == client.codec.dumps(CONTEXT)
+
+
+def test_call_context_is_merged_over_default(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090", default_context=CONTEXT)
+
+    client.with_ledger("test").query().with_context({"ex": "http://example.com/"}).commit()
+
+    assert sent(mocked_api, "query")["@context"] == {
+        "ex": "http://example.com/",
+        "schema": "http://schema.org/",
+    }
+
+
+def test_no_default_context(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    client.with_ledger("test").query().commit()
+
+    assert sent(mocked_api, "query") == {"from": "test"}
@@ -0,0 +1,117 @@
+import gzip
+from pathlib import Path
+from typing import Generator
+
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.cache import DiskResultCache, MemoryResultCache
+from fluree_py.types.common import is_pinned_time
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090", assert_all_called=False) as respx_mock:
+        respx_mock.post("/fluree/query", name="query").return_value = Response(
+            200, json=[{"@id": "ex:freddy"}]
+        )
+        respx_mock.post("/fluree/history", name="history").return_value = Response(200, json=[])
+        respx_mock.post("/fluree/transact", name="transact").return_value = Response(200)
+        yield respx_mock
+
+
+def test_pinned_results_survive_restarts(mocked_api: MockRouter, tmp_path: Path):
+    path = tmp_path / "cache.sqlite"
+
+    for _ in range(2):
+        with DiskResultCache(path=path) as cache:
+            client = FlureeClient(base_url="http://localhost:8090", pinned_cache=cache)
+            query = client.with_ledger("test").query().with_t({"at": 3})
+            history = client.with_ledger("test").history().with_t({"from": 1, "to": 3})
+
+            assert query.commit().json() == [{"@id": "ex:freddy"}]
+            assert history.commit().json() == []
+
+    assert mocked_api["query"].call_count == 1
+    assert mocked_api["history"].call_count == 1
+
+
+def test_compressed_results_survive_restarts(mocked_api: MockRouter, tmp_path: Path):
+    mocked_api["query"].return_value = Response(
+        200, content=gzip.compress(b'[{"@id": "ex:freddy"}]'), headers={"content-encoding": "gzip"}
+    )
+    path = tmp_path / "cache.sqlite"
+
+    for _ in range(2):
+        with DiskResultCache(path=path) as cache:
+            client = FlureeClient(base_url="http://localhost:8090", pinned_cache=cache)
+            query = client.with_ledger("test").query().with_t({"at": 3})
+
+            assert query.commit().json() == [{"@id": "ex:freddy"}]
+
+    assert mocked_api["query"].call_count == 1
+
+
+def test_latest_is_never_read_from_pinned_cache(mocked_api: MockRouter, tmp_path: Path):
+    with DiskResultCache(path=tmp_path / "cache.sqlite") as cache:
+        client = FlureeClient(base_url="http://localhost:8090", pinned_cache=cache)
+        ledger = client.with_ledger("test")
+
+        for _ in range(2):
+            ledger.query().commit()
+            ledger.query().with_t({"at": "latest"}).commit()
+            ledger.history().with_t({"from": 1}).commit()
+
+        assert mocked_api["query"].call_count == 4
+        assert mocked_api["history"].call_count == 2
+        assert cache.stats().entries == 0
+
+
+def test_writes_do_not_invalidate_pinned_cache(mocked_api: MockRouter, tmp_path: Path):
+    memory = MemoryResultCache()
+    with DiskResultCache(path=tmp_path / "cache.sqlite") as disk:
+        client = FlureeClient(base_url="http://localhost:8090", cache=memory, pinned_cache=disk)
+        ledger = client.with_ledger("test")
+
+        ledger.query().with_t(3).commit()
+        ledger.query().commit()
+        ledger.transaction().with_insert({"@id": "ex:a"}).commit()
+        ledger.query().with_t(3).commit()
+        ledger.query().commit()
+
+        assert mocked_api["query"].call_count == 3
+        assert disk.stats().hits == 1 and memory.stats().invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_async_pinned_query_uses_disk_cache(mocked_api: MockRouter, tmp_path: Path):
+    with DiskResultCache(path=tmp_path / "cache.sqlite") as cache:
+        client = FlureeClient(base_url="http://localhost:8090", pinned_cache=cache)
+        query = client.with_ledger("test").query().with_t(7)
+
+        await query.acommit()
+        response = await query.acommit()
+
+    assert response.json() == [{"@id": "ex:freddy"}]
+    assert mocked_api["query"].call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("t", "pinned"),
+    [
+        (3, True),
+        ({"at": 3}, True),
+        ({"from": 1, "to": 3}, True),
+        (None, False),
+        ("latest", False),
+        ({"at": "latest"}, False),
+        ({"from": 1}, False),
+        ({"from": 1, "to": "latest"}, False),
+        ({}, False),
+    ],
+)
+def test_is_pinned_time(t: object, pinned: bool):
+    assert is_pinned_time(t) is pinned
@@ -0,0 +1,84 @@
+import asyncio
+import json
+from typing import Generator
+
+import httpx
+import pytest
+import respx
+from httpx import Request, Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.protocol.endpoint import QueryBuilder
+
+
+async def query_side_effect(request: Request) -> Response:
+    ledger = json.loads(request.content)["from"]
+    if ledger == "broken":
+        raise httpx.ConnectError("connection refused", request=request)
+    # Later ledgers answer first so completion order differs from input order
+    await asyncio.sleep(0.01 * (5 - int(ledger)))
+    return Response(200, json={"ledger": ledger})
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        respx_mock.post("/fluree/query", name="query").side_effect = query_side_effect
+        yield respx_mock
+
+
+def queries(client: FlureeClient, *ledgers: str) -> list[QueryBuilder]:
+    return [client.with_ledger(ledger).query() for ledger in ledgers]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_ordered(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    responses = await client.execute_many(queries(client, "1", "2", "3", "4"), concurrency=2)
+
+    assert [r.json() for r in responses] == [{"ledger": str(i)} for i in range(1, 5)]
+    assert mocked_api["query"].call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_execute_many_as_completed(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    responses = await client.execute_many(
+        queries(client, "1", "2", "3", "4"), concurrency=4, ordered=False
+    )
+
+    assert [r.json() for r in responses] == [{"ledger": str(i)} for i in range(4, 0, -1)]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_fail_fast(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    with pytest.raises(httpx.ConnectError):
+        await client.execute_many(queries(client, "broken", "1", "2", "3"), concurrency=1)
+
+    assert mocked_api["query"].call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_many_collects_errors(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    results = await client.execute_many(queries(client, "1", "broken", "3"), return_exceptions=True)
+
+    assert isinstance(results[1], httpx.ConnectError)
+    assert [r.json() for r in results if not isinstance(r, Exception)] == [
+        {"ledger": "1"},
+        {"ledger": "3"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_rejects_invalid_concurrency():
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    with pytest.raises(ValueError):
+        await client.execute_many([], concurrency=0)
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from collections.abc import Generator
+
+import pytest
+import respx
+from httpx import Request, Response
+
+from fluree_py import FlureeClient
+from fluree_py.http.group import GroupCommitWriter
+
+
+class Server:
+    """Commits transactions, rejecting any that insert an invalid node."""
+
+    def __init__(self) -> None:
+        self.t = 0
+        self.payloads: list[dict] = []
+
+    def __call__(self, request: Request) -> Response:
+        payload = json.loads(request.content)
+        self.payloads.append(payload)
+        if any(node.get("invalid") for node in payload["insert"]):
+            return Response(400, json={"error": "invalid node"})
+        self.t += 1
+        return Response(200, json={"ledger": payload["ledger"], "t": self.t})
+
+
+@pytest.fixture
+def server() -> Generator[Server, None, None]:
+    server = Server()
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        respx_mock.post("/fluree/transact").mock(side_effect=server)
+        yield server
+
+
+@pytest.fixture
+def client() -> FlureeClient:
+    return FlureeClient(base_url="http://localhost:8090")
+
+
+def node(i: int, **extra) -> dict:
+    return {"@id": f"ex:{i}", "ex:value": i, **extra}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_inserts_share_one_request(server: Server, client: FlureeClient):
+    ledger = client.with_ledger("test")
+    writer = GroupCommitWriter(max_delay=0.01)
+
+    responses = await asyncio.gather(
+        *(writer.commit(ledger.transaction().with_insert(node(i))) for i in range(50)),
+        writer.commit(ledger.transaction().with_insert([node(50), node(51)])),
+    )
+
+    assert len(server.payloads) == 1
+    assert server.payloads[0]["insert"] == [node(i) for i in range(52)]
+    assert all(response.json()["t"] == 1 for response in responses)
+    assert writer._groups == {}
+
+
+@pytest.mark.asyncio
+async def test_groups_by_ledger_and_context(server: Server, client: FlureeClient):
+    writer = GroupCommitWriter(max_delay=0.01)
+    context = {"ex": "http://example.org/"}
+
+    def transaction(ledger: str, i: int, context: dict | None = None):
+        builder = client.with_ledger(ledger).transaction()
+        if context:
+            builder = builder.with_context(context)
+        return builder.with_insert(node(i))
+
+    await asyncio.gather(
+        writer.commit(transaction("a", 1)),
+        writer.commit(transaction("a", 2)),
+        writer.commit(transaction("b", 3)),
+        writer.commit(transaction("a", 4, context)),
+        writer.commit(transaction("a", 5, context)),
+    )
+
+    groups = {(p["ledger"], "@context" in p): len(p["insert"]) for p in server.payloads}
+    assert groups == {("a", False): 2, ("b", False): 1, ("a", True): 2}
+
+
+@pytest.mark.asyncio
+async def test_size_limit_splits_groups(server: Server, client: FlureeClient):
+    ledger = client.with_ledger("test")
+    writer = GroupCommitWriter(max_delay=0.05, max_transactions=10)
+
+    await asyncio.gather(
+        *(writer.commit(ledger.transaction().with_insert(node(i))) for i in range(25))
+    )
+
+    assert [len(payload["insert"]) for payload in server.payloads] == [10, 10, 5]
+
+
+@pytest.mark.asyncio
+async def test_rejected_group_is_retried_one_by_one(server: Server, client: FlureeClient):
+    ledger = client.with_ledger("test")
+    writer = GroupCommitWriter(max_delay=0.01)
+
+    responses = await asyncio.gather(
+        *(
+            writer.commit(ledger.transaction().with_insert(node(i, invalid=i == 2)))
+            for i in range(4)
+        )
+    )
+
+    assert [response.status_code for response in responses] == [200, 200, 400, 200]
+    assert len(server.payloads) == 5
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_without_waiting_for_the_window(server: Server, client: FlureeClient):
+    writer = GroupCommitWriter(max_delay=60)
+    pending = asyncio.ensure_future(
+        writer.commit(client.with_ledger("test").transaction().with_insert(node(1)))
+    )
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(writer.aclose(), timeout=1)
+
+    assert (await pending).is_success
+
+
+@pytest.mark.asyncio
+async def test_rejects_non_insert_transactions(client: FlureeClient):
+    writer = GroupCommitWriter()
+    builder = client.with_ledger("test").transaction().with_insert(node(1))
+
+    with pytest.raises(ValueError):
+        await writer.commit(builder.with_delete(node(2)))
+    with pytest.raises(ValueError):
+        GroupCommitWriter(max_transactions=0)
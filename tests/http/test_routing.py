@@ -0,0 +1,105 @@
+import time
+from typing import Generator
+
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.balancer import NodePool
+from fluree_py.http.endpoint import QueryBuilderImpl
+from fluree_py.http.routing import RequestRouter
+
+PRIMARY = "http://primary:8090"
+REPLICAS = ["http://replica-a:8090", "http://replica-b:8090"]
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(assert_all_called=False) as respx_mock:
+        for name, url in [("primary", PRIMARY), ("a", REPLICAS[0]), ("b", REPLICAS[1])]:
+            respx_mock.post(f"{url}/fluree/query", name=f"{name}-query").return_value = Response(
+                200, json=[]
+            )
+            respx_mock.post(
+                f"{url}/fluree/history", name=f"{name}-history"
+            ).return_value = Response(200, json=[])
+            respx_mock.post(
+                f"{url}/fluree/transact", name=f"{name}-transact"
+            ).return_value = Response(200, json={"t": 1})
+        yield respx_mock
+
+
+def test_reads_go_to_replicas_and_writes_to_primary(mocked_api: MockRouter):
+    client = FlureeClient(base_url=PRIMARY, replica_urls=REPLICAS)
+    ledger = client.with_ledger("test")
+
+    for _ in range(2):
+        ledger.query().commit()
+        ledger.history().commit()
+    ledger.transaction().with_insert({"@id": "ex:a"}).commit()
+
+    assert mocked_api["a-query"].call_count + mocked_api["b-query"].call_count == 2
+    assert mocked_api["a-history"].call_count + mocked_api["b-history"].call_count == 2
+    assert mocked_api["primary-transact"].call_count == 1
+    assert not mocked_api["primary-query"].called
+    assert not mocked_api["a-transact"].called and not mocked_api["b-transact"].called
+    assert [m.url for m in client.node_metrics()] == [PRIMARY, *REPLICAS]
+
+
+def test_read_your_writes_pins_reads_of_written_ledger(mocked_api: MockRouter):
+    client = FlureeClient(base_url=PRIMARY, replica_urls=REPLICAS, read_your_writes=60.0)
+
+    client.with_ledger("test").transaction().with_insert({"@id": "ex:a"}).commit()
+    client.with_ledger("test").query().commit()
+    client.with_ledger("other").query().commit()
+
+    assert mocked_api["primary-query"].call_count == 1
+    assert mocked_api["a-query"].call_count + mocked_api["b-query"].call_count == 1
+
+
+def test_read_your_writes_window_expires(mocked_api: MockRouter):
+    client = FlureeClient(base_url=PRIMARY, replica_urls=REPLICAS, read_your_writes=0.05)
+
+    client.with_ledger("test").transaction().with_insert({"@id": "ex:a"}).commit()
+    time.sleep(0.1)
+    client.with_ledger("test").query().commit()
+
+    assert not mocked_api["primary-query"].called
+
+
+def test_failed_write_does_not_pin_reads(mocked_api: MockRouter):
+    mocked_api["primary-transact"].return_value = Response(400, json={"error": "invalid"})
+    client = FlureeClient(base_url=PRIMARY, replica_urls=REPLICAS, read_your_writes=60.0)
+
+    client.with_ledger("test").transaction().with_insert({"@id": "ex:a"}).commit()
+    client.with_ledger("test").query().commit()
+
+    assert not mocked_api["primary-query"].called
+
+
+@pytest.mark.asyncio
+async def test_async_reads_go_to_replicas(mocked_api: MockRouter):
+    async with FlureeClient(base_url=PRIMARY, replica_urls=REPLICAS) as client:
+        await client.execute_many([client.with_ledger("test").query()] * 4)
+
+    assert mocked_api["a-query"].call_count == 2
+    assert mocked_api["b-query"].call_count == 2
+
+
+def test_router_sends_unknown_builders_to_primary():
+    router = RequestRouter(
+        base_url=PRIMARY,
+        primary=NodePool(urls=[PRIMARY]),
+        replicas=NodePool(urls=REPLICAS),
+    )
+    query = QueryBuilderImpl(endpoint=f"{PRIMARY}/fluree/query", ledger="test")
+
+    assert router.route(query) is router.replicas
+    assert router.route(object()) is router.primary  # type: ignore[arg-type]
+
+
+def test_negative_read_your_writes_rejected():
+    with pytest.raises(ValueError):
+        FlureeClient(base_url=PRIMARY, replica_urls=REPLICAS, read_your_writes=-1.0)
@@ -0,0 +1,151 @@
+import asyncio
+from importlib.util import find_spec
+from typing import Generator
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.endpoint import QueryBuilderImpl
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        query_route = respx_mock.post("/fluree/query", name="query")
+        query_route.return_value = Response(200, json=[{"@id": "ex:freddy"}])
+        yield respx_mock
+
+
+def test_builders_share_client_session(mocked_api: MockRouter):
+    client = FlureeClient(
+        base_url="http://localhost:8090",
+        limits=httpx.Limits(max_connections=4, keepalive_expiry=30.0),
+    )
+
+    query = client.with_ledger("test").query().with_where([{"@id": "?s"}])
+    assert isinstance(query, QueryBuilderImpl)
+    assert query.session is client.session
+
+    query.commit()
+    pooled = client.session.client
+    query.with_select({"?s": ["*"]}).commit()
+
+    assert client.session.client is pooled
+    assert mocked_api["query"].call_count == 2
+
+    client.close()
+    assert pooled.is_closed
+
+
+def test_closed_client_rejects_requests(mocked_api: MockRouter):
+    with FlureeClient(base_url="http://localhost:8090") as client:
+        query = client.with_ledger("test").query()
+        assert query.commit().status_code == 200
+
+    with pytest.raises(RuntimeError):
+        query.commit()
+
+
+def test_builder_without_session_uses_ephemeral_client(mocked_api: MockRouter):
+    query = QueryBuilderImpl(endpoint="http://localhost:8090/fluree/query", ledger="test")
+
+    assert query.session is None
+    assert query.commit().json() == [{"@id": "ex:freddy"}]
+
+
+@pytest.mark.asyncio
+async def test_async_pool_reused_across_commits(mocked_api: MockRouter):
+    async with FlureeClient(base_url="http://localhost:8090") as client:
+        query = client.with_ledger("test").query()
+
+        await query.acommit()
+        pooled = client.session.async_client
+        await query.acommit()
+
+        assert client.session.async_client is pooled
+        assert mocked_api["query"].call_count == 2
+
+    assert pooled.is_closed
+
+
+def test_async_pool_closes_with_its_event_loop(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+    query = client.with_ledger("test").query()
+
+    async def commit() -> httpx.AsyncClient:
+        await query.acommit()
+        return client.session.async_client
+
+    first = asyncio.run(commit())
+    second = asyncio.run(commit())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    client.close()
+
+
+def test_async_pool_replaced_on_open_loop_is_closed(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+    query = client.with_ledger("test").query()
+    loop, other = asyncio.new_event_loop(), asyncio.new_event_loop()
+
+    async def commit() -> httpx.AsyncClient:
+        await query.acommit()
+        return client.session.async_client
+
+    try:
+        first = loop.run_until_complete(commit())
+        other.run_until_complete(commit())
+        loop.run_until_complete(asyncio.sleep(0))
+        assert first.is_closed
+
+        with pytest.warns(ResourceWarning, match="aclose"):
+            client.close()
+    finally:
+        for event_loop in (loop, other):
+            event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+            event_loop.close()
+
+
+def test_http2_falls_back_without_h2(monkeypatch: pytest.MonkeyPatch, mocked_api: MockRouter):
+    monkeypatch.setattr("fluree_py.http.session.find_spec", lambda name: None)
+
+    with pytest.warns(RuntimeWarning, match="HTTP/1.1"):
+        client = FlureeClient(base_url="http://localhost:8090", http2=True)
+
+    assert client.session.http2 is False
+    assert client.with_ledger("test").query().commit().status_code == 200
+
+
+def test_http2_prior_knowledge_falls_back_without_h2(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("fluree_py.http.session.find_spec", lambda name: None)
+
+    with pytest.warns(RuntimeWarning):
+        client = FlureeClient(base_url="http://localhost:8090", http1=False, http2=True)
+
+    assert (client.session.http1, client.session.http2) == (True, False)
+
+
+def test_disabling_every_protocol_is_rejected():
+    with pytest.raises(ValueError, match="http1 and http2"):
+        FlureeClient(base_url="http://localhost:8090", http1=False)
+
+
+@pytest.mark.skipif(find_spec("h2") is None, reason="requires the h2 package")
+def test_http2_enabled_with_h2(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090", http2=True)
+
+    assert client.session.http2 is True
+    assert client.with_ledger("test").query().commit().status_code == 200
+
+
+@pytest.mark.skipif(find_spec("h2") is None, reason="requires the h2 package")
+def test_http2_prior_knowledge_with_h2(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090", http1=False, http2=True)
+
+    assert (client.session.http1, client.session.http2) == (False, True)
+    assert client.with_ledger("test").query().commit().status_code == 200
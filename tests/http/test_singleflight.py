@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator
+
+import httpx
+import pytest
+import respx
+from httpx import Request, Response
+from respx import MockRouter
+
+import fluree_py.http.fingerprint
+from fluree_py import FlureeClient
+from fluree_py.http.fingerprint import fingerprint
+from fluree_py.http.singleflight import SingleFlight
+
+release = threading.Event()
+
+
+def slow_query(request: Request) -> Response:
+    release.wait(timeout=5)
+    return Response(200, json=[{"@id": "ex:freddy"}])
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    release.clear()
+    with respx.mock(base_url="http://localhost:8090", assert_all_called=False) as respx_mock:
+        respx_mock.post("/fluree/query", name="query").side_effect = slow_query
+        respx_mock.post("/fluree/transact", name="transact").return_value = Response(200)
+        yield respx_mock
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.005)
+
+
+def test_concurrent_identical_queries_share_one_request(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090", coalesce=True)
+    query = client.with_ledger("test").query().with_where([{"@id": "?s"}])
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(query.commit) for _ in range(5)]
+        wait_for(lambda: client.session.flights.coalesced == 4)
+        release.set()
+        responses = [future.result() for future in futures]
+
+    assert mocked_api["query"].call_count == 1
+    assert all(response is responses[0] for response in responses)
+    assert responses[0].json() == [{"@id": "ex:freddy"}]
+
+
+def test_finished_queries_are_not_reused(mocked_api: MockRouter):
+    release.set()
+    client = FlureeClient(base_url="http://localhost:8090", coalesce=True)
+    query = client.with_ledger("test").query()
+
+    query.commit()
+    query.commit()
+
+    assert mocked_api["query"].call_count == 2
+
+
+def test_errors_are_shared_with_waiters(mocked_api: MockRouter):
+    flights: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+
+    def fail() -> int:
+        started.set()
+        release.wait(timeout=5)
+        raise httpx.ConnectError("connection refused")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flights.do, "key", fail)
+        started.wait(timeout=5)
+        follower = executor.submit(flights.do, "key", fail)
+        wait_for(lambda: flights.coalesced == 1)
+        release.set()
+
+        with pytest.raises(httpx.ConnectError):
+            leader.result()
+        with pytest.raises(httpx.ConnectError):
+            follower.result()
+
+
+@pytest.mark.asyncio
+async def test_async_identical_queries_share_one_request(mocked_api: MockRouter):
+    async def query_side_effect(request: Request) -> Response:
+        await asyncio.sleep(0.05)
+        return Response(200, json=[])
+
+    mocked_api["query"].side_effect = query_side_effect
+    client = FlureeClient(base_url="http://localhost:8090", coalesce=True)
+    query = client.with_ledger("test").query()
+
+    responses = await asyncio.gather(*(query.acommit() for _ in range(5)))
+
+    assert mocked_api["query"].call_count == 1
+    assert all(response is responses[0] for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_writes_and_default_client_are_not_coalesced(mocked_api: MockRouter):
+    release.set()
+    coalescing = FlureeClient(base_url="http://localhost:8090", coalesce=True)
+    transaction = coalescing.with_ledger("test").transaction().with_insert({"@id": "ex:a"})
+    await asyncio.gather(*(transaction.acommit() for _ in range(3)))
+
+    default = FlureeClient(base_url="http://localhost:8090")
+    await asyncio.gather(*(default.with_ledger("test").query().acommit() for _ in range(3)))
+
+    assert mocked_api["transact"].call_count == 3
+    assert mocked_api["query"].call_count == 3
+
+
+def test_fingerprint_ignores_key_order():
+    a = Request("POST", "http://localhost:8090/fluree/query", content=b'{"a": 1, "b": [2]}')
+    b = Request("POST", "http://localhost:8090/fluree/query", content=b'{"b":[2],"a":1}')
+    c = Request("POST", "http://localhost:8090/fluree/history", content=b'{"b":[2],"a":1}')
+
+    assert fingerprint(a) == fingerprint(b)
+    assert fingerprint(a) != fingerprint(c)
+
+
+def test_fingerprint_is_computed_once_per_builder(
+    mocked_api: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    canonicalized: list[bytes] = []
+    canonical_body = fluree_py.http.fingerprint.canonical_body
+
+    def counting(content: bytes) -> bytes:
+        canonicalized.append(content)
+        return canonical_body(content)
+
+    monkeypatch.setattr("fluree_py.http.fingerprint.canonical_body", counting)
+    release.set()
+    client = FlureeClient(base_url="http://localhost:8090", coalesce=True)
+    query = client.with_ledger("test").query()
+
+    for _ in range(3):
+        query.commit()
+
+    assert len(canonicalized) == 1
+    assert query.fingerprint() == fingerprint(query.get_request())
@@ -0,0 +1,94 @@
+import json
+from typing import Generator
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.endpoint import QueryBuilderImpl
+from fluree_py.http.streaming import JsonArrayParser
+
+ITEMS = [{"@id": f"ex:{i}", "text": 'a,"b"]}\\' * 3, "tags": [i, {"n": None}]} for i in range(50)]
+BODY = json.dumps(ITEMS).encode()
+
+
+def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090", assert_all_called=False) as respx_mock:
+        respx_mock.post("/fluree/query", name="query").side_effect = lambda request: Response(
+            200, stream=httpx.ByteStream(BODY)
+        )
+        respx_mock.post("/fluree/history", name="history").return_value = Response(
+            200, content=BODY
+        )
+        yield respx_mock
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(BODY)])
+def test_parser_handles_any_chunking(size: int):
+    parser = JsonArrayParser()
+    items = [item for chunk in chunked(BODY, size) for item in parser.feed(chunk)]
+    items += parser.close()
+
+    assert items == ITEMS
+
+
+def test_parser_buffers_only_the_current_element():
+    parser = JsonArrayParser()
+    largest = max(len(json.dumps(item)) for item in ITEMS)
+
+    for chunk in chunked(BODY, 16):
+        parser.feed(chunk)
+        assert len(parser._buffer) <= 2 * largest + 16
+
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"error": "x"}', b"[1,,2]", b"[1,]", b"[1] 2", b"[1, 2", b"[12x]"]
+)
+def test_parser_rejects_malformed_arrays(body: bytes):
+    parser = JsonArrayParser()
+    with pytest.raises(ValueError):
+        parser.feed(body)
+        parser.close()
+
+
+def test_stream_query_items(mocked_api: MockRouter):
+    client = FlureeClient(base_url="http://localhost:8090")
+
+    with client.with_ledger("test").query().stream() as response:
+        assert response.status_code == 200
+        items = list(response.iter_items())
+
+    assert items == ITEMS
+
+
+def test_iter_items_on_buffered_response(mocked_api: MockRouter):
+    response = FlureeClient(base_url="http://localhost:8090").with_ledger("test").history().commit()
+
+    assert list(response.iter_items()) == ITEMS
+
+
+def test_stream_without_session(mocked_api: MockRouter):
+    query = QueryBuilderImpl(endpoint="http://localhost:8090/fluree/query", ledger="test")
+
+    with query.stream() as response:
+        assert next(iter(response.iter_items())) == ITEMS[0]
+
+
+@pytest.mark.asyncio
+async def test_astream_history_items(mocked_api: MockRouter):
+    async with FlureeClient(base_url="http://localhost:8090") as client:
+        async with client.with_ledger("test").history().astream() as response:
+            items = [item async for item in response.aiter_items()]
+
+    assert items == ITEMS
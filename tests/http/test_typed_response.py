@@ -0,0 +1,74 @@
+import gc
+import weakref
+from typing import Generator
+
+import pytest
+import respx
+from httpx import Response
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model
+from respx import MockRouter
+
+from fluree_py import FlureeClient
+from fluree_py.http.adapter import list_adapter
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str = Field(alias="@id")
+    name: str
+    age: int | None = None
+
+
+PEOPLE = [{"@id": "ex:freddy", "name": "Freddy", "age": 4}, {"@id": "ex:alice", "name": "Alice"}]
+
+
+@pytest.fixture
+def mocked_api() -> Generator[MockRouter, None, None]:
+    with respx.mock(base_url="http://localhost:8090") as respx_mock:
+        respx_mock.post("/fluree/query", name="query").return_value = Response(200, json=PEOPLE)
+        yield respx_mock
+
+
+def test_as_models_validates_whole_body(mocked_api: MockRouter):
+    response = FlureeClient(base_url="http://localhost:8090").with_ledger("test").query().commit()
+
+    people = response.as_models(Person)
+
+    assert people == [
+        Person(id="ex:freddy", name="Freddy", age=4),
+        Person(id="ex:alice", name="Alice"),
+    ]
+
+
+def test_as_models_uses_parsed_body(mocked_api: MockRouter):
+    response = FlureeClient(base_url="http://localhost:8090").with_ledger("test").query().commit()
+
+    response.json()
+
+    assert [p.id for p in response.as_models(Person)] == ["ex:freddy", "ex:alice"]
+
+
+def test_as_model_and_validation_errors(mocked_api: MockRouter):
+    mocked_api["query"].return_value = Response(200, json=PEOPLE[0])
+    query = FlureeClient(base_url="http://localhost:8090").with_ledger("test").query()
+
+    assert query.commit().as_model(Person).name == "Freddy"
+    with pytest.raises(ValidationError):
+        query.commit().as_models(Person)
+
+
+def test_list_adapter_is_cached_per_model_and_released():
+    class Child(Person):
+        nickname: str
+
+    assert list_adapter(Person) is list_adapter(Person)
+    assert list_adapter(Child) is not list_adapter(Person)
+
+    dynamic = create_model("Dynamic", name=(str, ...))
+    list_adapter(dynamic)
+    released = weakref.ref(dynamic)
+
+    del dynamic
+    gc.collect()
+    assert released() is None
@@ -0,0 +1,66 @@
+# Compiled Select Cache Tests
+import gc
+import warnings
+import weakref
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from fluree_py.query.select.pydantic import (
+    ListOrderWarning,
+    MissingIdFieldError,
+    from_pydantic,
+)
+
+
+def test_cached_select_is_a_fresh_copy():
+    class NestedModel(BaseModel):
+        id: str
+        name: str
+
+    class Model(BaseModel):
+        id: str
+        nested: NestedModel
+
+    first = from_pydantic(Model)
+    first[1]["nested"].append("mutated")
+
+    assert from_pydantic(Model) == ["*", {"nested": ["*"]}]
+    assert from_pydantic(Model(id="ex:a", nested=NestedModel(id="ex:b", name="b"))) == [
+        "*",
+        {"nested": ["*"]},
+    ]
+
+
+def test_warnings_are_emitted_once_per_model():
+    class Model(BaseModel):
+        id: str
+        entries: list[str]
+
+    with pytest.warns(ListOrderWarning):
+        from_pydantic(Model)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        from_pydantic(Model)
+
+
+def test_errors_are_not_cached():
+    class Model(BaseModel):
+        name: str
+
+    for _ in range(2):
+        with pytest.raises(MissingIdFieldError):
+            from_pydantic(Model)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_dynamic_models_are_released():
+    model = create_model("Dynamic", id=(str, ...), name=(str, ...))
+    from_pydantic(model)
+    released = weakref.ref(model)
+
+    del model
+    gc.collect()
+
+    assert released() is None
@@ -0,0 +1,94 @@
+# Recursive Model and Depth Tests
+import sys
+import warnings
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from fluree_py.query.select.pydantic import FlureeSelectBuilder, from_pydantic
+
+
+@pytest.fixture(scope="class", autouse=True)
+def setup_class():
+    warnings.filterwarnings("ignore")
+    yield
+
+
+class Person(BaseModel):
+    id: str
+    name: str
+    friends: list["Person"]
+
+
+class Address(BaseModel):
+    id: str
+    city: str
+
+
+class Company(BaseModel):
+    id: str
+    office: Address
+    warehouse: Address
+    owner: Person
+
+
+class Mentor(BaseModel):
+    id: str
+    name: str
+    mentees: list["Mentor"]
+    best: "Mentor"
+
+
+def test_recursive_model_stops_at_cycle():
+    assert from_pydantic(Person) == ["*", {"friends": ["*"]}]
+    assert from_pydantic(Person, projection="explicit") == [
+        "@id",
+        "name",
+        {"friends": ["@id", "name", "friends"]},
+    ]
+    assert from_pydantic(Company) == [
+        "*",
+        {"office": ["*"]},
+        {"warehouse": ["*"]},
+        {"owner": ["*", {"friends": ["*"]}]},
+    ]
+
+
+def test_cycle_leaf_selects_nested_predicates():
+    assert from_pydantic(Mentor) == ["*", {"mentees": ["*"]}, {"best": ["*"]}]
+    assert from_pydantic(Mentor, projection="explicit") == [
+        "@id",
+        "name",
+        {"mentees": ["@id", "name", "mentees", "best"]},
+        {"best": ["@id", "name", "mentees", "best"]},
+    ]
+
+
+def test_max_depth_unrolls_recursive_models():
+    assert from_pydantic(Person, max_depth=2) == [
+        "*",
+        {"friends": ["*", {"friends": ["*"]}]},
+    ]
+    assert from_pydantic(Person, projection="explicit", max_depth=1) == [
+        "@id",
+        "name",
+        {"friends": ["@id", "name", "friends"]},
+    ]
+    assert from_pydantic(Company, max_depth=0) == ["*"]
+
+
+def test_deep_model_chain_does_not_recurse():
+    depth = sys.getrecursionlimit() + 100
+    model = create_model("Level0", id=(str, ...), name=(str, ...))
+    for level in range(1, depth):
+        model = create_model(f"Level{level}", id=(str, ...), child=(model, ...))
+
+    for select in (FlureeSelectBuilder().build(model), from_pydantic(model)):
+        for _ in range(depth - 2):
+            select = select[1]["child"]
+        assert select == ["*", {"child": ["*"]}]
+
+
+def test_negative_max_depth_is_rejected():
+    with pytest.raises(ValueError):
+        from_pydantic(Person, max_depth=-1)
@@ -0,0 +1,73 @@
+# Explicit Projection Tests
+import warnings
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from fluree_py.query.select.pydantic import FlureeSelectBuilder, from_pydantic
+
+
+@pytest.fixture(scope="class", autouse=True)
+def setup_class():
+    warnings.filterwarnings("ignore")
+    yield
+
+
+def test_explicit_projection_lists_declared_fields():
+    class NestedModel(BaseModel):
+        id: str
+        name: str
+
+    class OtherModel(BaseModel):
+        id: str
+        label: str
+
+    class Model(BaseModel):
+        id: str
+        name: str = Field(alias="schema:name")
+        tags: list[str]
+        nested: NestedModel
+        others: list[OtherModel]
+        meta: dict[str, str]
+
+    assert from_pydantic(Model, projection="explicit") == [
+        "@id",
+        "schema:name",
+        "tags",
+        {"nested": ["@id", "name"]},
+        {"others": ["@id", "label"]},
+        {"meta": ["*"]},
+    ]
+    assert from_pydantic(Model) == [
+        "*",
+        {"nested": ["*"]},
+        {"others": ["*"]},
+        {"meta": ["*"]},
+    ]
+
+
+def test_explicit_projection_keeps_wildcard_for_extra_allow():
+    class NestedModel(BaseModel):
+        name: str
+        model_config = ConfigDict(extra="allow")
+
+    class Model(BaseModel):
+        id: str
+        age: int | None = None
+        nested: NestedModel
+
+    assert from_pydantic(Model, projection="explicit") == [
+        "@id",
+        "age",
+        {"nested": ["*"]},
+    ]
+
+
+def test_explicit_projection_is_cached_separately():
+    class Model(BaseModel):
+        id: str
+        name: str
+
+    assert from_pydantic(Model, projection="explicit") == ["@id", "name"]
+    assert from_pydantic(Model) == ["*"]
+    assert FlureeSelectBuilder(projection="explicit").build(Model) == ["@id", "name"]